@@ -1,79 +1,86 @@
+from __future__ import annotations
+
 from pathlib import Path
-from datetime import datetime
 import csv
-import pytz
+
+from ics_parser import read_events
+from source_manifest import SourceManifest, code_hash, file_hash
 
 # Ordner und Dateien
 csv_dir = Path("csv_Baskets")
 ics_file = csv_dir / "Baskets_2526.ics"
 csv_file = csv_dir / "Baskets_2526_Heimspiele.csv"
 
-# Zeitzone
-berlin = pytz.timezone("Europe/Berlin")
-
-# Prüfen, ob ICS-Datei existiert
-if not ics_file.exists():
-    print(f"❌ ICS-Datei nicht gefunden: {ics_file}")
-    exit(1)
+PREFIX = "ProA Spiel Uni Baskets Münster vs "
 
-# ICS-Inhalt lesen
-with ics_file.open(encoding="utf-8") as f:
-    content = f.read()
+# Code der Extraktion: Änderungen erzeugen die CSV auch bei unverändertem ICS neu
+EXTRACTOR_CODE = code_hash([Path(__file__), Path(__file__).with_name("ics_parser.py")])
 
-# Events extrahieren
-events = content.split("BEGIN:VEVENT")[1:]
-print(f"📅 Anzahl aller Events: {len(events)}")
 
-heimspiele = []
+def extract_heimspiele(ics_file: Path = ics_file, csv_file: Path = csv_file) -> bool:
+    """Schreibt die Heimspiele der Uni Baskets als CSV.
 
-for event in events:
-    lines = event.strip().splitlines()
+    Gibt ``False`` zurück, wenn ICS und Extraktionscode unverändert sind und
+    die vorhandene CSV weiterverwendet wird. Fehlt das ICS, wird
+    ``FileNotFoundError`` ausgelöst.
+    """
 
-    # SUMMARY lesen
-    summary_line = next((line for line in lines if line.startswith("SUMMARY:")), None)
-    if not summary_line:
-        continue
+    # Prüfen, ob ICS-Datei existiert
+    if not ics_file.exists():
+        raise FileNotFoundError(f"ICS-Datei nicht gefunden: {ics_file}")
 
-    summary = summary_line.replace("SUMMARY:", "").strip()
+    # Unverändertes ICS: vorhandene CSV weiterverwenden
+    manifest = SourceManifest()
+    ics_hash = file_hash(ics_file)
+    if csv_file.exists() and manifest.is_current(f"ics:{ics_file.name}", ics_hash, csv=csv_file.name, code=EXTRACTOR_CODE):
+        print(f"⏭️ ICS unverändert, {csv_file.name} bleibt bestehen")
+        return False
 
-    # Nur Heimspiele
-    if not summary.startswith("ProA Spiel Uni Baskets Münster vs "):
-        continue
+    heimspiele = []
+    anzahl = 0
 
-    gegner = summary.replace("ProA Spiel Uni Baskets Münster vs ", "").strip()
+    for event in read_events(ics_file):
+        anzahl += 1
 
-    # DTSTART lesen (mit oder ohne Sekunden)
-    dtstart_line = next((line for line in lines if line.startswith("DTSTART")), None)
-    if not dtstart_line:
-        continue
+        # Nur Heimspiele
+        if not event.summary.startswith(PREFIX):
+            continue
 
-    dt_str = dtstart_line.split(":")[1].strip()
+        gegner = event.summary[len(PREFIX):].strip()
 
-    try:
-        if len(dt_str) == 15:  # YYYYMMDDTHHMMSS
-            dt = datetime.strptime(dt_str, "%Y%m%dT%H%M%S")
-        else:                  # YYYYMMDDTHHMM
-            dt = datetime.strptime(dt_str, "%Y%m%dT%H%M")
-
-        dt = berlin.localize(dt)
+        if event.dtstart is None:
+            continue
 
-        # 🔴 DAS WAR DER FEHLENDE TEIL
         heimspiele.append((
-            dt.strftime("%d.%m.%Y"),
-            dt.strftime("%H:%M"),
+            event.dtstart.strftime("%d.%m.%Y"),
+            event.dtstart.strftime("%H:%M"),
             gegner
         ))
 
-    except Exception as e:
-        print(f"⚠️ Fehler beim Datum '{dt_str}': {e}")
-        continue
+    print(f"📅 Anzahl aller Events: {anzahl}")
+
+    # CSV schreiben
+    with csv_file.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Datum", "Startzeit", "Gegner"])
+        writer.writerows(heimspiele)
+
+    # Ergebnis
+    print(f"✅ Heimspiele gefunden: {len(heimspiele)}")
+    print(f"💾 CSV geschrieben: {csv_file}")
+
+    manifest.update(f"ics:{ics_file.name}", ics_hash, csv=csv_file.name, code=EXTRACTOR_CODE)
+    manifest.save()
+    return True
+
+
+def main() -> None:
+    try:
+        extract_heimspiele()
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
 
-# CSV schreiben
-with csv_file.open("w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-    writer.writerow(["Datum", "Startzeit", "Gegner"])
-    writer.writerows(heimspiele)
 
-# Ergebnis
-print(f"✅ Heimspiele gefunden: {len(heimspiele)}")
-print(f"💾 CSV geschrieben: {csv_file}")
+if __name__ == "__main__":
+    main()
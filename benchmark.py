@@ -0,0 +1,431 @@
+"""Benchmarks für Einlesen, Normalisierung und Ausgabe der Spielpläne.
+
+Jeder Fall misst eine Stufe für sich: Die Eingaben werden vorab (ohne
+Zeitmessung) erzeugt, gemessen wird nur der Aufruf der jeweiligen Funktion.
+Je Fall stehen Laufzeit (bester von ``--repeat`` Läufen), Spitzenbedarf an
+Speicher (``tracemalloc``, eigener Lauf) und verarbeitete Zeilen pro Sekunde
+in der Ausgabe.
+
+Datensätze sind die eingecheckten Exporte aus ``csvdata/`` und vergrößerte
+Fassungen davon (``--scale``): Jede Datei wird ``n``-mal aneinandergehängt,
+jede Kopie um 52 Wochen verschoben (gleiche Wochentage, neue Daten und
+Wochen). ``--synthetic`` erzeugt stattdessen Datensätze mit ``synthetic_sources.py``
+(Anzahl Ligen je Datensatz, z. B. ``--synthetic 100,500``). Alles läuft offline in einem temporären Verzeichnis; ``docs/``
+bleibt unverändert.
+
+Ergebnisse lassen sich als Baseline speichern und bei späteren Läufen
+vergleichen, z. B. vor und nach einer Änderung::
+
+    python benchmark.py --save-baseline        # Stand vor der Änderung
+    python benchmark.py                        # danach: Vergleich mit der Baseline
+    python benchmark.py --scale 1,10,50 --repeat 5 --cases read,normalize
+    python benchmark.py --synthetic 300 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import re
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+import spielplan_lite
+from generate_csv import write_csv
+from spielplan_frame import FrameTable
+from spielplan_html import APP, INDEX, stand_now, write_pages
+from spielplan_shards import write_shards
+from synthetic_sources import SyntheticConfig, generate
+from team_config import TEAM_SOURCES_PATH, get_csv_files
+from usc_games import (
+    CSV_DIR,
+    finalize_games,
+    format_results,
+    normalize_source,
+    read_csv_clean,
+    replace_usc_names_column,
+    usc_mask,
+)
+from usc_rules import NAME_COLUMNS, RENAME_MAP, _normalize_text, get_usc_team
+from usc_spielplan import site_games
+from usc_spielplan_ics import build_events, render_ics
+
+BASELINE_PATH = Path(".cache/benchmark_baseline.json")
+SCALES = (1, 10)
+REPEAT = 5
+# Langsamer als die Baseline um mehr als diesen Anteil gilt als Verschlechterung
+TOLERANCE = 0.20
+
+_DATUM = re.compile(rb"\b(\d{2})\.(\d{2})\.(\d{4})\b")
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str
+    csv_dir: Path
+    config_path: Path = TEAM_SOURCES_PATH
+
+
+def _shift_dates(line: bytes, days: int) -> bytes:
+    def shift(m: re.Match) -> bytes:
+        try:
+            day = date(int(m.group(3)), int(m.group(2)), int(m.group(1)))
+        except ValueError:
+            return m.group(0)
+        return (day + timedelta(days=days)).strftime("%d.%m.%Y").encode("ascii")
+
+    return _DATUM.sub(shift, line)
+
+
+def scaled_dataset(factor: int, work_dir: Path, source: Dataset) -> Dataset:
+    """Schreibt jede Quelle ``factor``-mal hintereinander (Kopie ``k`` um ``k`` × 52 Wochen verschoben)."""
+
+    if factor == 1:
+        return source
+    target = work_dir / f"x{factor}"
+    target.mkdir(parents=True, exist_ok=True)
+    for file, _ in get_csv_files(source.config_path):
+        path = source.csv_dir / file
+        if not path.exists():
+            continue
+        # Bytes bleiben bytes: die Kodierung (Windows-1252/UTF-8) der Quelle bleibt erhalten
+        header, *rows = path.read_bytes().splitlines(keepends=True)
+        body = [_shift_dates(row, 364 * k) if k else row for k in range(factor) for row in rows]
+        (target / file).write_bytes(header + b"".join(body))
+    return Dataset(f"x{factor}", target, source.config_path)
+
+
+def synthetic_dataset(leagues: int, work_dir: Path) -> Dataset:
+    """Erzeugt ``leagues`` synthetische Ligen (fester Startwert) samt passender ``team_sources.csv``."""
+
+    target = work_dir / f"synth{leagues}"
+    generate(target, SyntheticConfig(leagues=leagues))
+    return Dataset(f"synth{leagues}", target / "csvdata", target / "config" / "team_sources.csv")
+
+
+class Inputs:
+    """Zwischenstände eines Datensatzes; jede Stufe wird nur einmal (ungemessen) erzeugt."""
+
+    def __init__(self, dataset: Dataset, work_dir: Path) -> None:
+        self.dataset = dataset
+        self.work_dir = work_dir
+        self.files = [
+            (self.dataset.csv_dir / file, file, team)
+            for file, team in get_csv_files(dataset.config_path)
+            if (self.dataset.csv_dir / file).exists()
+        ]
+        self.now_epoch = int(time.time())
+        self.stand = stand_now()
+
+    @cached_property
+    def raw(self) -> list[pd.DataFrame]:
+        return [read_csv_clean(path) for path, _, _ in self.files]
+
+    @cached_property
+    def renamed(self) -> list[pd.DataFrame]:
+        return [df.rename(columns=RENAME_MAP) for df in self.raw]
+
+    @cached_property
+    def filtered(self) -> list[pd.DataFrame]:
+        """USC-Zeilen mit ``USC_Team``, wie in ``normalize_source`` vor dem Namensersetzen."""
+
+        frames = []
+        for df, (_, file, team) in zip(self.renamed, self.files):
+            df = df[usc_mask(df)].copy()
+            for col in NAME_COLUMNS:
+                if col not in df.columns:
+                    df[col] = ""
+            df["USC_Team"] = df.apply(lambda row: get_usc_team(row, file, team), axis=1)
+            frames.append(df)
+        return frames
+
+    @cached_property
+    def normalized(self) -> list[pd.DataFrame]:
+        frames = (normalize_source(df, file, team) for df, (_, file, team) in zip(self.raw, self.files))
+        return [df for df in frames if df is not None]
+
+    @cached_property
+    def games(self) -> pd.DataFrame:
+        return finalize_games(self.normalized)
+
+    @cached_property
+    def records(self) -> list[dict]:
+        return self.games.to_dict("records")
+
+    @property
+    def raw_rows(self) -> int:
+        return sum(len(df) for df in self.raw)
+
+    @property
+    def docs_dir(self) -> Path:
+        path = self.work_dir / f"docs-{self.dataset.name}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+def bench_read(inputs: Inputs) -> int:
+    return sum(len(read_csv_clean(path)) for path, _, _ in inputs.files)
+
+
+def bench_usc_filter(inputs: Inputs) -> int:
+    return sum(len(usc_mask(df)) for df in inputs.renamed)
+
+
+def bench_usc_team(inputs: Inputs) -> int:
+    rows = 0
+    for df, (_, file, team) in zip(inputs.filtered, inputs.files):
+        df.apply(lambda row: get_usc_team(row, file, team), axis=1)
+        rows += len(df)
+    return rows
+
+
+def bench_names(inputs: Inputs) -> int:
+    rows = 0
+    for df in inputs.filtered:
+        for col in NAME_COLUMNS:
+            replace_usc_names_column(df[col], df["USC_Team"])
+        rows += len(df)
+    return rows
+
+
+def bench_results(inputs: Inputs) -> int:
+    return sum(len(format_results(df)) for df in inputs.filtered)
+
+
+def bench_normalize(inputs: Inputs) -> int:
+    for df, (_, file, team) in zip(inputs.raw, inputs.files):
+        normalize_source(df, file, team)
+    return inputs.raw_rows
+
+
+def bench_finalize(inputs: Inputs) -> int:
+    return len(finalize_games(inputs.normalized))
+
+
+def bench_html(inputs: Inputs) -> int:
+    table = write_pages(FrameTable(site_games(inputs.games, inputs.now_epoch)), [INDEX, APP], inputs.stand, inputs.docs_dir)
+    write_shards(table, inputs.stand, inputs.docs_dir)
+    return len(table)
+
+
+def bench_csv(inputs: Inputs) -> int:
+    write_csv(inputs.games, inputs.docs_dir / "spielplan.csv")
+    return len(inputs.games)
+
+
+def bench_ics(inputs: Inputs) -> int:
+    events = build_events(inputs.records)
+    for event in events:
+        event["DTSTAMP"], event["SEQUENCE"] = "20260101T000000Z", "0"
+    render_ics(events)
+    return len(events)
+
+
+def bench_lite(inputs: Inputs) -> int:
+    spielplan_lite.load_games(inputs.dataset.csv_dir, inputs.dataset.config_path)
+    return inputs.raw_rows
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    description: str
+    run: Callable[[Inputs], int]
+    # Zwischenstände, die vor der Messung erzeugt werden
+    prepare: tuple[str, ...] = ()
+
+
+CASES = [
+    Case("read", "read_csv_clean: Kodierung, C-Parser, Spalten bereinigen", bench_read),
+    Case("usc_filter", "usc_mask: USC-Beteiligung über alle Suchspalten", bench_usc_filter, ("renamed",)),
+    Case("usc_team", "get_usc_team je USC-Zeile", bench_usc_team, ("filtered",)),
+    Case("names", "replace_usc_names_column für alle Namensspalten", bench_names, ("filtered",)),
+    Case("results", "format_results: Ergebnis mit Satzdetails", bench_results, ("filtered",)),
+    Case("normalize", "normalize_source je Liga (Filter, Teams, Namen, Ergebnis)", bench_normalize, ("raw",)),
+    Case("finalize", "finalize_games: Kalender-Spalten, Sortierung", bench_finalize, ("normalized",)),
+    Case("html", "index.html, indexapp.html und Auszüge rendern", bench_html, ("games",)),
+    Case("csv", "spielplan.csv schreiben", bench_csv, ("games",)),
+    Case("ics", "Termine bauen und Gesamtkalender rendern", bench_ics, ("records",)),
+    Case("lite", "spielplan_lite.load_games: Einlesen bis Gesamtdatensatz ohne pandas", bench_lite, ("raw",)),
+]
+CASE_NAMES = [case.name for case in CASES]
+
+
+def _reset_caches() -> None:
+    # Zwischengespeicherte Normalisierungen würden ab dem zweiten Lauf alles verfälschen
+    _normalize_text.cache_clear()
+    gc.collect()
+
+
+def measure(case: Case, inputs: Inputs, repeat: int = REPEAT) -> dict[str, Any]:
+    """Beste Laufzeit aus ``repeat`` Läufen und Spitzenbedarf in einem eigenen Lauf.
+
+    Das Minimum schwankt am wenigsten mit der Last des Rechners (wie bei ``timeit``).
+    """
+
+    for name in case.prepare:
+        getattr(inputs, name)
+    # Aufwärmen: Importe, kompilierte Ausdrücke und Dateicache zählen nicht mit
+    with contextlib.redirect_stdout(io.StringIO()):
+        case.run(inputs)
+
+    times = []
+    rows = 0
+    for _ in range(repeat):
+        _reset_caches()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rows = case.run(inputs)
+            times.append(time.perf_counter() - start)
+
+    # tracemalloc bremst deutlich, deshalb getrennt von der Zeitmessung
+    _reset_caches()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            case.run(inputs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    seconds = min(times)
+    return {
+        "seconds": seconds,
+        "rows": rows,
+        "rows_per_second": rows / seconds if seconds > 0 else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "datum": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"⚠️ Baseline unlesbar, Vergleich entfällt: {path}")
+        return None
+
+
+def _delta(current: float, before: float | None, tolerance: float) -> str:
+    if not before:
+        return ""
+    change = current / before - 1
+    marker = "⚠️" if change > tolerance else ("🚀" if change < -tolerance else "  ")
+    return f"{marker} {change:+6.0%}"
+
+
+def print_results(
+    dataset: str,
+    results: dict[str, dict],
+    baseline: dict[str, Any] | None,
+    tolerance: float = TOLERANCE,
+) -> list[str]:
+    """Gibt die Tabelle eines Datensatzes aus; liefert die Fälle, die langsamer als die Baseline sind."""
+
+    before = (baseline or {}).get("results", {}).get(dataset, {})
+    print(f"{'Fall':<11} {'Zeit ms':>9} {'Zeilen':>8} {'Zeilen/s':>11} {'Peak MiB':>9} {'Baseline ms':>12}  Δ")
+    slower = []
+    for name, r in results.items():
+        old = before.get(name, {}).get("seconds")
+        base = f"{old * 1000:12.1f}" if old else f"{'-':>12}"
+        print(
+            f"{name:<11} {r['seconds'] * 1000:9.1f} {r['rows']:8d} {r['rows_per_second']:11,.0f} "
+            f"{r['peak_bytes'] / 2**20:9.1f} {base}  {_delta(r['seconds'], old, tolerance)}"
+        )
+        if old and r["seconds"] > old * (1 + tolerance):
+            slower.append(f"{dataset}/{name}")
+    return slower
+
+
+def _names(value: str | None) -> list[str] | None:
+    return [name.strip() for name in value.split(",") if name.strip()] if value else None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks der Spielplan-Pipeline (offline)")
+    parser.add_argument("--cases", help=f"nur diese Fälle (kommagetrennt: {', '.join(CASE_NAMES)})")
+    parser.add_argument("--scale", help="Vergrößerungsfaktoren (Standard 1,10, mit --synthetic keine)")
+    parser.add_argument("--synthetic", help="synthetische Datensätze mit so vielen Ligen (kommagetrennt)")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help=f"Läufe je Fall (Standard {REPEAT})")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline-Datei")
+    parser.add_argument("--save-baseline", action="store_true", help="Ergebnisse als neue Baseline speichern")
+    parser.add_argument("--json", type=Path, help="Ergebnisse zusätzlich als JSON schreiben")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help=f"erlaubte Verlangsamung (Standard {TOLERANCE})")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit-Code 1, wenn ein Fall langsamer ist")
+    args = parser.parse_args(argv)
+
+    selected = _names(args.cases) or CASE_NAMES
+    unknown = sorted(set(selected) - set(CASE_NAMES))
+    if unknown:
+        parser.error(f"Unbekannte Fälle: {', '.join(unknown)} (verfügbar: {', '.join(CASE_NAMES)})")
+    if args.scale is None and not args.synthetic:
+        args.scale = ",".join(map(str, SCALES))
+    try:
+        scales = [int(value) for value in _names(args.scale) or []]
+        synthetic = [int(value) for value in _names(args.synthetic) or []]
+    except ValueError:
+        parser.error(f"Ungültige Faktoren oder Ligenzahlen: {args.scale or ''} {args.synthetic or ''}")
+    if not scales + synthetic or min(scales + synthetic) < 1 or args.repeat < 1:
+        parser.error("Faktoren, Ligenzahlen und --repeat müssen mindestens 1 sein")
+
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline:
+        meta = baseline.get("meta", {})
+        print(f"📏 Baseline vom {meta.get('datum', '?')} (Python {meta.get('python', '?')}, pandas {meta.get('pandas', '?')})")
+
+    results: dict[str, dict[str, dict]] = {}
+    slower: list[str] = []
+    with tempfile.TemporaryDirectory(prefix="spielplan-bench-") as tmp:
+        work_dir = Path(tmp)
+        datasets = [scaled_dataset(factor, work_dir, Dataset("csvdata", CSV_DIR)) for factor in scales]
+        with contextlib.redirect_stdout(io.StringIO()):
+            datasets += [synthetic_dataset(leagues, work_dir) for leagues in synthetic]
+        for dataset in datasets:
+            inputs = Inputs(dataset, work_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                rows = inputs.raw_rows
+            print(f"\n📊 {dataset.name}: {len(inputs.files)} Dateien, {rows} Zeilen")
+            results[dataset.name] = {
+                case.name: measure(case, inputs, args.repeat) for case in CASES if case.name in selected
+            }
+            slower += print_results(dataset.name, results[dataset.name], baseline, args.tolerance)
+
+    report = {"meta": environment(), "results": results}
+    print(f"\n🧠 Max. RSS des Prozesses: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"💾 Baseline gespeichert: {args.baseline}")
+    elif slower:
+        print(f"⚠️ Langsamer als Baseline (> {args.tolerance:.0%}): {', '.join(slower)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
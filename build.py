@@ -0,0 +1,445 @@
+"""Gesamter Build in einem Prozess: Quellen laden, aufbereiten, Seiten und Kalender erzeugen.
+
+Die Stufen entsprechen den bisherigen Einzelskripten und laufen im selben
+Interpreter. Jede Stufe nennt ihre Eingaben und Ausgaben als Dateimuster;
+daraus ergeben sich die Abhängigkeiten (eine Stufe wartet auf alle Stufen,
+die eine ihrer Eingaben schreiben). Stufen, deren Abhängigkeiten erfüllt
+sind, laufen parallel in einem Thread-Pool.
+
+Nach jedem erfolgreichen Lauf merkt sich ``.cache/stages.json`` einen Hash
+über die Eingaben der Stufe (samt Python-Code und Konfiguration). Sind sie
+beim nächsten Mal unverändert und die Ausgaben vorhanden, wird die Stufe
+übersprungen. Darin steckt auch ``usc_games.NORMALIZE_CODE``, derselbe
+Code-Hash, mit dem ``load_games`` seine Cache-Dateien schlüsselt: Läuft eine
+Stufe wegen einer Änderung an der Normalisierung erneut, bekommt sie nie den
+alten Datensatz aus ``.cache/``.
+
+Schlägt eine Stufe fehl, laufen unabhängige Stufen weiter; nur die von ihr
+abhängigen entfallen. Der Zustand wird in jedem Fall gespeichert, damit
+erfolgreiche Stufen beim nächsten Lauf übersprungen werden können.
+
+Der normalisierte Datensatz und die externen Heimspiele werden nur einmal
+geladen und im :class:`BuildContext` an alle Stufen weitergereicht. Am Ende
+steht die Laufzeit je Stufe und der kritische Pfad.
+
+Aufruf::
+
+    python build.py                          # alle Stufen
+    python build.py --stages trainer,web     # nur ausgewählte Stufen
+    python build.py --skip download,icons    # alle außer den genannten
+    python build.py --force                  # nichts überspringen
+    python build.py --jobs 1                 # nacheinander
+    python build.py --list                   # Stufen und Abhängigkeiten anzeigen
+
+Die Einzelskripte bleiben mit ``python <skript>.py`` lauffähig.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+import baskets_csv
+import preussen_csv
+from generate_csv import write_csv
+from icon_assets import build_icons, check_budgets
+from publish_docs import print_report, publish
+from source_downloader import BASE_URL_ENV, CSV_DIR, ics_sources, sync_sources, volleyball_sources
+from source_manifest import SourceManifest, file_hash
+from spielplan_html import stand_now
+from usc_baskets_preussen import write_trainer_page
+from usc_games import NORMALIZE_CODE, load_external_games, load_games
+from usc_spielplan import write_site
+from usc_spielplan_ics import write_calendars
+
+STATE_PATH = Path(".cache/stages.json")
+JOBS = 4
+
+# Eingaben jeder Stufe: Code und Konfiguration
+CODE_INPUTS = ("*.py", "config/*.csv")
+SAMS_INPUTS = ("csvdata/*.csv",)
+
+
+class BuildError(Exception):
+    """Eine Stufe ist fehlgeschlagen; der Build bricht ab."""
+
+
+@dataclass
+class BuildContext:
+    """Zwischen den Stufen geteilte Daten; Datensätze werden erst bei Bedarf geladen.
+
+    Laufen mehrere Stufen gleichzeitig, lädt nur die erste den Datensatz; die
+    übrigen warten darauf.
+    """
+
+    stand: str = field(default_factory=stand_now)
+    _data: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _locks: dict[str, threading.Lock] = field(
+        default_factory=lambda: {"games": threading.Lock(), "external": threading.Lock()},
+        init=False,
+        repr=False,
+    )
+
+    def _load(self, name: str, loader: Callable[[], Any]) -> Any:
+        with self._locks[name]:
+            if name not in self._data:
+                self._data[name] = loader()
+            return self._data[name]
+
+    @property
+    def games(self) -> pd.DataFrame:
+        return self._load("games", load_games)
+
+    @property
+    def external(self) -> pd.DataFrame:
+        return self._load("external", load_external_games)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    description: str
+    run: Callable[[BuildContext], None]
+    # Dateimuster relativ zum Repository (``**`` für Unterverzeichnisse)
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    # False: läuft immer (z. B. Downloads, deren Eingaben im Netz liegen)
+    cached: bool = True
+    # Ergebnis hängt vom Tag ab (vergangene Spiele fallen heraus): spätestens täglich neu
+    daily: bool = False
+
+
+@dataclass(frozen=True)
+class StageRun:
+    """Zeitpunkte relativ zum Build-Start in Sekunden."""
+
+    name: str
+    start: float
+    end: float
+    skipped: bool = False
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+def stage_download(ctx: BuildContext) -> None:
+    base_url = os.environ.get(BASE_URL_ENV) or None
+    if not sync_sources(ics_sources(base_url) + volleyball_sources(base_url), stale=[(CSV_DIR, "*.csv")]):
+        raise BuildError("Pflichtquellen konnten nicht geladen werden")
+
+
+def stage_extern(ctx: BuildContext) -> None:
+    baskets_csv.extract_heimspiele()
+    preussen_csv.extract_heimspiele()
+
+
+def stage_csv(ctx: BuildContext) -> None:
+    write_csv(ctx.games)
+
+
+def stage_trainer(ctx: BuildContext) -> None:
+    write_trainer_page(ctx.games, ctx.external, ctx.stand)
+
+
+def stage_web(ctx: BuildContext) -> None:
+    write_site(ctx.games, ctx.stand)
+
+
+def stage_ics(ctx: BuildContext) -> None:
+    write_calendars(ctx.games.to_dict("records"))
+
+
+def stage_icons(ctx: BuildContext) -> None:
+    if not check_budgets(build_icons()):
+        raise BuildError("Icon über Byte-Budget")
+
+
+def stage_publish(ctx: BuildContext) -> None:
+    print_report(publish())
+
+
+STAGES = [
+    Stage(
+        "download", "ICS- und Volleyball-CSV-Quellen laden", stage_download,
+        inputs=("config/*.csv",), outputs=("csv_Baskets/*.ics", "csvdata/*.csv"), cached=False,
+    ),
+    Stage(
+        "extern", "Baskets- und Preußen-Heimspiele aus ICS extrahieren", stage_extern,
+        inputs=("csv_Baskets/*.ics",), outputs=("csv_Baskets/*_Heimspiele.csv",),
+    ),
+    Stage(
+        "csv", "docs/spielplan.csv", stage_csv,
+        inputs=SAMS_INPUTS, outputs=("docs/spielplan.csv",),
+    ),
+    Stage(
+        "trainer", "docs/index_trainer.html", stage_trainer,
+        inputs=SAMS_INPUTS + ("csv_Baskets/*_Heimspiele.csv",), outputs=("docs/index_trainer.html",), daily=True,
+    ),
+    Stage(
+        "web", "docs/index.html, indexapp.html und Auszüge", stage_web,
+        inputs=SAMS_INPUTS, outputs=("docs/index.html", "docs/indexapp.html", "docs/shards/*"), daily=True,
+    ),
+    Stage(
+        "ics", "docs/usc_spielplan.ics und Einzel-Feeds", stage_ics,
+        inputs=SAMS_INPUTS, outputs=("docs/usc_spielplan.ics", "docs/ics/*"),
+    ),
+    Stage(
+        "icons", "Favicons und App-Icons", stage_icons,
+        inputs=("assets/icon-source.png",),
+        outputs=("docs/favicon*.png", "docs/icon-*.png", "docs/manifest.webmanifest"),
+    ),
+    Stage(
+        "publish", "Minifizieren, Service Worker, Größen", stage_publish,
+        inputs=("docs/**",), outputs=("docs/service-worker.js",),
+    ),
+]
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+
+def select_stages(only: list[str] | None = None, skip: list[str] | None = None) -> list[Stage]:
+    """Stufen in fester Reihenfolge, eingeschränkt auf ``only`` bzw. ohne ``skip``."""
+
+    unknown = sorted((set(only or []) | set(skip or [])) - set(STAGE_NAMES))
+    if unknown:
+        raise ValueError(f"Unbekannte Stufe(n): {', '.join(unknown)} (verfügbar: {', '.join(STAGE_NAMES)})")
+    return [s for s in STAGES if (not only or s.name in only) and s.name not in (skip or [])]
+
+
+def _overlaps(pattern: str, other: str) -> bool:
+    return fnmatchcase(pattern, other) or fnmatchcase(other, pattern)
+
+
+def stage_dependencies(stages: list[Stage]) -> dict[str, list[str]]:
+    """Je Stufe die Stufen, die eine ihrer Eingaben schreiben (nur innerhalb von ``stages``).
+
+    Löst ``ValueError`` aus, wenn die Abhängigkeiten einen Zyklus bilden.
+    """
+
+    deps = {
+        stage.name: [
+            other.name
+            for other in stages
+            if other is not stage and any(_overlaps(i, o) for i in stage.inputs for o in other.outputs)
+        ]
+        for stage in stages
+    }
+
+    done: set[str] = set()
+    remaining = dict(deps)
+    while remaining:
+        ready = [name for name, before in remaining.items() if done.issuperset(before)]
+        if not ready:
+            raise ValueError(f"Zyklische Abhängigkeiten zwischen: {', '.join(remaining)}")
+        for name in ready:
+            done.add(name)
+            del remaining[name]
+    return deps
+
+
+def _files(patterns: tuple[str, ...]) -> list[str]:
+    matches = {path for pattern in patterns for path in glob.glob(pattern, recursive=True)}
+    return sorted(path for path in matches if os.path.isfile(path))
+
+
+def fingerprint(stage: Stage) -> str:
+    """Hash über Namen und Inhalte aller Eingabedateien der Stufe (inklusive Code).
+
+    Beginnt mit dem Code-Hash des Datensatz-Caches (``NORMALIZE_CODE``), damit
+    Stufen- und Daten-Cache immer gemeinsam ungültig werden.
+    """
+
+    digest = hashlib.sha256(f"normalisierung;{NORMALIZE_CODE}\n".encode())
+    for path in _files(stage.inputs + CODE_INPUTS):
+        digest.update(f"{Path(path).as_posix()};{file_hash(Path(path))}\n".encode())
+    return digest.hexdigest()
+
+
+def outputs_exist(stage: Stage) -> bool:
+    return all(_files((pattern,)) for pattern in stage.outputs)
+
+
+def _execute(stage: Stage, ctx: BuildContext, state: SourceManifest, force: bool, origin: float) -> StageRun:
+    """Führt eine Stufe aus; jeder Fehler wird zum :class:`BuildError` dieser Stufe."""
+
+    try:
+        return _run_stage(stage, ctx, state, force, origin)
+    except Exception as e:
+        # Auch Programmfehler (KeyError, ValueError, ...) betreffen nur diese Stufe
+        detail = str(e) if isinstance(e, BuildError) else f"{type(e).__name__}: {e}"
+        raise BuildError(f"Stufe '{stage.name}' fehlgeschlagen: {detail}") from e
+
+
+def _run_stage(stage: Stage, ctx: BuildContext, state: SourceManifest, force: bool, origin: float) -> StageRun:
+    start = time.perf_counter() - origin
+    # Tagesabhängige Stufen: Datum aus dem Stand (Berliner Zeit) als Teil des Schlüssels
+    meta = {"tag": ctx.stand[:10]} if stage.daily else {}
+
+    if stage.cached and not force and outputs_exist(stage) and state.is_current(stage.name, fingerprint(stage), **meta):
+        print(f"⏭️ {stage.name}: Eingaben unverändert, übersprungen")
+        return StageRun(stage.name, start, time.perf_counter() - origin, skipped=True)
+
+    print(f"▶️ {stage.name}: {stage.description}")
+    stage.run(ctx)
+    # Schutz gegen Generatoren, die Fehler nur melden statt sie auszulösen
+    missing = [pattern for pattern in stage.outputs if not _files((pattern,))]
+    if missing:
+        raise BuildError(f"Ausgaben fehlen nach dem Lauf: {', '.join(missing)}")
+    if stage.cached:
+        # Nach dem Lauf: ``publish`` verändert seine eigenen Eingaben (Minifizieren)
+        state.update(stage.name, fingerprint(stage), **meta)
+    return StageRun(stage.name, start, time.perf_counter() - origin)
+
+
+def _omit_dependents(pending: list[Stage], deps: dict[str, list[str]], failed: set[str], omitted: list[str]) -> None:
+    """Entfernt aus ``pending`` alle Stufen, die (auch indirekt) von einer fehlgeschlagenen abhängen."""
+
+    blocked = failed.union(omitted)
+    changed = True
+    while changed:
+        changed = False
+        for stage in [s for s in pending if blocked.intersection(deps[s.name])]:
+            pending.remove(stage)
+            blocked.add(stage.name)
+            omitted.append(stage.name)
+            changed = True
+            print(f"⏭️ {stage.name}: entfällt, weil {', '.join(sorted(blocked.intersection(deps[stage.name])))} fehlt")
+
+
+def run_stages(
+    stages: list[Stage],
+    ctx: BuildContext | None = None,
+    jobs: int = JOBS,
+    force: bool = False,
+    state_path: Path = STATE_PATH,
+) -> list[StageRun]:
+    """Führt ``stages`` nach ihren Abhängigkeiten aus, bis zu ``jobs`` gleichzeitig.
+
+    Schlägt eine Stufe fehl, entfallen alle Stufen, die (auch indirekt) von
+    ihr abhängen; die übrigen laufen zu Ende. Danach folgt ein
+    :class:`BuildError` mit allen Fehlern. Der Zustand der erfolgreichen Stufen
+    wird vorher gespeichert. Die Ergebnisse stehen in der Reihenfolge von
+    ``stages``.
+    """
+
+    ctx = ctx or BuildContext()
+    deps = stage_dependencies(stages)
+    state = SourceManifest(state_path)
+    origin = time.perf_counter()
+
+    runs: dict[str, StageRun] = {}
+    pending = list(stages)
+    running: dict[Future, Stage] = {}
+    errors: list[BuildError] = []
+    failed: set[str] = set()
+    omitted: list[str] = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            while True:
+                _omit_dependents(pending, deps, failed, omitted)
+                for stage in [s for s in pending if all(d in runs for d in deps[s.name])]:
+                    pending.remove(stage)
+                    running[executor.submit(_execute, stage, ctx, state, force, origin)] = stage
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        runs[stage.name] = future.result()
+                    except BuildError as e:
+                        print(f"❌ {e}")
+                        errors.append(e)
+                        failed.add(stage.name)
+    finally:
+        state.save()
+
+    if errors:
+        note = f"; ausgelassen: {', '.join(omitted)}" if omitted else ""
+        raise BuildError(f"Fehlgeschlagen: {', '.join(sorted(failed))}{note}") from errors[0]
+    return [runs[stage.name] for stage in stages]
+
+
+def critical_path(runs: list[StageRun], deps: dict[str, list[str]]) -> list[StageRun]:
+    """Längste Kette voneinander abhängiger Stufen, gemessen an ihrer Laufzeit."""
+
+    by_name = {run.name: run for run in runs}
+    total: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    # Eine Stufe startet erst nach ihren Abhängigkeiten, die Startzeit ordnet also topologisch
+    for run in sorted(runs, key=lambda r: r.start):
+        before = [d for d in deps.get(run.name, []) if d in total]
+        best = max(before, key=total.__getitem__, default=None)
+        previous[run.name] = best
+        total[run.name] = run.seconds + (total[best] if best else 0.0)
+
+    name = max(total, key=total.__getitem__, default=None)
+    path = []
+    while name is not None:
+        path.append(by_name[name])
+        name = previous[name]
+    return path[::-1]
+
+
+def print_summary(runs: list[StageRun], deps: dict[str, list[str]], wall: float) -> None:
+    path = critical_path(runs, deps)
+    on_path = {run.name for run in path}
+    for run in runs:
+        marker = "◆" if run.name in on_path else " "
+        note = "  übersprungen" if run.skipped else ""
+        print(f"⏱️ {marker} {run.name:<10} {run.start:6.2f}s → {run.end:6.2f}s {run.seconds:6.2f}s{note}")
+
+    busy = sum(run.seconds for run in runs)
+    chain = " → ".join(run.name for run in path)
+    print(f"🧭 Kritischer Pfad (◆): {chain} – {sum(run.seconds for run in path):.2f}s von {busy:.2f}s Stufenzeit")
+    skipped = sum(run.skipped for run in runs)
+    print(f"✅ Build abgeschlossen ({len(runs)} Stufen, {skipped} übersprungen, {wall:.2f}s)")
+
+
+def _names(value: str | None) -> list[str] | None:
+    return [name.strip() for name in value.split(",") if name.strip()] if value else None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Spielplan-Build in einem Prozess")
+    parser.add_argument("--stages", help="nur diese Stufen (kommagetrennt)")
+    parser.add_argument("--skip", help="diese Stufen auslassen (kommagetrennt)")
+    parser.add_argument("--force", action="store_true", help="auch Stufen mit unveränderten Eingaben ausführen")
+    parser.add_argument("--jobs", "-j", type=int, default=JOBS, help=f"Stufen gleichzeitig (Standard {JOBS})")
+    parser.add_argument("--list", action="store_true", help="Stufen anzeigen und beenden")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        deps = stage_dependencies(STAGES)
+        for stage in STAGES:
+            after = f"  ← {', '.join(deps[stage.name])}" if deps[stage.name] else ""
+            print(f"{stage.name:<10} {stage.description}{after}")
+        return
+
+    try:
+        stages = select_stages(_names(args.stages), _names(args.skip))
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    try:
+        runs = run_stages(stages, jobs=args.jobs, force=args.force)
+    except BuildError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+    print_summary(runs, stage_dependencies(stages), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Kodierungserkennung für CSV-Exporte (nur Standardbibliothek).
+
+Die SAMS-Exporte kommen als Windows-1252, die selbst erzeugten Heimspiel-CSVs
+als UTF-8. Die Kodierung wird an einer Stichprobe erkannt und die Datei dann
+einmal dekodiert (siehe ``csv_reader.py`` und ``spielplan_lite.py``).
+"""
+from __future__ import annotations
+
+import codecs
+import re
+
+ENCODINGS = ("utf-8-sig", "cp1252", "latin1")
+
+# Größe der Stichprobe für die Kodierungserkennung
+SNIFF_BYTES = 64 * 1024
+
+# In cp1252 nicht belegte Bytes – kommen sie vor, bleibt nur latin1
+_CP1252_UNDEFINED = re.compile(rb"[\x81\x8d\x8f\x90\x9d]")
+
+
+def sniff_encoding(raw: bytes, sample_size: int = SNIFF_BYTES) -> str:
+    """Bestimmt die Kodierung anhand der ersten ``sample_size`` Bytes."""
+
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+
+    sample = raw[:sample_size]
+    try:
+        # final=False: ein am Ende abgeschnittenes Mehrbyte-Zeichen ist kein Fehler
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        pass
+
+    if _CP1252_UNDEFINED.search(sample):
+        return "latin1"
+    return "cp1252"
+
+
+def decode_bytes(raw: bytes, name: str = "") -> tuple[str, str]:
+    """Dekodiert ``raw`` mit der erkannten Kodierung; gibt Text und Kodierung zurück.
+
+    Passt die Stichprobe nicht zum Rest der Datei, wird mit den übrigen
+    Kodierungen weiterprobiert und zuletzt mit Ersatzzeichen dekodiert.
+    """
+
+    sniffed = sniff_encoding(raw)
+    candidates = [sniffed] + [enc for enc in ENCODINGS if enc != sniffed]
+    last_error = None
+    for encoding in candidates:
+        try:
+            return raw.decode(encoding), encoding
+        except UnicodeDecodeError as exc:
+            last_error = exc
+    print(f"⚠️ Encoding-Fallback für {name}: {last_error}")
+    return raw.decode("utf-8-sig", errors="replace"), "utf-8-sig"
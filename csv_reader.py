@@ -0,0 +1,50 @@
+"""Einlesen der CSV-Exporte mit einmaliger Kodierungserkennung.
+
+Die SAMS-Exporte kommen als Windows-1252, die selbst erzeugten Heimspiel-CSVs
+als UTF-8. Statt die Datei für jede Kodierung erneut komplett zu parsen, wird
+sie einmal als Bytes gelesen, die Kodierung an einer Stichprobe erkannt (siehe
+``csv_encoding.py``), einmal dekodiert und dann mit dem C-Parser von pandas
+verarbeitet.
+"""
+from __future__ import annotations
+
+import io
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+from csv_encoding import decode_bytes
+
+
+def read_csv_robust(path: Path, sep: str = ";", **kwargs) -> pd.DataFrame:
+    """Liest eine CSV in einem Durchgang; fehlerhafte Zeilen werden übersprungen.
+
+    Die Anzahl übersprungener Zeilen steht in ``df.attrs["skipped_lines"]``
+    und wird zusätzlich ausgegeben.
+    """
+
+    text, encoding = decode_bytes(path.read_bytes(), path.name)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", pd.errors.ParserWarning)
+        df = pd.read_csv(
+            io.StringIO(text),
+            sep=sep,
+            engine="c",
+            on_bad_lines="warn",
+            **kwargs,
+        )
+
+    skipped = 0
+    for w in caught:
+        if issubclass(w.category, pd.errors.ParserWarning):
+            skipped += str(w.message).count("Skipping line")
+        else:
+            warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+    if skipped:
+        print(f"⚠️ {path.name}: {skipped} fehlerhafte Zeile(n) übersprungen")
+
+    df.attrs["encoding"] = encoding
+    df.attrs["skipped_lines"] = skipped
+    return df
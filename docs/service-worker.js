@@ -1,45 +1,73 @@
-const CACHE_NAME = 'usc-cache-v1';
+// Automatisch erzeugt von service_worker.py – nicht von Hand bearbeiten.
+const CACHE_NAME = 'usc-spielplan-cf1f5253fe11';
+const CACHE_PREFIX = 'usc-spielplan-';
+const PRECACHE = ["./", "index.html", "indexapp.html", "index_trainer.html", "manifest.webmanifest", "favicon.png", "favicon-16.png", "icon-192.png", "icon-512.png", "icon-maskable-512.png", "spielplan.csv"];
+const FRESH = /\.(html|csv|json|ics)$|\/$/;
+const CDN = 'https://cdn.jsdelivr.net/';
 
-const urlsToCache = [
-  '/',                         // Root der GitHub Pages-Seite (wird als / angezeigt)
-  '/index.html',               // Startseite
-  '/manifest.webmanifest',     // Manifest
-  '/icon-192.png',             // App-Icon klein
-  '/icon-512.png'              // App-Icon groß
-];
-
-// Service Worker Installation → Cache initialisieren
+// Installation → App-Shell am HTTP-Cache vorbei laden, sofort übernehmen
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => {
-      return cache.addAll(urlsToCache);
-    })
+    caches.open(CACHE_NAME)
+      .then((cache) => cache.addAll(PRECACHE.map((url) => new Request(url, { cache: 'reload' }))))
+      .then(() => self.skipWaiting())
   );
 });
 
-// Aktivierung → Alte Caches entfernen
+// Aktivierung → Caches älterer Builds (und den alten usc-cache-v1) entfernen
 self.addEventListener('activate', (event) => {
   event.waitUntil(
-    caches.keys().then((cacheNames) =>
-      Promise.all(
-        cacheNames.map((cache) => {
-          if (cache !== CACHE_NAME) {
-            return caches.delete(cache);
-          }
-        })
-      )
-    )
+    caches.keys()
+      .then((names) => Promise.all(
+        names
+          .filter((name) => name !== CACHE_NAME && (name.startsWith(CACHE_PREFIX) || name === 'usc-cache-v1'))
+          .map((name) => caches.delete(name))
+      ))
+      .then(() => self.clients.claim())
   );
 });
 
-// Netzwerkabfragen → Aus dem Cache oder aus dem Netz
+function staleWhileRevalidate(event, cache) {
+  return cache.match(event.request, { ignoreSearch: true }).then((cached) => {
+    const network = fetch(event.request)
+      .then((response) => {
+        if (response.ok) {
+          cache.put(event.request, response.clone());
+        }
+        return response;
+      })
+      .catch(() => cached);
+    if (cached) {
+      event.waitUntil(network);
+      return cached;
+    }
+    return network;
+  });
+}
+
+function cacheFirst(event, cache) {
+  return cache.match(event.request).then((cached) => cached || fetch(event.request).then((response) => {
+    if (response.ok || response.type === 'opaque') {
+      cache.put(event.request, response.clone());
+    }
+    return response;
+  }));
+}
+
 self.addEventListener('fetch', (event) => {
-  event.respondWith(
-    caches.match(event.request).then((response) => {
-      // Antwort aus dem Cache oder vom Server
-      return response || fetch(event.request);
-    }).catch(() => {
-      // Optional: Offline-Fallback hier definieren
-    })
-  );
-});
\ No newline at end of file
+  const request = event.request;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  const sameOrigin = url.origin === self.location.origin;
+  if (!sameOrigin && !request.url.startsWith(CDN)) {
+    return;
+  }
+  event.respondWith(caches.open(CACHE_NAME).then((cache) => {
+    if (sameOrigin && (request.mode === 'navigate' || FRESH.test(url.pathname))) {
+      return staleWhileRevalidate(event, cache);
+    }
+    return cacheFirst(event, cache);
+  }));
+});
@@ -0,0 +1,49 @@
+"""Spaltenweises Rendern von HTML-Tabellenzeilen.
+
+Zellen werden pro Spalte erzeugt: Jeder unterschiedliche Wert einer Spalte wird
+nur einmal escaped und als ``<td>`` verpackt, gleiche Werte (Hallen, Teams,
+Spielrunden, Datumsangaben) teilen sich danach dasselbe Textstück. Die Zeilen
+entstehen anschließend durch Zusammenfügen der Spalten.
+"""
+from __future__ import annotations
+
+from html import escape
+from typing import Callable, Hashable, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def map_distinct(func: Callable[[Hashable], T], values: Iterable[Hashable]) -> list[T]:
+    """Wendet ``func`` auf ``values`` an und rechnet jeden Wert nur einmal aus."""
+
+    memo: dict = {}
+    out = []
+    for value in values:
+        try:
+            result = memo[value]
+        except KeyError:
+            result = memo[value] = func(value)
+        out.append(result)
+    return out
+
+
+def _td(text: str) -> str:
+    return f"<td>{escape(text)}</td>"
+
+
+def escaped_cells(texts: Iterable[str]) -> list[str]:
+    """``<td>`` mit escaptem Text für jeden Eintrag einer Spalte."""
+
+    return map_distinct(_td, texts)
+
+
+def raw_cells(fragments: Iterable[str]) -> list[str]:
+    """``<td>`` mit bereits fertigem HTML (z. B. Links)."""
+
+    return [f"<td>{fragment}</td>" for fragment in fragments]
+
+
+def render_rows(columns: Sequence[Sequence[str]]) -> list[str]:
+    """Fügt fertige Zellen spaltenweise zu ``<tr>``-Zeilen zusammen."""
+
+    return ["<tr>" + "".join(cells) + "</tr>" for cells in zip(*columns)]
@@ -0,0 +1,165 @@
+"""Erzeugt Favicons und App-Icons für ``docs/`` aus einem einzigen Quellbild.
+
+Aus ``assets/icon-source.png`` entstehen alle in :data:`ICONS` aufgeführten
+Größen (16/32/192/512 px und eine maskierbare Variante mit Schutzrand). Die
+Bilder werden verkleinert, auf eine kleine Palette reduziert (fast weiße
+Farben werden dabei zu reinem Weiß, das entfernt das Rauschen im Hintergrund
+des Quellbilds) und optimiert gespeichert. ``manifest.webmanifest`` wird an
+die erzeugten Icons angepasst, die ``<link rel="icon">``-Tags der Seiten
+kommen aus :func:`icon_links`.
+
+Überschreitet ein Icon sein Byte-Budget, bricht der Lauf mit Exit-Code 1 ab.
+Benötigt Pillow (``pip install pillow``). Pillow wird erst beim Erzeugen der
+Icons importiert: Die Seitengeneratoren brauchen nur :func:`icon_links` und
+sollen ohne Pillow (und ohne dessen Importzeit) starten.
+"""
+from __future__ import annotations
+
+import io
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+DOCS_DIR = Path("docs")
+SOURCE_IMAGE = Path("assets/icon-source.png")
+MANIFEST_NAME = "manifest.webmanifest"
+
+PALETTE_COLORS = 32
+# Palettenfarben, deren Kanäle alle mindestens so hell sind, werden reines Weiß
+WHITE_THRESHOLD = 225
+BACKGROUND = (255, 255, 255)
+# Maskierbare Icons: Inhalt innerhalb der inneren 80 % (Safe Zone)
+MASKABLE_SAFE_ZONE = 0.8
+
+
+@dataclass(frozen=True)
+class IconSpec:
+    filename: str
+    size: int
+    budget: int
+    purpose: str = "any"
+    # "favicon": <link rel="icon">, "manifest": Eintrag im Web-App-Manifest
+    use: str = "manifest"
+
+
+ICONS = [
+    IconSpec("favicon-16.png", 16, 2 * 1024, use="favicon"),
+    IconSpec("favicon.png", 32, 4 * 1024, use="favicon"),
+    IconSpec("icon-192.png", 192, 16 * 1024),
+    IconSpec("icon-512.png", 512, 48 * 1024),
+    IconSpec("icon-maskable-512.png", 512, 48 * 1024, purpose="maskable"),
+]
+
+APPLE_TOUCH_ICON = "icon-192.png"
+
+
+def icon_links(prefix: str = "") -> str:
+    """``<link>``-Tags für Favicons und Apple-Touch-Icon (``prefix`` z. B. ``"../"``)."""
+
+    tags = [
+        f'<link rel="icon" type="image/png" sizes="{spec.size}x{spec.size}" href="{prefix}{spec.filename}">'
+        for spec in sorted(ICONS, key=lambda s: -s.size)
+        if spec.use == "favicon"
+    ]
+    tags.append(f'<link rel="apple-touch-icon" href="{prefix}{APPLE_TOUCH_ICON}">')
+    return "\n  ".join(tags)
+
+
+def _clean_palette(image: Image.Image) -> Image.Image:
+    """Reduziert auf ``PALETTE_COLORS`` Farben und setzt fast weiße Einträge auf Weiß."""
+
+    from PIL import Image
+
+    quantized = image.quantize(PALETTE_COLORS, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    palette = quantized.getpalette()[: 3 * PALETTE_COLORS]
+    for i in range(0, len(palette), 3):
+        if min(palette[i:i + 3]) >= WHITE_THRESHOLD:
+            palette[i:i + 3] = list(BACKGROUND)
+    quantized.putpalette(palette)
+    # Erneut quantisieren, damit doppelte Weiß-Einträge zusammenfallen
+    return quantized.convert("RGB").quantize(PALETTE_COLORS, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def render_icon(source: Image.Image, spec: IconSpec) -> bytes:
+    """Erzeugt ein Icon als PNG-Bytes."""
+
+    from PIL import Image
+
+    if spec.purpose == "maskable":
+        inner = round(spec.size * MASKABLE_SAFE_ZONE)
+        image = Image.new("RGB", (spec.size, spec.size), BACKGROUND)
+        offset = (spec.size - inner) // 2
+        image.paste(source.resize((inner, inner), Image.LANCZOS), (offset, offset))
+    else:
+        image = source.resize((spec.size, spec.size), Image.LANCZOS)
+
+    out = io.BytesIO()
+    _clean_palette(image).save(out, "PNG", optimize=True)
+    return out.getvalue()
+
+
+def update_manifest(docs_dir: Path = DOCS_DIR) -> None:
+    """Ersetzt die Icon-Liste in ``manifest.webmanifest`` durch die erzeugten Icons."""
+
+    path = docs_dir / MANIFEST_NAME
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    manifest["icons"] = [
+        {"src": spec.filename, "sizes": f"{spec.size}x{spec.size}", "type": "image/png", "purpose": spec.purpose}
+        for spec in ICONS
+        if spec.use == "manifest"
+    ]
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def build_icons(source_path: Path = SOURCE_IMAGE, docs_dir: Path = DOCS_DIR) -> list[tuple[IconSpec, int]]:
+    """Schreibt alle Icons nach ``docs_dir`` und gibt ``(Icon, Bytes)`` zurück."""
+
+    try:
+        from PIL import Image
+    except ImportError:
+        raise RuntimeError("Pillow ist nicht installiert (pip install pillow)") from None
+    with Image.open(source_path) as img:
+        source = img.convert("RGB")
+    if source.width != source.height:
+        print(f"⚠️ Quellbild {source_path} ist nicht quadratisch ({source.width}x{source.height})")
+
+    results = []
+    for spec in ICONS:
+        data = render_icon(source, spec)
+        (docs_dir / spec.filename).write_bytes(data)
+        results.append((spec, len(data)))
+    update_manifest(docs_dir)
+    return results
+
+
+def check_budgets(results: list[tuple[IconSpec, int]]) -> bool:
+    """Meldet jede Icongröße; ``False``, wenn ein Icon über seinem Budget liegt."""
+
+    ok = True
+    for spec, size in results:
+        if size > spec.budget:
+            ok = False
+            print(f"❌ {spec.filename}: {size} Bytes (Budget {spec.budget})")
+        else:
+            print(f"✅ {spec.filename}: {size} Bytes (Budget {spec.budget})")
+    return ok
+
+
+def main() -> None:
+    try:
+        results = build_icons()
+    except (RuntimeError, OSError) as e:
+        print(f"❌ Icons konnten nicht erzeugt werden: {e}")
+        raise SystemExit(1)
+
+    if not check_budgets(results):
+        raise SystemExit(1)
+    print(f"✅ {len(results)} Icons und {MANIFEST_NAME} aktualisiert.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Streamender Parser für ICS-Kalender (RFC 5545) der externen Vereinsfeeds.
+
+Die Datei wird Zeile für Zeile gelesen; Folgezeilen (beginnen mit Leerzeichen
+oder Tab) werden an die vorherige Zeile angehängt. Jedes ``VEVENT`` wird in
+einem Durchgang zu einem :class:`IcsEvent` zusammengesetzt und sofort
+ausgegeben. Eigenschaften verschachtelter Komponenten (z. B. ``VALARM``)
+werden ignoriert.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DEFAULT_TZ = "Europe/Berlin"
+
+_DATETIME_FORMATS = ("%Y%m%dT%H%M%S", "%Y%m%dT%H%M")
+_TEXT_ESCAPES = {"n": "\n", "N": "\n", ",": ",", ";": ";", "\\": "\\"}
+
+
+@dataclass
+class IcsEvent:
+    """Ein ``VEVENT`` mit bereits dekodierten Textwerten."""
+
+    uid: str = ""
+    summary: str = ""
+    location: str = ""
+    description: str = ""
+    # Anstoß in Europe/Berlin (bzw. ``default_tz``); bei VALUE=DATE Mitternacht
+    dtstart: datetime | None = None
+    all_day: bool = False
+    properties: dict[str, str] = field(default_factory=dict)
+    params: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+def unfold_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Fasst gefaltete Zeilen (RFC 5545, Abschnitt 3.1) zu logischen Zeilen zusammen."""
+
+    current: str | None = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def parse_content_line(line: str) -> tuple[str, dict[str, str], str]:
+    """Zerlegt ``NAME;PARAM=WERT:Wert`` in Name, Parameter und Wert."""
+
+    in_quotes = False
+    for pos, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:pos], line[pos + 1:]
+            break
+    else:
+        head, value = line, ""
+
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, param_value = raw.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def unescape_text(value: str) -> str:
+    """Löst die TEXT-Escapes ``\\n``, ``\\,``, ``\\;`` und ``\\\\`` auf."""
+
+    if "\\" not in value:
+        return value
+    out = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            nxt = next(chars, "")
+            out.append(_TEXT_ESCAPES.get(nxt, nxt))
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def localize(naive: datetime, tz: ZoneInfo) -> datetime:
+    """Ortszeit ``naive`` in der Zone ``tz`` als Zeitpunkt mit Zone.
+
+    Doppelte Stunde (Oktober): Winterzeit (``fold=1``). Ausgefallene Stunde
+    (März): Versatz vor der Umstellung, 02:30 wird also zu 03:30 Sommerzeit;
+    erkannt daran, dass die Zeit den Umweg über UTC nicht unverändert übersteht.
+    """
+
+    aware = naive.replace(tzinfo=tz, fold=1)
+    if aware.astimezone(timezone.utc).astimezone(tz).replace(tzinfo=None) != naive:
+        aware = naive.replace(tzinfo=tz, fold=0)
+    return aware
+
+
+def parse_dtstart(value: str, params: dict[str, str], default_tz: str = DEFAULT_TZ) -> tuple[datetime, bool]:
+    """Wandelt einen DATE/DATE-TIME-Wert in eine Zeit in ``default_tz`` um.
+
+    Berücksichtigt ``VALUE=DATE`` (ganztägig), UTC (``Z``), ``TZID`` und
+    lokale Zeiten ohne Zone. Gibt ``(zeitpunkt, ganztägig)`` zurück.
+    """
+
+    tz = ZoneInfo(default_tz)
+    value = value.strip()
+
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return localize(datetime.strptime(value[:8], "%Y%m%d"), tz), True
+
+    utc = value.endswith("Z")
+    text = value.rstrip("Z")
+    for fmt in _DATETIME_FORMATS:
+        try:
+            naive = datetime.strptime(text, fmt)
+            break
+        except ValueError:
+            continue
+    else:
+        raise ValueError(f"Unbekanntes Datumsformat: {value}")
+
+    if utc:
+        return naive.replace(tzinfo=timezone.utc).astimezone(tz), False
+    source_tz = tz
+    if "TZID" in params:
+        try:
+            source_tz = ZoneInfo(params["TZID"])
+        except (ZoneInfoNotFoundError, ValueError):
+            # ValueError: kein gültiger Schlüssel (z. B. absoluter Pfad)
+            print(f"⚠️ Unbekannte TZID '{params['TZID']}', verwende {default_tz}")
+    return localize(naive, source_tz).astimezone(tz), False
+
+
+def iter_events(lines: Iterable[str], default_tz: str = DEFAULT_TZ) -> Iterator[IcsEvent]:
+    """Gibt alle ``VEVENT``-Einträge aus ``lines`` nacheinander aus."""
+
+    event: IcsEvent | None = None
+    depth = 0
+    for line in unfold_lines(lines):
+        if not line:
+            continue
+        name, params, value = parse_content_line(line)
+
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and event is None:
+                event, depth = IcsEvent(), 0
+            elif event is not None:
+                depth += 1
+            continue
+        if name == "END":
+            if event is not None and depth:
+                depth -= 1
+            elif event is not None and value.upper() == "VEVENT":
+                yield event
+                event = None
+            continue
+        if event is None or depth:
+            continue
+
+        # Erste Angabe gewinnt, wie bei den bisherigen Extraktoren
+        if name in event.properties:
+            continue
+        text = unescape_text(value)
+        event.properties[name] = text
+        event.params[name] = params
+
+        if name == "UID":
+            event.uid = text
+        elif name == "SUMMARY":
+            event.summary = text
+        elif name == "LOCATION":
+            event.location = text
+        elif name == "DESCRIPTION":
+            event.description = text
+        elif name == "DTSTART":
+            try:
+                event.dtstart, event.all_day = parse_dtstart(value, params, default_tz)
+            except ValueError as e:
+                print(f"⚠️ Fehler bei DTSTART '{value}': {e}")
+
+
+def read_events(path: Path, default_tz: str = DEFAULT_TZ) -> Iterator[IcsEvent]:
+    """Streamt die Events einer ICS-Datei, ohne sie komplett einzulesen."""
+
+    with path.open(encoding="utf-8-sig", newline="") as fh:
+        yield from iter_events(fh, default_tz)
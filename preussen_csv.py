@@ -1,7 +1,12 @@
+from __future__ import annotations
+
 from pathlib import Path
 from datetime import datetime
+from zoneinfo import ZoneInfo
 import csv
-import pytz
+
+from ics_parser import localize, read_events
+from source_manifest import SourceManifest, code_hash, file_hash
 
 # Ordner und Dateien
 csv_dir = Path("csv_Baskets")
@@ -9,74 +14,86 @@ ics_file = csv_dir / "Preussen_2526.ics"
 csv_file = csv_dir / "Preussen_2526_Heimspiele.csv"
 
 # Zeitzone und Stichtag
-berlin = pytz.timezone("Europe/Berlin")
-stichtag = berlin.localize(datetime(2025, 8, 1))
+berlin = ZoneInfo("Europe/Berlin")
+stichtag = localize(datetime(2025, 8, 1), berlin)
 
-# ICS-Datei prüfen
-if not ics_file.exists():
-    print(f"❌ ICS-Datei nicht gefunden: {ics_file}")
-    exit(1)
+HEIM = "SC Preußen Münster - "
 
-# ICS-Inhalt lesen
-with ics_file.open(encoding="utf-8") as f:
-    content = f.read()
+# Code der Extraktion: Änderungen erzeugen die CSV auch bei unverändertem ICS neu
+EXTRACTOR_CODE = code_hash([Path(__file__), Path(__file__).with_name("ics_parser.py")])
 
-# Events extrahieren
-events = content.split("BEGIN:VEVENT")[1:]
-print(f"📅 Anzahl Events: {len(events)}")
 
-heimspiele = []
+def extract_heimspiele(ics_file: Path = ics_file, csv_file: Path = csv_file) -> bool:
+    """Schreibt die Heimspiele von Preußen Münster ab dem Stichtag als CSV.
 
-for event in events:
-    lines = event.strip().splitlines()
+    Gibt ``False`` zurück, wenn ICS und Extraktionscode unverändert sind und
+    die vorhandene CSV weiterverwendet wird. Fehlt das ICS, wird
+    ``FileNotFoundError`` ausgelöst.
+    """
 
-    # SUMMARY-Zeile finden
-    summary_line = next((line for line in lines if "SUMMARY:" in line and "Preußen Münster" in line), None)
-    if not summary_line:
-        continue
+    # ICS-Datei prüfen
+    if not ics_file.exists():
+        raise FileNotFoundError(f"ICS-Datei nicht gefunden: {ics_file}")
 
-    # Nur Heimspiele: SC Preußen Münster steht am Anfang
-    if "SC Preußen Münster - " not in summary_line:
-        continue
+    # Unverändertes ICS: vorhandene CSV weiterverwenden
+    manifest = SourceManifest()
+    ics_hash = file_hash(ics_file)
+    if csv_file.exists() and manifest.is_current(f"ics:{ics_file.name}", ics_hash, csv=csv_file.name, code=EXTRACTOR_CODE):
+        print(f"⏭️ ICS unverändert, {csv_file.name} bleibt bestehen")
+        return False
+
+    heimspiele = []
+    anzahl = 0
+
+    for event in read_events(ics_file):
+        anzahl += 1
+        summary = event.summary
+
+        # Nur Heimspiele: SC Preußen Münster steht am Anfang
+        if HEIM not in summary:
+            continue
 
-    try:
         # Stern vorne? → Termin unsicher
-        is_unsicher = summary_line.startswith("SUMMARY:* SC Preußen Münster - ")
+        is_unsicher = summary.startswith("* " + HEIM)
 
         # Gegner extrahieren
-        gegner = summary_line.split("SC Preußen Münster - ")[1].split(" | ")[0].strip()
-    except Exception as e:
-        print(f"⚠️ Gegner-Fehler: {e}")
-        continue
-
-    # DTSTART auslesen
-    dtstart_line = next((line for line in lines if line.startswith("DTSTART")), None)
-    if not dtstart_line:
-        continue
+        gegner = summary.split(HEIM)[1].split(" | ")[0].strip()
 
-    try:
-        dt_raw = dtstart_line.split(":")[1]
+        dt = event.dtstart
+        if dt is None:
+            continue
 
-        if "VALUE=DATE" in dtstart_line:
-            dt = datetime.strptime(dt_raw, "%Y%m%d")
-            dt = berlin.localize(dt)
+        if event.all_day or is_unsicher:
             uhrzeit = "???"
         else:
-            dt = datetime.strptime(dt_raw, "%Y%m%dT%H%M%S")
-            dt = berlin.localize(dt)
-            uhrzeit = "???" if is_unsicher else dt.strftime("%H:%M")
+            uhrzeit = dt.strftime("%H:%M")
 
         if dt >= stichtag:
             heimspiele.append((dt.strftime("%d.%m.%Y"), uhrzeit, gegner))
-    except Exception as e:
-        print(f"⚠️ Fehler bei DTSTART: {e}")
-        continue
-
-# CSV schreiben
-with csv_file.open("w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-    writer.writerow(["Datum", "Startzeit", "Gegner"])
-    writer.writerows(heimspiele)
-
-print(f"✅ Heimspiele extrahiert: {len(heimspiele)}")
-print(f"💾 Datei gespeichert: {csv_file}")
+
+    print(f"📅 Anzahl Events: {anzahl}")
+
+    # CSV schreiben
+    with csv_file.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Datum", "Startzeit", "Gegner"])
+        writer.writerows(heimspiele)
+
+    print(f"✅ Heimspiele extrahiert: {len(heimspiele)}")
+    print(f"💾 Datei gespeichert: {csv_file}")
+
+    manifest.update(f"ics:{ics_file.name}", ics_hash, csv=csv_file.name, code=EXTRACTOR_CODE)
+    manifest.save()
+    return True
+
+
+def main() -> None:
+    try:
+        extract_heimspiele()
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
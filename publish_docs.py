@@ -0,0 +1,153 @@
+"""Veröffentlichungsstufe für ``docs/``: minifizieren, Größen melden.
+
+Läuft nach allen Generatoren. Die erzeugten HTML-Seiten werden samt
+eingebettetem CSS und JavaScript verkleinert (Einrückungen und Leerraum,
+Kommentare, überflüssige Zeichen in CSS). Zum Schluss wird die Größe jedes
+Text-Artefakts vor und nach der Verarbeitung sowie gzip-komprimiert
+ausgegeben und gegen ``SIZE_BUDGET_GZ`` geprüft; Seiten, die schon aus einem
+früheren Lauf minifiziert vorliegen, bleiben unberührt und erscheinen ohne
+„vorher“-Größe. Vorher wird ``service-worker.js`` passend zu den fertigen
+Artefakten neu erzeugt.
+
+``docs/`` wird direkt aus Git über GitHub Pages veröffentlicht. Pages liefert
+keine vorkomprimierten Geschwister aus, sondern komprimiert selbst mit gzip;
+ausgeliefert wird also nur die Minifizierung. Die gzip-Größe wird deshalb
+nur im Speicher berechnet (als Schätzung der übertragenen Bytes), ``.gz``-
+oder ``.br``-Dateien früherer Läufe werden entfernt.
+"""
+from __future__ import annotations
+
+import gzip
+import re
+from pathlib import Path
+
+from service_worker import SERVICE_WORKER_NAME, write_service_worker
+
+DOCS_DIR = Path("docs")
+
+# Text-Artefakte, deren Größe gemeldet wird
+TEXT_SUFFIXES = {".html", ".css", ".js", ".json", ".csv", ".ics", ".webmanifest", ".svg", ".txt"}
+# Nur generierte Seiten werden minifiziert; handgeschriebene Dateien bleiben unverändert
+MINIFY_SUFFIXES = {".html"}
+# Vorkomprimierte Dateien früherer Läufe
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+# Warnschwelle je Artefakt (gzip-Größe)
+SIZE_BUDGET_GZ = 40 * 1024
+
+_RAW_BLOCK = re.compile(r"(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)", re.S | re.I)
+_WHITESPACE = re.compile(r"\s+")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+
+
+def _collapse(text: str) -> str:
+    """Fasst Leerraum zu einem Zeichen zusammen (Zeilenumbruch bleibt Zeilenumbruch)."""
+
+    return _WHITESPACE.sub(lambda m: "\n" if "\n" in m.group(0) else " ", text)
+
+
+def minify_css(css: str) -> str:
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_PUNCT.sub(r"\1", _WHITESPACE.sub(" ", css))
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """Entfernt Einrückung, Leerzeilen und reine Kommentarzeilen.
+
+    Zeilenumbrüche bleiben erhalten, damit die automatische Semikolon-Ergänzung
+    von JavaScript unverändert greift.
+    """
+
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def minify_html(text: str) -> str:
+    out = []
+    pos = 0
+    for match in _RAW_BLOCK.finditer(text):
+        out.append(_collapse(text[pos:match.start()]))
+        open_tag, tag, body, close_tag = match.group(1), match.group(2).lower(), match.group(3), match.group(4)
+        if tag == "style":
+            body = minify_css(body)
+        elif tag == "script" and "application/json" not in open_tag:
+            body = minify_js(body)
+        out.append(open_tag + body + close_tag)
+        pos = match.end()
+    out.append(_collapse(text[pos:]))
+    return "".join(out).strip() + "\n"
+
+
+def gzip_size(data: bytes) -> int:
+    """Größe nach gzip (Stufe 9), ohne eine Datei zu schreiben."""
+
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def remove_compressed(docs_dir: Path) -> None:
+    for sibling in docs_dir.rglob("*"):
+        if sibling.suffix in COMPRESSED_SUFFIXES:
+            sibling.unlink()
+
+
+def _kib(size: int | None) -> str:
+    return "-" if size is None else f"{size / 1024:.1f}"
+
+
+def publish(docs_dir: Path = DOCS_DIR) -> list[dict]:
+    """Minifiziert die HTML-Seiten unter ``docs_dir`` und misst alle Text-Artefakte.
+
+    Der Service Worker wird nach dem Minifizieren erzeugt.
+    """
+
+    remove_compressed(docs_dir)
+    paths = [p for p in sorted(docs_dir.rglob("*")) if p.is_file() and p.suffix in TEXT_SUFFIXES]
+    before: dict[Path, int | None] = {}
+    for path in paths:
+        data = path.read_bytes()
+        before[path] = len(data)
+        if path.suffix in MINIFY_SUFFIXES:
+            minified = minify_html(data.decode("utf-8")).encode("utf-8")
+            if minified == data:
+                # Schon in einem früheren Lauf minifiziert: Größe der Rohfassung unbekannt
+                before[path] = None
+            else:
+                path.write_bytes(minified)
+
+    sw_path = docs_dir / SERVICE_WORKER_NAME
+    write_service_worker(docs_dir)
+    if sw_path not in before:
+        paths = sorted(paths + [sw_path])
+
+    report = []
+    for path in paths:
+        data = path.read_bytes()
+        size = before[path] if path in before else len(data)
+        report.append({"name": path.relative_to(docs_dir).as_posix(), "vorher": size, "nachher": len(data), "gz": gzip_size(data)})
+    return report
+
+
+def print_report(report: list[dict]) -> None:
+    print(f"{'Artefakt':<55} {'vorher':>8} {'minif.':>8} {'gzip':>8}  (KiB)")
+    for row in report:
+        flag = "  ⚠️ über Budget" if row["gz"] > SIZE_BUDGET_GZ else ""
+        print(f"{row['name']:<55} {_kib(row['vorher']):>8} {_kib(row['nachher']):>8} {_kib(row['gz']):>8}{flag}")
+    total = {key: sum(row[key] for row in report) for key in ("nachher", "gz")}
+    # Bereits minifizierte Seiten zählen mit ihrer aktuellen Größe
+    total["vorher"] = sum(row["nachher"] if row["vorher"] is None else row["vorher"] for row in report)
+    print(f"{'Summe':<55} {_kib(total['vorher']):>8} {_kib(total['nachher']):>8} {_kib(total['gz']):>8}")
+    already = sum(row["vorher"] is None for row in report)
+    if already:
+        print(f"ℹ️ {already} Seite(n) waren schon minifiziert (vorher „-“), z. B. weil ihre Stufe übersprungen wurde")
+
+
+def main() -> None:
+    report = publish()
+    print_report(report)
+    print(f"✅ {len(report)} Artefakte geprüft, HTML-Seiten minifiziert")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Erzeugt ``docs/service-worker.js`` passend zum aktuellen Stand von ``docs/``.
+
+Der Cache-Name enthält eine Version, die aus dem Service Worker selbst und
+den statischen Dateien der App-Shell (Manifest, Icons) berechnet wird. Seiten
+und Spielplan tragen den „Stand“ des Builds und ändern sich bei jedem Lauf;
+sie gehen deshalb nicht in die Version ein, sondern werden über
+stale-while-revalidate aktuell gehalten. Nur eine Änderung an der Shell
+erzeugt einen neuen Service Worker; der Browser installiert ihn im
+Hintergrund und räumt die alten Caches ab.
+
+Strategie im Browser:
+
+* App-Shell (Seiten, Manifest, Icons, ``spielplan.csv``) wird bei der
+  Installation vorab geladen.
+* Seiten und Spielplandaten (HTML, CSV, JSON, ICS) kommen sofort aus dem Cache
+  und werden parallel aus dem Netz aktualisiert (stale-while-revalidate).
+* Übrige Dateien und das Bootstrap-CDN: Cache zuerst, sonst Netz.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+DOCS_DIR = Path("docs")
+SERVICE_WORKER_NAME = "service-worker.js"
+CACHE_PREFIX = "usc-spielplan-"
+
+# Relativ zum Service Worker, damit der Pfad des GitHub-Pages-Projekts egal ist
+APP_SHELL = [
+    "index.html",
+    "indexapp.html",
+    "index_trainer.html",
+    "manifest.webmanifest",
+    "favicon.png",
+    "favicon-16.png",
+    "icon-192.png",
+    "icon-512.png",
+    "icon-maskable-512.png",
+    "spielplan.csv",
+]
+# Dateien ohne Build-Zeitstempel: nur sie bestimmen die Cache-Version
+STATIC_SHELL = [
+    "manifest.webmanifest",
+    "favicon.png",
+    "favicon-16.png",
+    "icon-192.png",
+    "icon-512.png",
+    "icon-maskable-512.png",
+]
+
+SERVICE_WORKER_TEMPLATE = """// Automatisch erzeugt von service_worker.py – nicht von Hand bearbeiten.
+const CACHE_NAME = '@@cache_name@@';
+const CACHE_PREFIX = '@@cache_prefix@@';
+const PRECACHE = @@precache@@;
+const FRESH = /\\.(html|csv|json|ics)$|\\/$/;
+const CDN = 'https://cdn.jsdelivr.net/';
+
+// Installation → App-Shell am HTTP-Cache vorbei laden, sofort übernehmen
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    caches.open(CACHE_NAME)
+      .then((cache) => cache.addAll(PRECACHE.map((url) => new Request(url, { cache: 'reload' }))))
+      .then(() => self.skipWaiting())
+  );
+});
+
+// Aktivierung → Caches älterer Builds (und den alten usc-cache-v1) entfernen
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((names) => Promise.all(
+        names
+          .filter((name) => name !== CACHE_NAME && (name.startsWith(CACHE_PREFIX) || name === 'usc-cache-v1'))
+          .map((name) => caches.delete(name))
+      ))
+      .then(() => self.clients.claim())
+  );
+});
+
+function staleWhileRevalidate(event, cache) {
+  return cache.match(event.request, { ignoreSearch: true }).then((cached) => {
+    const network = fetch(event.request)
+      .then((response) => {
+        if (response.ok) {
+          cache.put(event.request, response.clone());
+        }
+        return response;
+      })
+      .catch(() => cached);
+    if (cached) {
+      event.waitUntil(network);
+      return cached;
+    }
+    return network;
+  });
+}
+
+function cacheFirst(event, cache) {
+  return cache.match(event.request).then((cached) => cached || fetch(event.request).then((response) => {
+    if (response.ok || response.type === 'opaque') {
+      cache.put(event.request, response.clone());
+    }
+    return response;
+  }));
+}
+
+self.addEventListener('fetch', (event) => {
+  const request = event.request;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  const sameOrigin = url.origin === self.location.origin;
+  if (!sameOrigin && !request.url.startsWith(CDN)) {
+    return;
+  }
+  event.respondWith(caches.open(CACHE_NAME).then((cache) => {
+    if (sameOrigin && (request.mode === 'navigate' || FRESH.test(url.pathname))) {
+      return staleWhileRevalidate(event, cache);
+    }
+    return cacheFirst(event, cache);
+  }));
+});
+"""
+
+
+def cache_version(docs_dir: Path, files: list[str]) -> str:
+    """Kurzer Hash über die Worker-Vorlage sowie Namen und Inhalte von ``files``."""
+
+    digest = hashlib.sha256(SERVICE_WORKER_TEMPLATE.encode("utf-8"))
+    for name in files:
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256((docs_dir / name).read_bytes()).digest())
+    return digest.hexdigest()[:12]
+
+
+def render_service_worker(cache_name: str, precache: list[str]) -> str:
+    return (
+        SERVICE_WORKER_TEMPLATE
+        .replace("@@cache_name@@", cache_name)
+        .replace("@@cache_prefix@@", CACHE_PREFIX)
+        .replace("@@precache@@", json.dumps(precache))
+    )
+
+
+def write_service_worker(docs_dir: Path = DOCS_DIR) -> str:
+    """Schreibt den Service Worker für den aktuellen Inhalt von ``docs_dir``.
+
+    Nicht vorhandene Dateien der App-Shell werden übersprungen (z. B. ohne
+    Trainer-Seite). Gibt den Cache-Namen zurück.
+    """
+
+    files = [name for name in APP_SHELL if (docs_dir / name).is_file()]
+    missing = sorted(set(APP_SHELL) - set(files))
+    if missing:
+        print(f"⚠️ Nicht vorab gecacht (fehlt in {docs_dir}): {', '.join(missing)}")
+    cache_name = CACHE_PREFIX + cache_version(docs_dir, [name for name in STATIC_SHELL if name in files])
+    (docs_dir / SERVICE_WORKER_NAME).write_text(
+        render_service_worker(cache_name, ["./"] + files), encoding="utf-8"
+    )
+    print(f"✅ {SERVICE_WORKER_NAME} mit Cache {cache_name} ({len(files)} Dateien vorab) erstellt.")
+    return cache_name
+
+
+if __name__ == "__main__":
+    write_service_worker()
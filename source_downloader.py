@@ -0,0 +1,461 @@
+"""Paralleler Download aller Datenquellen (SAMS-CSVs und Kalender-ICS).
+
+Alle Quellen werden in einem begrenzten Thread-Pool gleichzeitig geladen, so
+dass ein langsamer Endpunkt die übrigen nicht mehr aufhält. Jeder Worker hält
+pro Host eine Keep-Alive-Verbindung offen und verwendet sie für weitere
+Quellen desselben Hosts wieder. Verbindungsfehler, Timeouts sowie 429/5xx
+werden mit exponentiellem Backoff wiederholt.
+
+ETag, Last-Modified und der SHA-256 des Inhalts werden je Quelle im Manifest
+(``.cache/manifest.json``) abgelegt. Folgeläufe senden bedingte Anfragen; eine
+unveränderte Quelle kostet damit ein 304 und keinen Schreibzugriff. Neue
+Inhalte landen zunächst in ``.cache/staging/`` und werden erst übernommen,
+wenn alle Pflichtquellen erfolgreich geprüft sind – ein fehlgeschlagener Lauf
+lässt ``csvdata/`` unverändert.
+
+Die Übernahme tauscht jedes Zielverzeichnis als Ganzes: Der neue Stand
+entsteht daneben (``csvdata.neu``) und ersetzt das alte Verzeichnis per
+Umbenennung. Leser sehen so nie eine Mischung aus alten und neuen Exporten;
+bricht ein Lauf genau zwischen den beiden Umbenennungen ab, stellt der nächste
+Lauf den fertigen neuen Stand wieder her (:func:`recover_directory`).
+
+Für Tests lässt sich über die Umgebungsvariable ``SPIELPLAN_BASE_URL`` (z. B.
+``http://127.0.0.1:8000``) ein lokaler Ersatzserver vorschalten: Schema und
+Host aller Links werden dann durch diese Basis ersetzt, Pfad und Query
+bleiben erhalten.
+"""
+from __future__ import annotations
+
+import hashlib
+import http.client
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from source_manifest import SourceManifest, file_hash
+from team_config import get_download_sources, get_ics_sources
+
+CSV_DIR = Path("csvdata")
+ICS_DIR = Path("csv_Baskets")
+STAGING_DIR = Path(".cache/staging")
+
+BASE_URL_ENV = "SPIELPLAN_BASE_URL"
+USER_AGENT = "Mozilla/5.0"
+
+MAX_WORKERS = 6
+TIMEOUT = 30
+RETRIES = 3
+BACKOFF = 1.0
+MAX_REDIRECTS = 5
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+REDIRECT_STATUS = {301, 302, 303, 307, 308}
+
+
+class DownloadError(RuntimeError):
+    """Quelle konnte auch nach allen Versuchen nicht geladen werden."""
+
+
+@dataclass
+class Source:
+    name: str
+    url: str
+    target: Path
+    validate: Callable[[bytes, str], None]
+    optional: bool = False
+
+
+@dataclass
+class Validators:
+    """Zuletzt übernommener Stand einer Quelle (aus dem Manifest)."""
+
+    digest: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class DownloadResult:
+    source: Source
+    ok: bool
+    seconds: float
+    attempts: int
+    size: int = 0
+    error: str = ""
+    changed: bool = False
+    staged: Path | None = None
+    validators: Validators | None = None
+
+
+def check_csv(payload: bytes, name: str) -> None:
+    head = payload[:1000].decode("latin1", errors="ignore").lower()
+    if "<html" in head or "doctype" in head:
+        raise DownloadError(f"Ungültige CSV-Antwort für {name}")
+
+
+def check_ics(payload: bytes, name: str) -> None:
+    head = payload[:1000].decode("latin1", errors="ignore").lstrip("\ufeff\r\n\t ")
+    if not head.upper().startswith("BEGIN:VCALENDAR"):
+        raise DownloadError(f"Ungültige ICS-Antwort für {name}")
+
+
+def rebase_url(url: str, base_url: str | None) -> str:
+    """Ersetzt Schema und Host von ``url`` durch ``base_url`` (falls gesetzt)."""
+
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    path = base.path.rstrip("/") + parts.path
+    return urlunsplit((base.scheme, base.netloc, path, parts.query, ""))
+
+
+class ConnectionPool:
+    """Keep-Alive-Verbindungen je Thread und Host."""
+
+    def __init__(self, timeout: float = TIMEOUT) -> None:
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: list[http.client.HTTPConnection] = []
+
+    def get(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        key = (scheme, netloc)
+        conn = conns.get(key)
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conns[key] = cls(netloc, timeout=self.timeout)
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def drop(self, scheme: str, netloc: str) -> None:
+        """Schließt eine defekte Verbindung; beim nächsten Zugriff wird neu verbunden."""
+
+        conn = getattr(self._local, "conns", {}).pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+
+def fetch(pool: ConnectionPool, url: str, headers: dict[str, str] | None = None) -> tuple[int, bytes, http.client.HTTPResponse]:
+    """Ein GET inklusive Weiterleitungen; gibt Status (200/304), Inhalt und Antwort zurück."""
+
+    request_headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive", **(headers or {})}
+
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        conn = pool.get(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", path, headers=request_headers)
+            response = conn.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException):
+            pool.drop(parts.scheme, parts.netloc)
+            raise
+        if response.will_close:
+            pool.drop(parts.scheme, parts.netloc)
+
+        if response.status in REDIRECT_STATUS and response.getheader("Location"):
+            url = urljoin(url, response.getheader("Location"))
+            continue
+        if response.status in RETRY_STATUS:
+            raise ConnectionError(f"HTTP {response.status}")
+        if response.status not in (200, 304):
+            raise DownloadError(f"HTTP {response.status} für {url}")
+        return response.status, payload, response
+
+    raise DownloadError(f"Zu viele Weiterleitungen für {url}")
+
+
+def staging_path(source: Source, staging_dir: Path = STAGING_DIR) -> Path:
+    return staging_dir / source.target.parent.name / source.target.name
+
+
+def download_source(
+    pool: ConnectionPool,
+    source: Source,
+    known: Validators | None = None,
+    retries: int = RETRIES,
+    backoff: float = BACKOFF,
+    staging_dir: Path = STAGING_DIR,
+) -> DownloadResult:
+    """Lädt eine Quelle bedingt; neue Inhalte werden nur ins Staging geschrieben."""
+
+    # Bedingte Anfrage nur, wenn die Datei auf der Platte noch zum Manifest passt;
+    # sonst dient ihr Hash nur zum Vergleich mit dem neuen Inhalt
+    on_disk = file_hash(source.target)
+    if known is None or known.digest != on_disk:
+        known = Validators(digest=on_disk) if on_disk else None
+
+    start = time.perf_counter()
+    error = ""
+    for attempt in range(1, retries + 1):
+        try:
+            status, payload, response = fetch(pool, source.url, known.headers() if known else None)
+            if status == 304:
+                if known is None:
+                    raise DownloadError(f"Unerwartetes 304 für {source.url}")
+                return DownloadResult(source, True, time.perf_counter() - start, attempt, validators=known)
+            source.validate(payload, source.target.name)
+        except DownloadError as exc:
+            # Inhaltlich falsche Antworten werden nicht wiederholt
+            error = str(exc)
+            break
+        except (OSError, http.client.HTTPException) as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            if attempt < retries:
+                time.sleep(backoff * 2 ** (attempt - 1))
+            continue
+
+        validators = Validators(
+            digest=hashlib.sha256(payload).hexdigest(),
+            etag=response.getheader("ETag"),
+            last_modified=response.getheader("Last-Modified"),
+        )
+        seconds = time.perf_counter() - start
+        if known is not None and validators.digest == known.digest:
+            # Server ohne Validatoren: gleicher Inhalt, kein Schreibzugriff
+            return DownloadResult(source, True, seconds, attempt, size=len(payload), validators=validators)
+
+        staged = staging_path(source, staging_dir)
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_bytes(payload)
+        return DownloadResult(source, True, seconds, attempt, size=len(payload), changed=True, staged=staged, validators=validators)
+
+    return DownloadResult(source, False, time.perf_counter() - start, attempt, error=error)
+
+
+def download_all(
+    sources: list[Source],
+    known: dict[Path, Validators] | None = None,
+    max_workers: int = MAX_WORKERS,
+    timeout: float = TIMEOUT,
+    retries: int = RETRIES,
+    backoff: float = BACKOFF,
+    staging_dir: Path = STAGING_DIR,
+) -> list[DownloadResult]:
+    """Lädt alle Quellen parallel und gibt die Ergebnisse in Eingabereihenfolge zurück."""
+
+    known = known or {}
+    pool = ConnectionPool(timeout)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(download_source, pool, source, known.get(source.target), retries, backoff, staging_dir)
+                for source in sources
+            ]
+            return [future.result() for future in futures]
+    finally:
+        pool.close()
+
+
+def manifest_key(source: Source) -> str:
+    return f"http:{source.target.as_posix()}"
+
+
+def load_validators(manifest: SourceManifest, sources: list[Source]) -> dict[Path, Validators]:
+    known = {}
+    for source in sources:
+        entry = manifest.get(manifest_key(source))
+        if entry is not None and entry.get("meta", {}).get("url") == source.url:
+            meta = entry["meta"]
+            known[source.target] = Validators(entry.get("hash"), meta.get("etag"), meta.get("last_modified"))
+    return known
+
+
+def _swap_paths(directory: Path) -> tuple[Path, Path]:
+    return directory.with_name(f"{directory.name}.neu"), directory.with_name(f"{directory.name}.alt")
+
+
+def recover_directory(directory: Path) -> None:
+    """Räumt nach einem abgebrochenen Tausch auf.
+
+    Fehlt ``directory``, während ``<name>.neu`` existiert, brach der Lauf
+    zwischen den beiden Umbenennungen ab; der neue Stand war da bereits
+    vollständig und wird übernommen. Übrige Reste werden entfernt.
+    """
+
+    new_dir, old_dir = _swap_paths(directory)
+    if not directory.exists() and new_dir.exists():
+        os.rename(new_dir, directory)
+        print(f"♻️ Abgebrochene Übernahme abgeschlossen: {directory}")
+    shutil.rmtree(new_dir, ignore_errors=True)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def swap_directory(directory: Path, updates: dict[str, Path], sources: list[Source], pattern: str | None = None) -> None:
+    """Ersetzt ``directory`` als Ganzes durch den alten Stand plus ``updates``.
+
+    ``updates`` ordnet Dateinamen die Dateien im Staging zu. Mit ``pattern``
+    fallen dabei Dateien weg, die keiner Quelle aus ``sources`` mehr gehören.
+    """
+
+    new_dir, old_dir = _swap_paths(directory)
+    shutil.rmtree(new_dir, ignore_errors=True)
+    if directory.exists():
+        shutil.copytree(directory, new_dir)
+    else:
+        new_dir.mkdir(parents=True)
+    for name, staged in updates.items():
+        shutil.move(staged, new_dir / name)
+    if pattern is not None:
+        remove_stale(sources, new_dir, pattern)
+
+    if directory.exists():
+        os.rename(directory, old_dir)
+    os.rename(new_dir, directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def commit_results(
+    results: list[DownloadResult],
+    manifest: SourceManifest,
+    stale: list[tuple[Path, str]] | None = None,
+) -> None:
+    """Übernimmt alle neuen Inhalte je Zielverzeichnis als Einheit und merkt sich die Validatoren.
+
+    Das Manifest wird erst nach dem letzten Tausch aktualisiert.
+    """
+
+    sources = [result.source for result in results]
+    wanted = {source.target.name for source in sources}
+    patterns = dict(stale or [])
+    updates: dict[Path, dict[str, Path]] = {}
+    for result in results:
+        if result.ok and result.staged is not None:
+            updates.setdefault(result.source.target.parent, {})[result.source.target.name] = result.staged
+
+    for directory in sorted(set(updates) | set(patterns)):
+        pattern = patterns.get(directory)
+        has_stale = pattern is not None and any(path.name not in wanted for path in directory.glob(pattern))
+        if directory in updates or has_stale:
+            swap_directory(directory, updates.get(directory, {}), sources, pattern)
+
+    for result in results:
+        if not result.ok:
+            continue
+        validators = result.validators
+        manifest.update(
+            manifest_key(result.source),
+            validators.digest,
+            url=result.source.url,
+            etag=validators.etag,
+            last_modified=validators.last_modified,
+        )
+
+
+def volleyball_sources(base_url: str | None = None, csv_dir: Path = CSV_DIR) -> list[Source]:
+    return [
+        Source(
+            name=f"{row['team']} {row['wettbewerb']}",
+            url=rebase_url(row["link"], base_url),
+            target=csv_dir / row["datei"],
+            validate=check_csv,
+        )
+        for row in get_download_sources()
+    ]
+
+
+def ics_sources(base_url: str | None = None, ics_dir: Path = ICS_DIR) -> list[Source]:
+    return [
+        Source(
+            name=row["team"],
+            url=rebase_url(row["link"], base_url),
+            target=ics_dir / row["datei"],
+            validate=check_ics,
+            optional=row["optional"],
+        )
+        for row in get_ics_sources()
+    ]
+
+
+def remove_stale(sources: list[Source], directory: Path, pattern: str) -> None:
+    """Entfernt Dateien in ``directory``, die keiner konfigurierten Quelle mehr gehören."""
+
+    wanted = {source.target.name for source in sources}
+    for old_file in directory.glob(pattern):
+        if old_file.name not in wanted:
+            old_file.unlink()
+
+
+def report(results: list[DownloadResult]) -> bool:
+    """Gibt Dauer je Quelle aus; ``False``, wenn eine Pflichtquelle fehlt."""
+
+    all_ok = True
+    for result in results:
+        source = result.source
+        if result.ok and result.changed:
+            print(f"⬇️ {source.name} -> {source.target.name}: {result.size / 1024:.1f} KiB in {result.seconds:.2f}s ({result.attempts}. Versuch)")
+        elif result.ok:
+            print(f"✔️ {source.name} unverändert ({result.seconds:.2f}s)")
+        elif source.optional:
+            print(f"⚠️ {source.name} nicht erreichbar ({result.error}) – vorhandene Datei bleibt bestehen")
+        else:
+            print(f"❌ {source.name} fehlgeschlagen nach {result.seconds:.2f}s: {result.error}")
+            all_ok = False
+    return all_ok
+
+
+def sync_sources(sources: list[Source], stale: list[tuple[Path, str]] | None = None, staging_dir: Path = STAGING_DIR) -> bool:
+    """Lädt ``sources`` bedingt und übernimmt sie nur, wenn alle Pflichtquellen ok sind.
+
+    ``stale`` nennt (Verzeichnis, Muster)-Paare, aus denen nach erfolgreicher
+    Übernahme nicht mehr konfigurierte Dateien entfernt werden.
+    """
+
+    for directory in {source.target.parent for source in sources}:
+        recover_directory(directory)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    manifest = SourceManifest()
+
+    start = time.perf_counter()
+    results = download_all(sources, load_validators(manifest, sources), staging_dir=staging_dir)
+    ok = report(results)
+    changed = sum(result.changed for result in results)
+    print(f"⏱️ {len(results)} Quellen in {time.perf_counter() - start:.2f}s, {changed} geändert")
+
+    if ok:
+        commit_results(results, manifest, stale)
+        manifest.save()
+    else:
+        print("❌ Download unvollständig – vorhandene Dateien bleiben unverändert")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    return ok
+
+
+def main() -> None:
+    base_url = os.environ.get(BASE_URL_ENV) or None
+    sources = ics_sources(base_url) + volleyball_sources(base_url)
+    if not sync_sources(sources, stale=[(CSV_DIR, "*.csv")]):
+        raise SystemExit(1)
+    print("✅ Alle Quellen aktualisiert")
+
+
+if __name__ == "__main__":
+    main()
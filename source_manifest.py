@@ -0,0 +1,105 @@
+"""Manifest mit Inhalts-Hashes aller Eingangsdateien für inkrementelle Läufe.
+
+Jeder Eintrag merkt sich den SHA-256 einer Quelldatei sowie Metadaten, die
+die Verarbeitung beeinflussen (Teamcode, Version der Normalisierung, ...).
+Stimmen Hash und Metadaten überein, kann ein Skript das zwischengespeicherte
+Ergebnis weiterverwenden, statt die Datei erneut zu verarbeiten.
+
+Mehrere Stufen von ``build.py`` können gleichzeitig eigene Instanzen für
+dieselbe Datei halten. :meth:`SourceManifest.save` schreibt deshalb nur die
+eigenen Änderungen in den aktuellen Dateistand zurück.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+MANIFEST_PATH = Path(".cache/manifest.json")
+
+_SAVE_LOCK = threading.Lock()
+
+
+def file_hash(path: Path) -> str | None:
+    """SHA-256 des Dateiinhalts oder ``None``, wenn die Datei fehlt."""
+
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def code_hash(paths: Iterable[Path]) -> str:
+    """Kurzer Hash über Namen und Inhalte von Quelltextdateien.
+
+    Gehört in Cache-Schlüssel, deren Ergebnis vom Code abhängt: Eine Änderung
+    an einem der Module verwirft dann die alten Einträge von selbst.
+    """
+
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(f"{path.name};{file_hash(path)}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+class SourceManifest:
+    """Liest und schreibt das JSON-Manifest unter ``.cache/manifest.json``."""
+
+    def __init__(self, path: Path = MANIFEST_PATH) -> None:
+        self.path = path
+        self.entries = self._read()
+        # Seit dem Einlesen geänderte Schlüssel (None = entfernt)
+        self._changed: dict[str, dict[str, Any] | None] = {}
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            print(f"⚠️ Manifest unlesbar, wird neu aufgebaut: {self.path}")
+            return {}
+
+    def is_current(self, key: str, digest: str | None, **meta: Any) -> bool:
+        """Prüft, ob ``key`` mit demselben Hash und denselben Metadaten verarbeitet wurde."""
+
+        entry = self.entries.get(key)
+        return (
+            digest is not None
+            and entry is not None
+            and entry.get("hash") == digest
+            and entry.get("meta") == meta
+        )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self.entries.get(key)
+
+    def update(self, key: str, digest: str | None, **meta: Any) -> None:
+        entry = {"hash": digest, "meta": meta}
+        self.entries[key] = entry
+        self._changed[key] = entry
+
+    def discard(self, key: str) -> None:
+        self.entries.pop(key, None)
+        self._changed[key] = None
+
+    def save(self) -> None:
+        """Übernimmt die eigenen Änderungen in den aktuellen Dateistand und schreibt ihn."""
+
+        with _SAVE_LOCK:
+            entries = self._read()
+            for key, entry in self._changed.items():
+                if entry is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(entries, indent=2, sort_keys=True, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.path)
+            self.entries = entries
+            self._changed.clear()
@@ -0,0 +1,68 @@
+"""Tabellendaten für ``spielplan_html.py`` aus einem pandas-DataFrame (``df_all``)."""
+from __future__ import annotations
+
+from functools import cached_property
+
+import pandas as pd
+
+from html_table import map_distinct
+from spielplan_html import COLUMNS_DISPLAY, TableData
+from usc_games import week_options
+
+
+def cell_text(value) -> str:
+    """Zellenwert als Text; fehlende Werte (None/NaN/"nan") werden leer."""
+
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except Exception:
+        pass
+    text = str(value)
+    if text.strip().lower() == "nan":
+        return ""
+    return text
+
+
+def column_text(df: pd.DataFrame, col: str) -> list[str]:
+    """Zelltexte einer Spalte; jeder unterschiedliche Wert wird nur einmal umgewandelt."""
+
+    if col not in df.columns:
+        return [""] * len(df)
+    return map_distinct(cell_text, df[col].tolist())
+
+
+def _day_numbers(dates: pd.Series) -> list[int | None]:
+    """Kalendertage seit 1970-01-01 (``None`` ohne Datum)."""
+
+    days = (dates - pd.Timestamp("1970-01-01")) // pd.Timedelta(days=1)
+    return [None if pd.isna(d) else int(d) for d in days]
+
+
+class FrameTable(TableData):
+    """:class:`TableData` über den Zeilen eines normalisierten DataFrames."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+
+    @cached_property
+    def columns(self) -> list[list[str]]:
+        return [column_text(self.df, col) for col in COLUMNS_DISPLAY]
+
+    @cached_property
+    def teams(self) -> list[str]:
+        return column_text(self.df, "USC_Team")
+
+    @cached_property
+    def week_keys(self) -> list[str]:
+        return self.df["Woche_Start"].dt.strftime("%Y-%m-%d").fillna("").tolist()
+
+    @cached_property
+    def day(self) -> list[int | None]:
+        return _day_numbers(self.df["Datum_DT"])
+
+    @cached_property
+    def weeks(self) -> list[tuple[str, str]]:
+        return [(start.strftime("%Y-%m-%d"), label) for start, label in week_options(self.df)]
@@ -0,0 +1,544 @@
+"""Gemeinsamer HTML-Renderer für alle Spielplan-Seiten.
+
+Das Seitengerüst wird beim Import einmal in feste Textstücke und Platzhalter
+(``@@name@@``) zerlegt. Eine Seite entsteht dann durch ein einziges
+Zusammenfügen dieser Stücke mit den Werten des jeweiligen Datensatzes. Die
+Unterschiede zwischen ``index.html``, ``indexapp.html`` und
+``index_trainer.html`` (Schriftgrößen, zusätzliches CSS, Dateiname) sind als
+:class:`PageVariant` hinterlegt; Tabellenzeilen und Filteroptionen werden pro
+Datensatz nur einmal erzeugt und für alle Varianten verwendet.
+
+Gefiltert wird im Browser über invertierte Indizes (Team, Spielrunde, Ort,
+Woche → Zeilennummern) und Tagesnummern, die beim Erzeugen als JSON in die
+Seite geschrieben werden. Varianten im Modus ``"json"`` enthalten statt der
+``<tr>``-Zeilen zusätzlich die Zellen und rendern nur die sichtbaren Zeilen
+(virtualisierte Tabelle).
+"""
+from __future__ import annotations
+
+import html
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Iterable
+from zoneinfo import ZoneInfo
+
+from html_table import escaped_cells, render_rows
+from icon_assets import icon_links
+from usc_team_links import build_team_table_overview
+
+DOCS_DIR = Path("docs")
+
+COLUMNS_DISPLAY = [
+    "Datum",
+    "Uhrzeit",
+    "Tag",
+    "Heim",
+    "Gast",
+    "SR",
+    "Gastgeber",
+    "Ergebnis",
+    "Ort",
+    "Spielrunde",
+]
+
+RELOAD_BUTTON = """
+<div class="text-center mt-5 mb-3">
+  <button class="btn btn-outline-secondary" onclick="location.reload()">🔄 Seite neu laden</button>
+</div>
+"""
+
+# Zusätzliches CSS am Ende des <style>-Blocks
+CSS_DESKTOP = """h1 { font-size: 1.2rem; margin-bottom: 0.5rem; }
+.form-label { font-size: 0.7rem; }
+.form-select { font-size: 0.7rem; padding: 0.25rem 0.5rem; }
+.btn { font-size: 0.7rem; padding: 0.25rem 0.6rem; }
+"""
+CSS_APP = """h1 { font-size: 1rem; margin-bottom: 0.5rem; }
+.form-label { font-size: 0.7rem; }
+.form-select { font-size: 0.7rem; padding: 0.25rem 0.5rem; }
+.btn { font-size: 0.7rem; padding: 0.25rem 0.6rem; }
+"""
+CSS_TRAINER = """h1 { font-size: 1.2rem; margin-bottom: 0.5rem; }
+.form-label { font-size: 0.7rem; }
+.form-select { font-size: 0.7rem; padding: 0.25rem 0.5rem; }
+.btn { font-size: 0.6rem; padding: 0.25rem 0.6rem; }
+"""
+# Scrollbereich der virtualisierten Tabelle (Modus "json")
+CSS_VIRTUAL = """#spielplanScroll { max-height: 75vh; overflow-y: auto; }
+#spielplanScroll thead th { position: sticky; top: 0; z-index: 1; }
+@media print { #spielplanScroll { max-height: none; overflow: visible; } }
+"""
+
+
+@dataclass(frozen=True)
+class PageVariant:
+    """Parameter, in denen sich die erzeugten Seiten unterscheiden."""
+
+    filename: str
+    body_font_size: str
+    extra_css: str
+    message: str
+    # "dom": alle Zeilen als <tr>; "json": Datensatz + virtualisierte Tabelle
+    mode: str = "dom"
+
+
+INDEX = PageVariant("index.html", "0.8rem", CSS_DESKTOP, "✅ index.html erfolgreich erstellt.")
+APP = PageVariant(
+    "indexapp.html",
+    "0.6rem",
+    CSS_DESKTOP + CSS_APP + CSS_VIRTUAL,
+    "✅ indexapp.html erfolgreich erstellt (kleinere Schriftgröße, virtualisierte Tabelle).",
+    mode="json",
+)
+TRAINER = PageVariant("index_trainer.html", "0.6rem", CSS_TRAINER, "✅ index_trainer.html erfolgreich erstellt.")
+
+# Gemeinsame Filterlogik beider Modi. DATA.index ordnet jedem Team, jeder
+# Spielrunde, jedem Ort und jeder Woche die Zeilennummern zu; ein Filter ist
+# damit eine Schnittmenge, der Zeitraum ein Vergleich der Tagesnummern.
+FILTER_CORE = """function filterRows(data, c) {
+      const lists = [];
+      if (c.team) lists.push(data.index.team[c.team] || []);
+      if (c.runde) lists.push(data.index.runde[c.runde] || []);
+      if (c.ort) lists.push(data.index.ort[c.ort] || []);
+      if (c.week) lists.push(data.index.week[c.week] || []);
+      let ids = null;
+      if (lists.length) {
+        lists.sort((a, b) => a.length - b.length);
+        ids = lists[0];
+        for (let k = 1; k < lists.length; k++) {
+          const other = new Set(lists[k]);
+          ids = ids.filter(i => other.has(i));
+        }
+      }
+      const minDay = (c.week || c.showPast) ? -Infinity : c.today - 10;
+      const count = ids ? ids.length : data.day.length;
+      const out = [];
+      for (let k = 0; k < count; k++) {
+        const i = ids ? ids[k] : k;
+        const day = data.day[i];
+        if (day === null || day >= minDay) out.push(i);
+      }
+      return out;
+    }
+    function readCriteria() {
+      const week = document.getElementById("filterWeek").value;
+      const pastContainer = document.getElementById("togglePastContainer");
+      if (pastContainer) {
+        pastContainer.style.display = week ? "none" : "flex";
+      }
+      const now = new Date();
+      return {
+        team: document.getElementById("filterTeam").value,
+        runde: document.getElementById("filterRunde").value,
+        ort: document.getElementById("filterOrt").value,
+        week: week,
+        showPast: document.getElementById("togglePast").checked,
+        today: Math.floor(Date.UTC(now.getFullYear(), now.getMonth(), now.getDate()) / 86400000),
+      };
+    }
+    function resetFilter() {
+      document.getElementById("filterTeam").value = "";
+      document.getElementById("filterRunde").value = "";
+      document.getElementById("filterOrt").value = "";
+      document.getElementById("filterWeek").value = "";
+      document.getElementById("togglePast").checked = false;
+      filter();
+    }"""
+
+# Klassische Tabelle: alle Zeilen stehen im DOM, nur geänderte werden umgeschaltet
+FILTER_SCRIPT_DOM = """<script type="application/json" id="spielplanIndex">@@payload@@</script>
+  <script>
+    const DATA = JSON.parse(document.getElementById("spielplanIndex").textContent);
+    let shown = null;
+    @@filter_core@@
+    function filter() {
+      const rows = document.getElementById("spielplan").tBodies[0].rows;
+      const next = new Uint8Array(rows.length);
+      for (const i of filterRows(DATA, readCriteria())) next[i] = 1;
+      for (let i = 0; i < rows.length; i++) {
+        if (!shown || shown[i] !== next[i]) rows[i].style.display = next[i] ? "" : "none";
+      }
+      shown = next;
+    }
+    document.addEventListener("DOMContentLoaded", filter);
+  </script>"""
+
+# Virtualisierte Tabelle: Daten als JSON, im DOM nur die sichtbaren Zeilen.
+# Ab WORKER_THRESHOLD Zeilen wird in einem Web Worker gefiltert.
+FILTER_SCRIPT_JSON = """<script type="application/json" id="spielplanDaten">@@payload@@</script>
+  <script>
+    const DATA = JSON.parse(document.getElementById("spielplanDaten").textContent);
+    const WORKER_THRESHOLD = @@worker_threshold@@;
+    const OVERSCAN = 10;
+    const ESC = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;" };
+    @@filter_core@@
+
+    const scroller = document.getElementById("spielplanScroll");
+    const tbody = document.querySelector("#spielplan tbody");
+    let visible = [];
+    let rowHeight = 0;
+    let framePending = false;
+    let worker = null;
+    let requestId = 0;
+
+    if (DATA.day.length > WORKER_THRESHOLD && window.Worker) {
+      const src = filterRows.toString()
+        + "\\nlet data = null;\\nonmessage = e => { if (e.data.data) { data = e.data.data; return; }"
+        + " postMessage({ id: e.data.id, rows: filterRows(data, e.data.criteria) }); };";
+      worker = new Worker(URL.createObjectURL(new Blob([src], { type: "text/javascript" })));
+      worker.postMessage({ data: { index: DATA.index, day: DATA.day } });
+      worker.onmessage = e => { if (e.data.id === requestId) show(e.data.rows); };
+    }
+
+    function esc(value) {
+      return value.replace(/[&<>"']/g, ch => ESC[ch]);
+    }
+    function rowHtml(i) {
+      return "<tr>" + DATA.cells[i].map(v => "<td>" + esc(v) + "</td>").join("") + "</tr>";
+    }
+    function spacer(height) {
+      return height > 0 ? `<tr aria-hidden="true" style="height:${height}px"></tr>` : "";
+    }
+    function renderVisible() {
+      framePending = false;
+      if (!rowHeight && visible.length) {
+        tbody.innerHTML = rowHtml(visible[0]);
+        rowHeight = tbody.rows[0].offsetHeight || 30;
+      }
+      const top = scroller.scrollTop;
+      const start = Math.max(0, Math.floor(top / (rowHeight || 1)) - OVERSCAN);
+      const end = Math.min(visible.length, Math.ceil((top + scroller.clientHeight) / (rowHeight || 1)) + OVERSCAN);
+      tbody.innerHTML = spacer(start * rowHeight)
+        + visible.slice(start, end).map(rowHtml).join("")
+        + spacer((visible.length - end) * rowHeight);
+    }
+    function scheduleRender() {
+      if (!framePending) {
+        framePending = true;
+        requestAnimationFrame(renderVisible);
+      }
+    }
+    function show(rows) {
+      visible = rows;
+      scroller.scrollTop = 0;
+      renderVisible();
+    }
+    function filter() {
+      const criteria = readCriteria();
+      if (worker) {
+        worker.postMessage({ id: ++requestId, criteria: criteria });
+      } else {
+        show(filterRows(DATA, criteria));
+      }
+    }
+    scroller.addEventListener("scroll", scheduleRender, { passive: true });
+    window.addEventListener("resize", scheduleRender);
+    // Beim Drucken alle gefilterten Zeilen ausgeben
+    window.addEventListener("beforeprint", () => {
+      tbody.innerHTML = visible.map(rowHtml).join("");
+    });
+    window.addEventListener("afterprint", renderVisible);
+    document.addEventListener("DOMContentLoaded", filter);
+  </script>"""
+
+# Ab dieser Zeilenzahl filtert die JSON-Variante in einem Web Worker
+WORKER_THRESHOLD = 2000
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="de">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>USC Münster Spielplan 2025/26</title>
+  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
+  <style>
+    body { font-size: @@body_font_size@@; }
+    th, td { white-space: nowrap; }
+    table tr { background-color: white; }
+    thead th { background-color: #f2f2f2 !important; color: #000; }
+    .accordion-button { background-color: #96d696 !important; }
+    #filters { background-color: #96d696 !important; }
+    #filters select, #filters label {
+      color: #000000;
+      border-color: #96d696;
+    }
+    .form-select:focus {
+      border-color: #28a745;
+      box-shadow: 0 0 0 0.25rem rgba(40,167,69,.25);
+    }
+    @media print {
+      body * { visibility: hidden; }
+      #spielplan, #spielplan * { visibility: visible; }
+      #spielplan { position: absolute; left: 0; top: 0; width: 100%; }
+    }
+  @@extra_css@@</style>
+  @@icon_links@@
+  <link rel="manifest" href="manifest.webmanifest">
+  <meta name="theme-color" content="#008000">
+</head>
+<body class="p-4">
+  <div class="container">
+    <h1 class="mb-2">USC Münster – Spielplan 2025/26</h1>
+    @@stand_info@@
+    @@team_tables@@
+    <div class="accordion mb-3" id="filterAccordion">
+      <div class="accordion-item">
+        <h2 class="accordion-header" id="headingFilters">
+          <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#filters" aria-expanded="true">
+            Filter anzeigen
+          </button>
+        </h2>
+        <div id="filters" class="accordion-collapse collapse show" aria-labelledby="headingFilters">
+          <div class="accordion-body">
+            <div class="row g-2">
+              <div class="col-md-4">
+                <label class="form-label">USC-Team:</label>
+                <select class="form-select" id="filterTeam" onchange="filter()">
+                  <option value="">Alle</option>
+                  @@team_options@@
+                </select>
+              </div>
+              <div class="col-md-4">
+                <label class="form-label">Spielrunde:</label>
+                <select class="form-select" id="filterRunde" onchange="filter()">
+                  <option value="">Alle</option>
+                  @@runde_options@@
+                </select>
+              </div>
+              <div class="col-md-4">
+                <label class="form-label">Ort (nur Münster):</label>
+                <select class="form-select" id="filterOrt" onchange="filter()">
+                  <option value="">Alle</option>
+                  @@ort_options@@
+                </select>
+              </div>
+            </div>
+            <div class="row g-2 mt-2">
+              <div class="col-md-4">
+                <label class="form-label">Woche (Mo–So):</label>
+                <select class="form-select" id="filterWeek" onchange="filter()">
+                  <option value="">Alle</option>
+                  @@week_options@@
+                </select>
+              </div>
+              <div class="col-md-4 d-flex align-items-end" id="togglePastContainer">
+                <div class="form-check">
+                  <input class="form-check-input" type="checkbox" value="1" id="togglePast" onchange="filter()">
+                  <label class="form-check-label" for="togglePast">Vergangene Spiele anzeigen</label>
+                </div>
+              </div>
+            </div>
+            <div class="mt-3">
+              <button class="btn btn-secondary" onclick="resetFilter()">Zurücksetzen</button>
+              <button class="btn btn-outline-primary" onclick="window.print()">🖨️ Drucken</button>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+    <div class="table-responsive"@@table_attrs@@>
+      <table class="table table-bordered" id="spielplan">
+        <thead>
+          <tr>@@table_header@@</tr>
+        </thead>
+        <tbody>
+          @@table_rows@@
+        </tbody>
+      </table>
+    </div>
+    <div class="mt-4">
+      <a class="btn btn-success" href="spielplan.csv" download>📥 Gesamten Spielplan als CSV herunterladen</a>
+      <a class="btn btn-outline-success" href="shards/index.html">📂 Einzelne Teams, Hallen und Wochen</a>
+    </div>
+    @@reload_button@@
+  </div>
+  @@filter_script@@
+  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>
+  <script>
+    if ('serviceWorker' in navigator) {
+      navigator.serviceWorker.register('service-worker.js', { updateViaCache: 'none' })
+        .then(reg => console.log('✅ Service Worker registriert:', reg.scope))
+        .catch(err => console.warn('❌ Service Worker Fehler:', err));
+    }
+  </script>
+</body>
+</html>
+"""
+
+_SLOT = re.compile(r"@@(\w+)@@")
+
+
+def compile_template(template: str) -> tuple[list[str], list[str]]:
+    """Zerlegt ``template`` in feste Textstücke und die Namen der Platzhalter."""
+
+    parts = _SLOT.split(template)
+    return parts[0::2], parts[1::2]
+
+
+_PAGE = compile_template(PAGE_TEMPLATE)
+_SCRIPT_DOM = compile_template(FILTER_SCRIPT_DOM)
+_SCRIPT_JSON = compile_template(FILTER_SCRIPT_JSON)
+
+
+def render_template(values: dict[str, str], compiled: tuple[list[str], list[str]] = _PAGE) -> str:
+    """Setzt die Seite in einem Durchgang aus Textstücken und Werten zusammen."""
+
+    chunks, slots = compiled
+    out = [chunks[0]]
+    for slot, chunk in zip(slots, chunks[1:]):
+        out.append(values[slot])
+        out.append(chunk)
+    return "".join(out)
+
+
+def _row_ids(keys_per_row: Iterable[Iterable[str]]) -> dict[str, list[int]]:
+    """Schlüssel → aufsteigende Zeilennummern, nach Schlüssel sortiert; leere Schlüssel entfallen."""
+
+    ids: dict[str, list[int]] = {}
+    for row, keys in enumerate(keys_per_row):
+        for key in keys:
+            if key:
+                ids.setdefault(key, []).append(row)
+    return dict(sorted(ids.items()))
+
+
+class TableData:
+    """Ein Datensatz mit allen daraus abgeleiteten Bausteinen, jeweils einmal erzeugt.
+
+    Seitenvarianten und Auszüge (siehe ``spielplan_shards.py``) greifen auf
+    dieselben Zeilen, Zellen und Indizes zu. Unterklassen liefern die Daten je
+    Zeile: ``columns`` (Zelltexte je Spalte aus ``COLUMNS_DISPLAY``),
+    ``teams`` (``USC_Team``, mehrere Codes mit ``/``), ``week_keys``
+    (Wochenanfang ``YYYY-MM-DD`` oder leer), ``day`` (Kalendertage seit
+    1970-01-01) und ``weeks`` (alle Wochen als ``(Anfang, Label)``) –
+    :class:`spielplan_frame.FrameTable` aus einem DataFrame,
+    :class:`spielplan_lite.GameTable` aus den Spielobjekten.
+    """
+
+    columns: list[list[str]]
+    teams: list[str]
+    week_keys: list[str]
+    day: list[int | None]
+    weeks: list[tuple[str, str]]
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    @cached_property
+    def index(self) -> dict[str, dict[str, list[int]]]:
+        """Invertierte Indizes für die Filter: Team, Spielrunde, Ort und Woche → Zeilen."""
+
+        texts = dict(zip(COLUMNS_DISPLAY, self.columns))
+        return {
+            "team": _row_ids(team.split("/") for team in self.teams),
+            "runde": _row_ids([key] for key in texts["Spielrunde"]),
+            "ort": _row_ids([key] for key in texts["Ort"]),
+            "week": _row_ids([key] for key in self.week_keys),
+        }
+
+    @cached_property
+    def row_html(self) -> list[str]:
+        return render_rows([escaped_cells(texts) for texts in self.columns])
+
+    @cached_property
+    def cells(self) -> list[list[str]]:
+        return [list(row) for row in zip(*self.columns)]
+
+
+def json_script_payload(data: dict) -> str:
+    """JSON für einen ``<script type="application/json">``-Block."""
+
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    # "</script>" im Datensatz darf den Script-Block nicht beenden
+    return payload.replace("</", "<\\/")
+
+
+def _options(values) -> str:
+    return "".join(f"<option value='{html.escape(v)}'>{html.escape(v)}</option>" for v in values)
+
+
+def table_header() -> str:
+    return "".join(f"<th>{col}</th>" for col in COLUMNS_DISPLAY)
+
+
+def page_values(table: TableData, stand: str) -> dict[str, str]:
+    """Alle datensatzabhängigen Platzhalterwerte (ohne Variantenparameter).
+
+    Die Auswahllisten ergeben sich direkt aus den Schlüsseln des Filterindex.
+    """
+
+    index = table.index
+    spielrunden = list(index["runde"])
+    orte = [o for o in index["ort"] if "münster" in o.lower()]
+    teams = list(index["team"])
+    usc_team_codes = [team for team in teams if team.startswith("USC")]
+
+    return {
+        "stand_info": f'<p class="text-muted mt-3">Stand: {stand} Uhr</p>',
+        "team_tables": build_team_table_overview(usc_team_codes),
+        "team_options": _options(teams),
+        "runde_options": _options(spielrunden),
+        "ort_options": _options(orte),
+        "week_options": "".join(
+            f"<option value='{start}'>{html.escape(label)}</option>" for start, label in table.weeks
+        ),
+        "table_header": table_header(),
+        "reload_button": RELOAD_BUTTON,
+        "icon_links": icon_links(),
+    }
+
+
+def mode_values(table: TableData, mode: str) -> dict[str, str]:
+    """Platzhalterwerte, die vom Darstellungsmodus abhängen."""
+
+    data = {"index": table.index, "day": table.day}
+    if mode == "json":
+        data["cells"] = table.cells
+        script = render_template(
+            {
+                "payload": json_script_payload(data),
+                "worker_threshold": str(WORKER_THRESHOLD),
+                "filter_core": FILTER_CORE,
+            },
+            _SCRIPT_JSON,
+        )
+        return {"table_attrs": ' id="spielplanScroll"', "table_rows": "", "filter_script": script}
+
+    script = render_template({"payload": json_script_payload(data), "filter_core": FILTER_CORE}, _SCRIPT_DOM)
+    return {"table_attrs": "", "table_rows": "\n".join(table.row_html), "filter_script": script}
+
+
+def stand_now() -> str:
+    """Aktuelle Zeit in Berlin für die Anzeige „Stand: …“."""
+
+    return datetime.now(ZoneInfo("Europe/Berlin")).strftime("%d.%m.%Y %H:%M")
+
+
+def write_pages(table: TableData, variants: list[PageVariant], stand: str, docs_dir: Path = DOCS_DIR) -> TableData:
+    """Rendert alle ``variants`` aus demselben Datensatz und schreibt sie nach ``docs_dir``.
+
+    Gibt ``table`` zurück, damit weitere Ausgaben (Auszüge) die bereits
+    erzeugten Zeilen und Indizes weiterverwenden können.
+    """
+
+    values = page_values(table, stand)
+    by_mode: dict[str, dict[str, str]] = {}
+    docs_dir.mkdir(exist_ok=True)
+    for variant in variants:
+        if variant.mode not in by_mode:
+            by_mode[variant.mode] = mode_values(table, variant.mode)
+        page = render_template(
+            {
+                **values,
+                **by_mode[variant.mode],
+                "body_font_size": variant.body_font_size,
+                "extra_css": variant.extra_css,
+            }
+        )
+        (docs_dir / variant.filename).write_text(page, encoding="utf-8")
+        print(variant.message)
+    return table
@@ -0,0 +1,658 @@
+"""Spielplan ohne pandas: derselbe Datensatz und dieselben Dateien, nur mit der Standardbibliothek.
+
+Die Saison umfasst nur einige hundert Zeilen; der Import von pandas dauert
+länger als die eigentliche Aufbereitung. Dieses Modul liest die SAMS-Exporte
+mit :mod:`csv`, wendet dieselben Regeln an wie ``usc_games.py``
+(``usc_rules.py``, ``usc_names.py``) und hält jedes Spiel als :class:`Game`
+mit ``__slots__``. Mit den Renderern der übrigen Generatoren entstehen daraus
+
+* ``docs/spielplan.csv``,
+* ``docs/index.html``, ``indexapp.html`` und die Auszüge,
+* ``docs/index_trainer.html``,
+* ``docs/usc_spielplan.ics`` und die Einzel-Feeds,
+
+byteweise gleich wie auf dem pandas-Weg. Dafür werden auch dessen Typregeln
+nachgebildet: Spalten, die in einem Export nur Ganzzahlen enthalten, bleiben
+Ganzzahlen; fehlen Werte oder fehlt die Spalte in einer anderen Quelle, werden
+sie zu Kommazahlen (``85.0``) wie bei ``read_csv`` und ``concat``.
+
+Aufruf::
+
+    python spielplan_lite.py            # schreibt alle Dateien nach docs/
+    python spielplan_lite.py --check    # vergleicht nur mit dem pandas-Weg
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import math
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from csv_encoding import decode_bytes
+from html_table import map_distinct
+from spielplan_html import APP, COLUMNS_DISPLAY, INDEX, TRAINER, TableData, stand_now, write_pages
+from spielplan_shards import write_shards
+from team_config import TEAM_SOURCES_PATH, get_csv_files
+from usc_names import replace_usc_names
+from usc_rules import (
+    EPOCH_UNBEKANNT,
+    EXTERNAL_SOURCES,
+    HELPER_COLUMNS,
+    NAME_COLUMNS,
+    RENAME_MAP,
+    SATZSPALTEN,
+    USC_PATTERN,
+    USC_SEARCH_FIELDS,
+    WOCHENTAGE,
+    get_usc_team,
+    normalize_search_text,
+)
+from usc_spielplan_ics import build_events, write_calendars
+
+CSV_DIR = Path("csvdata")
+CSV_PATH = Path("docs/spielplan.csv")
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+# Fehlender Wert; wie bei pandas ergibt str(NA) "nan"
+NA = math.nan
+
+# Zellen, die pandas.read_csv als fehlend liest
+NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+_INT = re.compile(r"\s*[+-]?[0-9]+\s*")
+_FLOAT = re.compile(r"\s*[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?\s*|\s*[+-]?inf(inity)?\s*", re.IGNORECASE)
+_BOOL = {"True": True, "TRUE": True, "true": True, "False": False, "FALSE": False, "false": False}
+
+_USC_SUFFIX = re.compile(r"\b(USC-[U\d]+-\d) II\b")
+
+
+def is_na(value) -> bool:
+    """None oder NaN (NaN ist als einziger Wert ungleich sich selbst)."""
+
+    return value is None or value != value
+
+
+def _stripped(value):
+    """Getrimmter Text; fehlende Werte bleiben fehlend (wie ``astype(str)`` ab pandas 3)."""
+
+    return NA if is_na(value) else str(value).strip()
+
+
+def cell_text(value) -> str:
+    """Zellenwert als Text; fehlende Werte und "nan" werden leer (wie ``spielplan_frame.cell_text``)."""
+
+    if is_na(value):
+        return ""
+    text = str(value)
+    return "" if text.strip().lower() == "nan" else text
+
+
+# --- Einlesen ---------------------------------------------------------------
+
+
+@dataclass
+class Source:
+    """Eine Exportdatei: Spalten, Typ je Spalte und Zeilen als typisierte Werte.
+
+    Typen wie bei ``read_csv``: ``"int"``, ``"float"``, ``"bool"`` oder ``"str"``.
+    """
+
+    name: str
+    columns: list[str]
+    kinds: list[str]
+    rows: list[list]
+    # Alle Spalten des Gesamtdatensatzes (für Zugriffe auf Spalten anderer Quellen)
+    all_columns: frozenset[str] = frozenset()
+
+    @cached_property
+    def position(self) -> dict[str, int]:
+        return {col: i for i, col in enumerate(self.columns)}
+
+
+def _column_kind(texts: list[str | None]) -> str:
+    values = [t for t in texts if t is not None]
+    if not values:
+        return "empty"
+    complete = len(values) == len(texts)
+    if all(_INT.fullmatch(t) for t in values):
+        return "int" if complete else "float"
+    if all(_FLOAT.fullmatch(t) for t in values):
+        return "float"
+    if all(t in _BOOL for t in values):
+        return "bool"
+    return "str"
+
+
+def _convert(text: str | None, kind: str):
+    if text is None:
+        return NA
+    if kind == "int":
+        return int(text)
+    if kind == "float":
+        return float(text)
+    if kind == "bool":
+        return _BOOL[text]
+    return text
+
+
+def read_source(path: Path, sep: str) -> Source:
+    """Liest eine CSV wie ``csv_reader.read_csv_robust``: Zeilen mit zu vielen Feldern entfallen."""
+
+    text, _ = decode_bytes(path.read_bytes(), path.name)
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=sep)
+    header = next(reader, [])
+    width = len(header)
+
+    records = []
+    skipped = 0
+    for record in reader:
+        if not record:
+            continue
+        if len(record) > width:
+            skipped += 1
+            continue
+        records.append(record + [""] * (width - len(record)))
+    if skipped:
+        print(f"⚠️ {path.name}: {skipped} fehlerhafte Zeile(n) übersprungen")
+
+    columns = [name if name else f"Unnamed: {i}" for i, name in enumerate(header)]
+    texts = [[None if r[i] in NA_VALUES else r[i] for r in records] for i in range(width)]
+    kinds = [_column_kind(col) for col in texts]
+    values = [[_convert(t, kind) for t in col] for col, kind in zip(texts, kinds)]
+    return Source(path.name, columns, kinds, [list(row) for row in zip(*values)] if width else [])
+
+
+def clean_source(source: Source) -> Source:
+    """Wie ``usc_games.read_csv_clean``: Spaltennamen trimmen, leere und ``Unnamed``-Spalten entfernen."""
+
+    keep = []
+    for i, col in enumerate(source.columns):
+        name = col.replace("\ufeff", "").strip()
+        if name.startswith("Unnamed") or source.kinds[i] == "empty":
+            continue
+        keep.append((i, name))
+    return Source(
+        source.name,
+        [name for _, name in keep],
+        [source.kinds[i] for i, _ in keep],
+        [[row[i] for i, _ in keep] for row in source.rows],
+    )
+
+
+# --- Spiele -----------------------------------------------------------------
+
+# Spalten von df_all, die jedes Spiel als eigenes Attribut führt
+GAME_COLUMNS = (
+    "Datum", "Uhrzeit", "Tag", "Heim", "Gast", "SR", "Gastgeber", "Ergebnis", "Ort", "Spielrunde",
+    "USC_Team", "Datum_DT", "Woche_Start", "Woche_Label", "Anstoss_Epoch",
+)
+
+
+class Game:
+    """Ein Spiel mit den Spalten von ``df_all`` als Attribute.
+
+    Alle übrigen Spalten des Exports liegen in ``extra`` (Reihenfolge wie
+    ``source.columns``). Zeilenzugriffe wie ``game["#"]`` oder
+    ``game.get("Saison")`` verhalten sich wie bei einer DataFrame-Zeile.
+    """
+
+    __slots__ = GAME_COLUMNS + ("source", "extra")
+
+    def __getitem__(self, column: str):
+        if column in GAME_COLUMNS:
+            return getattr(self, column)
+        pos = self.source.position.get(column)
+        if pos is None:
+            if column in self.source.all_columns:
+                return NA
+            raise KeyError(column)
+        return self.extra[pos]
+
+    def get(self, column: str, default=None):
+        try:
+            return self[column]
+        except KeyError:
+            return default
+
+    def set_kickoff(self) -> None:
+        """Datum_DT, Tag, Woche, ``Uhrzeit`` (``HH:MM``) und Anstoss_Epoch wie ``add_calendar_columns``."""
+
+        day = None
+        if not is_na(self.Datum):
+            try:
+                day = datetime.strptime(str(self.Datum).strip(), "%d.%m.%Y").date()
+            except ValueError:
+                pass
+        self.Uhrzeit = format_uhrzeit(self.Uhrzeit)
+        self.Datum_DT = day
+        if day is None:
+            self.Tag, self.Woche_Start, self.Woche_Label = "", None, ""
+            self.Anstoss_Epoch = EPOCH_UNBEKANNT
+            return
+
+        start = day - timedelta(days=day.weekday())
+        self.Tag = WOCHENTAGE[day.weekday()]
+        self.Woche_Start = start
+        self.Woche_Label = f"Mo {start:%d.%m.%Y} – So {start + timedelta(days=6):%d.%m.%Y}"
+        if self.Uhrzeit == "???":
+            seconds = 24 * 3600 - 1
+        else:
+            hours, minutes = self.Uhrzeit.split(":")
+            seconds = int(hours) * 3600 + int(minutes) * 60
+        self.Anstoss_Epoch = berlin_epoch(datetime(day.year, day.month, day.day) + timedelta(seconds=seconds))
+
+
+def format_uhrzeit(value) -> str:
+    """``HH:MM`` aus ``HH:MM:SS`` oder ``HH:MM``; sonst ``???``."""
+
+    if is_na(value):
+        return "???"
+    text = str(value).strip()
+    for fmt in ("%H:%M:%S", "%H:%M"):
+        try:
+            return datetime.strptime(text, fmt).strftime("%H:%M")
+        except ValueError:
+            pass
+    return "???"
+
+
+def berlin_epoch(local: datetime) -> int:
+    """Unix-Zeit einer Berliner Ortszeit wie ``tz_localize(ambiguous=False, nonexistent="shift_forward")``.
+
+    Doppelte Stunde (Oktober): Winterzeit. Ausgefallene Stunde (März): Ende der Lücke.
+    """
+
+    while True:
+        # fold=1: bei doppelter Zeit die zweite (Winterzeit); ausgefallene Zeiten überstehen den Umweg über UTC nicht
+        aware = local.replace(tzinfo=BERLIN, fold=1)
+        if datetime.fromtimestamp(aware.timestamp(), BERLIN).replace(tzinfo=None) == local:
+            return int(aware.timestamp())
+        local += timedelta(minutes=1)
+
+
+def _score(row: list, pos: dict[str, int], kinds: dict[str, str], col: str) -> tuple[float, bool, str | None]:
+    """Zahl, vorhanden?, Text (nur bei Textspalten) – wie ``usc_games._score_values``."""
+
+    if col in pos and kinds[col] in ("int", "float"):
+        value = row[pos[col]]
+        return (NA if is_na(value) else float(value)), not is_na(value), None
+
+    value = row[pos[col]] if col in pos else NA
+    text = "" if is_na(value) else str(value).strip()
+    number = float(text) if _FLOAT.fullmatch(text) else NA
+    return number, text != "", text
+
+
+def _score_pair(row: list, pos: dict[str, int], kinds: dict[str, str], left_col: str, right_col: str) -> tuple[str, bool]:
+    left, has_left, left_text = _score(row, pos, kinds, left_col)
+    right, has_right, right_text = _score(row, pos, kinds, right_col)
+    present = has_left and has_right
+    if math.isfinite(left) and math.isfinite(right):
+        return f"{int(left)}:{int(right)}", present
+    if present:
+        left_text = left_text if left_text is not None else str(row[pos[left_col]]).strip()
+        right_text = right_text if right_text is not None else str(row[pos[right_col]]).strip()
+        return f"{left_text}:{right_text}", present
+    return "", present
+
+
+def format_result(row: list, pos: dict[str, int], kinds: dict[str, str]) -> str:
+    """Ergebnis einer Zeile wie ``usc_games.format_results``, z. B. ``3:1 (25:20, 23:25, ...)``."""
+
+    if "Satzpunkte 1" in pos and "Satzpunkte 2" in pos:
+        ergebnis, has_result = _score_pair(row, pos, kinds, "Satzpunkte 1", "Satzpunkte 2")
+    else:
+        _, has_result, ergebnis = _score(row, pos, {**kinds, "Satzpunkte": "str"}, "Satzpunkte")
+    if not has_result:
+        return ""
+    saetze = [satz for satz, has_satz in (_score_pair(row, pos, kinds, l, r) for l, r in SATZSPALTEN) if has_satz]
+    return f"{ergebnis} ({', '.join(saetze)})" if saetze else ergebnis
+
+
+def normalize_source(source: Source, file: str, team_code: str | None) -> Source | None:
+    """Wie ``usc_games.normalize_source``: nur USC-Spiele, Namen gekürzt, Ergebnis formatiert.
+
+    Gibt die Quelle mit den Spalten von ``df_all`` zurück (``rows`` enthält nur
+    noch die USC-Spiele); ``None``, wenn Pflichtspalten fehlen.
+    """
+
+    columns = [RENAME_MAP.get(col, col) for col in source.columns]
+    kinds = dict(zip(columns, source.kinds))
+    rows = [list(row) for row in source.rows]
+
+    def set_column(col: str, values: list) -> None:
+        if col not in columns:
+            columns.append(col)
+            for row in rows:
+                row.append(None)
+        i = columns.index(col)
+        for row, value in zip(rows, values):
+            row[i] = value
+        kinds[col] = "str"
+
+    if "Datum_Uhrzeit" in columns and ("Datum" not in columns or "Uhrzeit" not in columns):
+        # Beispielwert: "20.09.2025, 15:00:00"; fehlende Werte bleiben fehlend (astype(str) ab pandas 3)
+        i = columns.index("Datum_Uhrzeit")
+        parts = [NA if is_na(row[i]) else str(row[i]).split(",", 1) for row in rows]
+        set_column("Datum", [NA if is_na(p) else p[0].strip() for p in parts])
+        set_column("Uhrzeit", [NA if is_na(p) else p[1].strip() if len(p) > 1 else "" for p in parts])
+
+    missing = {"Datum", "Uhrzeit", "Heim", "Gast"} - set(columns)
+    if missing:
+        print(f"⚠️ CSV übersprungen ({file}): fehlende Spalten {missing}")
+        return None
+
+    for col in NAME_COLUMNS + ["Ergebnis"]:
+        if col not in columns:
+            set_column(col, [""] * len(rows))
+
+    pos = {col: i for i, col in enumerate(columns)}
+    search = [pos.get(col) for col in USC_SEARCH_FIELDS]
+    rows = [
+        row for row in rows
+        if re.search(USC_PATTERN, " ".join("" if i is None else normalize_search_text(row[i]) for i in search))
+    ]
+
+    teams = [
+        get_usc_team({col: row[pos[col]] for col in ("Heim", "Gast", "SR", "Gastgeber")}, file, team_code)
+        for row in rows
+    ]
+    set_column("USC_Team", teams)
+    for col in NAME_COLUMNS:
+        i = pos[col]
+        set_column(col, [replace_usc_names(row[i], team) for row, team in zip(rows, teams)])
+
+    if {"Satzpunkte 1", "Satzpunkte 2"} <= set(columns) or "Satzpunkte" in columns:
+        set_column("Ergebnis", [format_result(row, pos, kinds) for row in rows])
+
+    # Ergebnis-Spalte direkt hinter Gastgeber einsortieren
+    order = [col for col in columns if col != "Ergebnis"]
+    order.insert(order.index("Gastgeber") + 1, "Ergebnis")
+    index = [columns.index(col) for col in order]
+    return Source(source.name, order, [kinds[col] for col in order], [[row[i] for i in index] for row in rows])
+
+
+def _games(source: Source, all_columns: frozenset[str], upcast: set[str]) -> list[Game]:
+    """Spiele einer normalisierten Quelle; die übrigen Exportspalten landen in ``extra``.
+
+    Spalten in ``upcast`` werden zu Kommazahlen (Typ nach ``concat``).
+    """
+
+    own = [i for i, col in enumerate(source.columns) if col in GAME_COLUMNS]
+    rest = [i for i, col in enumerate(source.columns) if col not in GAME_COLUMNS]
+    extra_source = Source(
+        source.name, [source.columns[i] for i in rest], [source.kinds[i] for i in rest], [], all_columns
+    )
+    to_float = {i for i in rest if source.columns[i] in upcast}
+
+    games = []
+    for row in source.rows:
+        game = Game()
+        for i in own:
+            setattr(game, source.columns[i], row[i])
+        for col in ("Heim", "Gast", "SR", "Gastgeber"):
+            setattr(game, col, _USC_SUFFIX.sub(r"\1", str(getattr(game, col))))
+        game.source = extra_source
+        game.extra = tuple(float(row[i]) if i in to_float and not is_na(row[i]) else row[i] for i in rest)
+        game.set_kickoff()
+        games.append(game)
+    return games
+
+
+def _combined_kind(kinds: set[str], missing: bool) -> str:
+    """Spaltentyp nach ``concat``: Ganzzahl + fehlend/Kommazahl → Kommazahl, sonst gemischt."""
+
+    if kinds == {"int"} and not missing:
+        return "int"
+    if kinds <= {"int", "float"}:
+        return "float"
+    return "object"
+
+
+@dataclass
+class Season:
+    """Alle USC-Spiele nach Anstoß sortiert und die Spalten von ``df_all``."""
+
+    games: list[Game]
+    columns: list[str]
+
+
+def combine_sources(sources: list[Source]) -> Season:
+    """Fügt die Quellen wie ``usc_games.finalize_games`` zusammen."""
+
+    if not sources:
+        raise RuntimeError("❌ Keine gültigen CSV-Daten gefunden – Abbruch")
+
+    columns: list[str] = []
+    kinds: dict[str, set[str]] = {}
+    for source in sources:
+        for col, kind in zip(source.columns, source.kinds):
+            if col not in kinds:
+                columns.append(col)
+                kinds[col] = set()
+            kinds[col].add(kind)
+
+    upcast = {
+        col for col in columns
+        if _combined_kind(kinds[col], any(col not in source.columns for source in sources)) == "float"
+    }
+    games = []
+    for source in sources:
+        games.extend(_games(source, frozenset(columns), upcast))
+
+    for col in ("Datum_DT", "Tag", "Woche_Start", "Woche_Ende", "Woche_Label", "Anstoss_Epoch"):
+        if col not in columns:
+            columns.append(col)
+    games.sort(key=lambda g: g.Anstoss_Epoch)
+    return Season(games, columns)
+
+
+def load_games(csv_dir: Path = CSV_DIR, config_path: Path = TEAM_SOURCES_PATH) -> Season:
+    """Liest und normalisiert alle konfigurierten Exporte (ohne Cache, ohne pandas)."""
+
+    sources = []
+    for file, team_code in get_csv_files(config_path):
+        path = csv_dir / file
+        if not path.exists():
+            print(f"⚠️ CSV fehlt, übersprungen: {path}")
+            continue
+        source = normalize_source(clean_source(read_source(path, ";")), file, team_code)
+        if source is not None:
+            sources.append(source)
+    season = combine_sources(sources)
+    print(f"📋 {len(season.games)} Spiele aus {len(sources)} Quellen aufbereitet")
+    return season
+
+
+def load_external_games() -> list[Game]:
+    """Heimspiele von Uni Baskets und Preußen wie ``usc_games.load_external_games``."""
+
+    games = []
+    for ext in EXTERNAL_SOURCES:
+        path = next((p for p in ext["dateien"] if p.exists()), None)
+        if path is None:
+            print(f"⚠️ Heimspiel-CSV fehlt, übersprungen: {ext['team']}")
+            continue
+
+        source = read_source(path, ",")
+        pos = source.position
+        uhrzeit = "Uhrzeit" if "Uhrzeit" in pos else "Startzeit"
+        gast = "Gast" if "Gast" in pos else "Gegner"
+        empty = Source(source.name, [], [], [])
+        for row in source.rows:
+            game = Game()
+            game.Datum = _stripped(row[pos["Datum"]])
+            game.Uhrzeit = _stripped(row[pos[uhrzeit]]) if uhrzeit in pos else ""
+            game.Heim = ext["heim"]
+            game.Gast = row[pos[gast]] if gast in pos else ""
+            game.SR, game.Gastgeber, game.Ergebnis = "", ext["gastgeber"], ""
+            game.Ort, game.Spielrunde, game.USC_Team = ext["ort"], ext["spielrunde"], ext["team"]
+            game.source, game.extra = empty, ()
+            game.set_kickoff()
+            games.append(game)
+    return games
+
+
+# --- Ausgaben ---------------------------------------------------------------
+
+
+class GameTable(TableData):
+    """:class:`TableData` über einer Liste von Spielen."""
+
+    def __init__(self, games: list[Game]) -> None:
+        self.games = games
+
+    @cached_property
+    def columns(self) -> list[list[str]]:
+        return [map_distinct(cell_text, [getattr(g, col) for g in self.games]) for col in COLUMNS_DISPLAY]
+
+    @cached_property
+    def teams(self) -> list[str]:
+        return map_distinct(cell_text, [g.USC_Team for g in self.games])
+
+    @cached_property
+    def week_keys(self) -> list[str]:
+        return [g.Woche_Start.isoformat() if g.Woche_Start else "" for g in self.games]
+
+    @cached_property
+    def day(self) -> list[int | None]:
+        epoch = date(1970, 1, 1).toordinal()
+        return [g.Datum_DT.toordinal() - epoch if g.Datum_DT else None for g in self.games]
+
+    @cached_property
+    def weeks(self) -> list[tuple[str, str]]:
+        labels = {g.Woche_Start: g.Woche_Label for g in self.games if g.Woche_Start}
+        return [(start.isoformat(), labels[start]) for start in sorted(labels)]
+
+
+def site_games(games: list[Game], now_epoch: int | None = None) -> list[Game]:
+    """Wie ``usc_spielplan.site_games``: ohne vergangene Spiele mit Ergebnis ohne USC-Beteiligung."""
+
+    if now_epoch is None:
+        now_epoch = int(time.time())
+    return [
+        g for g in games
+        if not (
+            (not isinstance(g.Ergebnis, str) or g.Ergebnis.strip() != "")
+            and g.Anstoss_Epoch < now_epoch
+            and "USC" not in g.Heim
+            and "USC" not in g.Gast
+        )
+    ]
+
+
+def trainer_games(games: list[Game], external: list[Game], now_epoch: int | None = None) -> list[Game]:
+    """Wie ``usc_baskets_preussen.trainer_games``: USC-Spiele plus künftige Heimspiele der anderen Vereine."""
+
+    if now_epoch is None:
+        now_epoch = int(time.time())
+    return [
+        g for g in sorted(games + external, key=lambda g: g.Anstoss_Epoch)
+        if (isinstance(g.Heim, str) and "USC" in g.Heim)
+        or (isinstance(g.Gast, str) and "USC" in g.Gast)
+        or g.Anstoss_Epoch >= now_epoch
+    ]
+
+
+def _csv_text(value) -> str:
+    if is_na(value):
+        return ""
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def write_csv(season: Season, csv_path: Path = CSV_PATH) -> None:
+    """Wie ``generate_csv.write_csv``: alle Spalten von ``df_all`` ohne die internen Hilfsspalten."""
+
+    columns = [col for col in season.columns if col not in HELPER_COLUMNS]
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    with csv_path.open("w", encoding="utf-8-sig", newline="") as fh:
+        writer = csv.writer(fh, delimiter=";", lineterminator="\n")
+        writer.writerow(columns)
+        for game in season.games:
+            writer.writerow([_csv_text(game[col]) for col in columns])
+    print(f"✅ CSV-Datei erfolgreich gespeichert unter: {csv_path.resolve()}")
+
+
+def compare_engines(csv_dir: Path = CSV_DIR, config_path: Path = TEAM_SOURCES_PATH) -> list[str]:
+    """Vergleicht beide Engines auf denselben Exporten; leere Liste = gleich.
+
+    Verglichen werden die geschriebene ``spielplan.csv`` (byteweise) und die
+    Termine aller ICS-Feeds. pandas wird nur hier geladen, ohne ``.cache/``
+    (der Gesamtdatensatz entsteht in einem temporären Verzeichnis neu).
+    """
+
+    import generate_csv
+    import usc_games
+
+    season = load_games(csv_dir, config_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        df_all = usc_games.load_games(csv_dir, tmp_dir / "cache", config_path)
+        write_csv(season, tmp_dir / "lite.csv")
+        generate_csv.write_csv(df_all, tmp_dir / "pandas.csv")
+        lite_lines = (tmp_dir / "lite.csv").read_bytes().splitlines()
+        pandas_lines = (tmp_dir / "pandas.csv").read_bytes().splitlines()
+
+    differences = []
+    if lite_lines != pandas_lines:
+        line = next(
+            (i for i, (a, b) in enumerate(zip(lite_lines, pandas_lines)) if a != b),
+            min(len(lite_lines), len(pandas_lines)),
+        )
+        differences.append(
+            f"spielplan.csv: {len(lite_lines)} statt {len(pandas_lines)} Zeilen, erste Abweichung in Zeile {line + 1}"
+        )
+    lite_events = build_events(season.games)
+    pandas_events = build_events(df_all.to_dict("records"))
+    if lite_events != pandas_events:
+        differing = sum(a != b for a, b in zip(lite_events, pandas_events))
+        differences.append(
+            f"ICS: {len(lite_events)} statt {len(pandas_events)} Termine, {differing} abweichend"
+        )
+    return differences
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Spielplan ohne pandas erzeugen (CSV, HTML, ICS in docs/)")
+    parser.add_argument("--csv-dir", type=Path, default=CSV_DIR, help=f"Verzeichnis der SAMS-Exporte (Standard {CSV_DIR})")
+    parser.add_argument(
+        "--check", action="store_true", help="nichts schreiben, nur mit dem pandas-Weg vergleichen (Exit-Code 1 bei Abweichung)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        differences = compare_engines(args.csv_dir)
+        for difference in differences:
+            print(f"❌ {difference}")
+        if differences:
+            raise SystemExit(1)
+        print("✅ Beide Engines liefern dieselbe CSV und dieselben Termine")
+        return
+
+    start = time.perf_counter()
+    stand = stand_now()
+    season = load_games(args.csv_dir)
+
+    write_csv(season)
+    write_pages(GameTable(trainer_games(season.games, load_external_games())), [TRAINER], stand)
+    write_shards(write_pages(GameTable(site_games(season.games)), [INDEX, APP], stand), stand)
+    write_calendars(season.games)
+    print(f"✅ Spielplan ohne pandas erzeugt ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
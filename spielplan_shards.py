@@ -0,0 +1,209 @@
+"""Kleine Auszüge des Spielplans je Team, Münsteraner Halle und Kalenderwoche.
+
+Jeder Auszug besteht aus einer schlanken HTML-Seite ohne Filter und einer
+JSON-Datei mit denselben Zeilen. Beides entsteht aus der :class:`TableData`
+der Hauptseite, also aus bereits gerenderten Zeilen und dem Filterindex.
+``docs/shards/index.html`` bzw. ``index.json`` listen alle Auszüge auf.
+"""
+from __future__ import annotations
+
+import html
+import json
+import re
+import shutil
+import unicodedata
+from pathlib import Path
+
+from icon_assets import icon_links
+from spielplan_html import COLUMNS_DISPLAY, DOCS_DIR, TableData, compile_template, render_template, table_header
+from usc_team_links import USC_TEAM_TABLE_INFO
+
+SHARD_DIR_NAME = "shards"
+
+SHARD_TEMPLATE = """<!doctype html>
+<html lang="de">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>@@title@@ – USC Münster Spielplan 2025/26</title>
+  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
+  <style>
+    body { font-size: 0.7rem; }
+    h1 { font-size: 1.2rem; margin-bottom: 0.5rem; }
+    th, td { white-space: nowrap; }
+    thead th { background-color: #f2f2f2 !important; color: #000; }
+  </style>
+  @@icon_links@@
+  <meta name="theme-color" content="#008000">
+</head>
+<body class="p-3">
+  <div class="container">
+    <h1>@@title@@</h1>
+    <p class="text-muted">Stand: @@stand@@ Uhr · @@count@@ Spiele</p>
+    @@body@@
+    <p class="mt-3">
+      <a class="btn btn-sm btn-outline-secondary" href="index.html">Alle Auszüge</a>
+      <a class="btn btn-sm btn-outline-secondary" href="../index.html">Gesamter Spielplan</a>
+      @@json_link@@
+    </p>
+  </div>
+</body>
+</html>
+"""
+
+_SHARD_PAGE = compile_template(SHARD_TEMPLATE)
+
+KINDS = {
+    "team": "Teams",
+    "ort": "Hallen in Münster",
+    "woche": "Wochen",
+}
+
+
+def slugify(text: str) -> str:
+    """Dateinamentauglicher Schlüssel (``Sporthalle Berg Fidel`` → ``sporthalle-berg-fidel``)."""
+
+    ascii_text = unicodedata.normalize("NFKD", text.replace("ß", "ss")).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_text.lower()).strip("-") or "ohne-name"
+
+
+def _week_title(labels: dict[str, str], week: str) -> str:
+    label = labels.get(week, "")
+    return f"Woche {label}" if label else f"Woche ab {week}"
+
+
+def shard_definitions(table: TableData) -> list[dict]:
+    """Alle Auszüge als (Art, Schlüssel, Titel, Zeilennummern)."""
+
+    index = table.index
+    shards = []
+    for code in sorted(USC_TEAM_TABLE_INFO, key=lambda c: USC_TEAM_TABLE_INFO[c].get("order", 999)):
+        league = USC_TEAM_TABLE_INFO[code].get("league", "")
+        title = f"{code} – {league}" if league else code
+        shards.append({"typ": "team", "schluessel": code, "titel": title, "ids": index["team"].get(code, [])})
+
+    used: set[str] = set()
+    for ort, ids in index["ort"].items():
+        if "münster" not in ort.lower():
+            continue
+        base = slug = slugify(ort)
+        counter = 2
+        while slug in used:
+            slug = f"{base}-{counter}"
+            counter += 1
+        used.add(slug)
+        shards.append({"typ": "ort", "schluessel": slug, "titel": ort, "ids": ids})
+
+    labels = dict(table.weeks)
+    for week, ids in index["week"].items():
+        shards.append({"typ": "woche", "schluessel": week, "titel": _week_title(labels, week), "ids": ids})
+    return shards
+
+
+def _file_stem(shard: dict) -> str:
+    return f"{shard['typ']}-{shard['schluessel']}"
+
+
+def _feed_link(table: TableData, shard: dict) -> str:
+    """Link auf den passenden ICS-Feed (nur Teams, siehe ``usc_spielplan_ics.py``).
+
+    ``group_feeds`` schreibt einen Team-Feed nur, wenn das Team mindestens ein
+    Spiel mit Datum hat; ohne solche Spiele entfällt der Link (sonst 404).
+    """
+
+    if shard["typ"] != "team" or all(table.day[i] is None for i in shard["ids"]):
+        return ""
+    return f'\n      <a class="btn btn-sm btn-outline-success" href="../ics/team-{shard["schluessel"]}.ics">📅 Kalender (ICS)</a>'
+
+
+def render_shard_page(table: TableData, shard: dict, stand: str) -> str:
+    ids = shard["ids"]
+    if ids:
+        body = (
+            '<div class="table-responsive">\n'
+            '      <table class="table table-bordered">\n'
+            f"        <thead><tr>{table_header()}</tr></thead>\n"
+            "        <tbody>\n"
+            + "\n".join(table.row_html[i] for i in ids)
+            + "\n        </tbody>\n"
+            "      </table>\n"
+            "    </div>"
+        )
+    else:
+        body = '<p class="text-muted">Keine Spiele.</p>'
+    return render_template(
+        {
+            "title": html.escape(shard["titel"]),
+            "stand": stand,
+            "count": str(len(ids)),
+            "body": body,
+            "icon_links": icon_links("../"),
+            "json_link": f'<a class="btn btn-sm btn-outline-success" href="{_file_stem(shard)}.json">JSON</a>'
+            + _feed_link(table, shard),
+        },
+        _SHARD_PAGE,
+    )
+
+
+def render_shard_json(table: TableData, shard: dict, stand: str) -> str:
+    data = {
+        "titel": shard["titel"],
+        "stand": stand,
+        "spalten": COLUMNS_DISPLAY,
+        "zeilen": [table.cells[i] for i in shard["ids"]],
+        "tag": [table.day[i] for i in shard["ids"]],
+    }
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_shard_index(entries: list[dict], stand: str, total: int) -> str:
+    sections = []
+    for kind, heading in KINDS.items():
+        items = "\n".join(
+            f'      <li><a href="{e["html"]}">{html.escape(e["titel"])}</a>'
+            f' <span class="text-muted">({e["spiele"]})</span></li>'
+            for e in entries
+            if e["typ"] == kind
+        )
+        sections.append(f'<h2 class="h6 mt-3">{heading}</h2>\n    <ul>\n{items}\n    </ul>')
+    return render_template(
+        {
+            "title": "Auszüge",
+            "stand": stand,
+            "count": str(total),
+            "body": "\n    ".join(sections),
+            "icon_links": icon_links("../"),
+            "json_link": '<a class="btn btn-sm btn-outline-success" href="index.json">JSON</a>',
+        },
+        _SHARD_PAGE,
+    )
+
+
+def write_shards(table: TableData, stand: str, docs_dir: Path = DOCS_DIR) -> None:
+    """Schreibt alle Auszüge samt Übersicht nach ``docs/shards/`` (vorher geleert)."""
+
+    shard_dir = docs_dir / SHARD_DIR_NAME
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    shard_dir.mkdir(parents=True)
+
+    entries = []
+    for shard in shard_definitions(table):
+        stem = _file_stem(shard)
+        (shard_dir / f"{stem}.html").write_text(render_shard_page(table, shard, stand), encoding="utf-8")
+        (shard_dir / f"{stem}.json").write_text(render_shard_json(table, shard, stand), encoding="utf-8")
+        entries.append(
+            {
+                "typ": shard["typ"],
+                "schluessel": shard["schluessel"],
+                "titel": shard["titel"],
+                "spiele": len(shard["ids"]),
+                "html": f"{stem}.html",
+                "json": f"{stem}.json",
+            }
+        )
+
+    (shard_dir / "index.json").write_text(
+        json.dumps({"stand": stand, "auszuege": entries}, ensure_ascii=False, indent=1), encoding="utf-8"
+    )
+    (shard_dir / "index.html").write_text(render_shard_index(entries, stand, len(table)), encoding="utf-8")
+    print(f"✅ {len(entries)} Auszüge (Teams, Hallen, Wochen) in {shard_dir} erstellt.")
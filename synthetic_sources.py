@@ -0,0 +1,503 @@
+"""Erzeugt synthetische SAMS-Exporte und Vereinskalender für Last- und Skalierungstests.
+
+Aus einem Startwert (``seed``) entsteht reproduzierbar ein Verzeichnisbaum
+wie im Repository:
+
+- ``csvdata/Spielplan_<Liga>.csv`` – SAMS-Exporte mit der Spalte
+  ``Datum und Uhrzeit``, Satzspalten (3 Sätze in der Jugend, 5 bei den
+  Erwachsenen), Bundesliga-Zuschauerzahl und Playoff-Layout, Windows-1252
+  mit abschließendem ``;`` und CRLF wie bei SAMS.
+- ``config/team_sources.csv`` und ``config/ics_sources.csv`` passend zu den
+  erzeugten Dateien; die Links zeigen auf ``127.0.0.1`` (siehe
+  ``SPIELPLAN_BASE_URL`` in ``source_downloader.py``).
+- ``csv_Baskets/Baskets_2526.ics`` und ``csv_Baskets/Preussen_2526.ics`` im
+  Stil der echten Feeds (lokale Zeiten bzw. ``TZID``, gefaltete Zeilen,
+  unsichere und ganztägige Termine bei Preußen).
+- ein leeres ``docs/`` als Ziel der Generatoren.
+
+Jede Liga hat ein USC-Team (``USC Münster``, ``USC Münster II`` … ``VIII``,
+Jugendteams mit Code-Umschreibung); die beiden Ligen mit zwei USC-Teams
+tragen die Dateinamen, die ``get_usc_team`` kennt. Ein kleiner Teil der
+Dateien ist UTF-8 oder enthält Ersatzzeichen (``M�nster``), einzelne
+Gegner- und Hallennamen sind doppelt kodiert (``MÃ¼nster``), einzelne
+Spiele haben noch kein Datum.
+
+Aufruf::
+
+    python synthetic_sources.py /tmp/spielplan-last --leagues 300 --seed 1
+    cd /tmp/spielplan-last && PYTHONPATH=<repo> python <repo>/build.py --skip download,icons,publish
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from usc_names import USC_NAME_TABLE, USC_TEAM_REMAP
+
+LEAGUES = 300
+TEAMS = 10
+SEED = 1
+SEASON = 2025
+ICS_EVENTS = 40
+
+WOCHENTAGE = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+
+# Ligen mit zwei USC-Teams: Dateiname wie in get_usc_team, Teams als Namen
+TWO_TEAM_LEAGUES = [
+    ("Bezirksklasse 26 Frauen", "Spielplan_Bezirksklasse_26_Frauen.csv", "USC5/USC6", "BK"),
+    ("Kreisliga Münster Frauen", "Spielplan_Kreisliga_Muenster_Frauen.csv", "USC7/USC8", "KL"),
+]
+ADULT_TIERS = [
+    ("Regionalliga {n} Frauen", "RL"),
+    ("Oberliga {n} Frauen", "OL"),
+    ("Verbandsliga {n} Frauen", "VL"),
+    ("Landesliga {n} Frauen", "LL"),
+    ("Bezirksliga {n} Frauen", "BL"),
+    ("Bezirksklasse {n} Frauen", "BK"),
+    ("Kreisliga {n} Frauen", "KL"),
+    ("Oberliga {n} Männer", "OLM"),
+]
+YOUTH_TIERS = [
+    ("NRW-Liga {n} {age}", "NRW"),
+    ("Oberliga {n} {age}", "OL"),
+]
+YOUTH_AGES = {"USC-U18": "wU18", "USC-U16-1": "wU16", "USC-U16-2": "wU16", "USC-U14-1": "wU14", "USC-U14-2": "wU14", "USC-U13": "wU13"}
+
+CLUB_PREFIXES = ["TV", "SV", "VfL", "TuS", "SC", "DJK", "BSV", "VC", "SG", "TSV", "RC", "SuS", "Blau-Weiß", "Grün-Weiß", "Union"]
+CITIES = [
+    ("Münster", "481"), ("Köln", "506"), ("Düsseldorf", "402"), ("Lüdinghausen", "593"), ("Gütersloh", "333"),
+    ("Bösensell", "483"), ("Mülheim", "454"), ("Lünen", "445"), ("Göttingen", "370"), ("Rheine", "484"),
+    ("Telgte", "482"), ("Bocholt", "463"), ("Hamm", "590"), ("Warendorf", "482"), ("Greven", "482"),
+    ("Emsdetten", "482"), ("Coesfeld", "486"), ("Dülmen", "482"), ("Ahlen", "592"), ("Beckum", "592"),
+    ("Bielefeld", "336"), ("Paderborn", "331"), ("Dortmund", "441"), ("Bochum", "447"), ("Gelsenkirchen", "458"),
+    ("Essen", "451"), ("Recklinghausen", "456"), ("Borken", "463"), ("Steinfurt", "485"), ("Ibbenbüren", "494"),
+    ("Osnabrück", "490"), ("Lübbecke", "323"), ("Höxter", "378"), ("Sendenhorst", "483"), ("Nottuln", "483"),
+]
+HALLS = ["Sporthalle Nord", "Dreifachhalle am See", "Kreissporthalle", "Sporthalle der Gesamtschule", "Mehrzweckhalle", "Großsporthalle", "Sporthalle Süd"]
+USC_HALLS = ["Sporthalle Berg Fidel (48153 Münster)", "Halle Sentruper Höhe (48149 Münster)", "Sporthalle Ost (48145 Münster)"]
+USC_VEREIN = "USC Münster e.V."
+SLOTS = [f"{h:02d}:{m:02d}" for h in range(11, 20) for m in (0, 15, 30)]
+
+BASKETS_OPPONENTS = ["Artland Dragons", "Eisbären Bremerhaven", "Phoenix Hagen", "Gladiators Trier", "Tigers Tübingen", "Kirchheim Knights", "Nürnberg Falcons", "Bayer Giants Leverkusen"]
+PREUSSEN_OPPONENTS = ["1. FC Magdeburg", "Hertha BSC", "FC Schalke 04", "Fortuna Düsseldorf", "Hannover 96", "1. FC Nürnberg", "SC Paderborn 07", "Karlsruher SC", "Eintracht Braunschweig", "SpVgg Greuther Fürth"]
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    leagues: int = LEAGUES
+    teams: int = TEAMS
+    seed: int = SEED
+    # Saisonbeginn im September dieses Jahres (Saison 2025/26 → 2025)
+    season: int = SEASON
+    # Spiele vor diesem Tag haben ein Ergebnis (Standard: Mitte der Saison)
+    played_until: date | None = None
+    ics_events: int = ICS_EVENTS
+    utf8_share: float = 0.05
+    ersatz_share: float = 0.02
+    mojibake_share: float = 0.02
+    undated_share: float = 0.005
+
+    @property
+    def result_cutoff(self) -> date:
+        return self.played_until or date(self.season + 1, 1, 15)
+
+
+@dataclass
+class Team:
+    name: str
+    verein: str
+    ort: str
+
+
+@dataclass
+class League:
+    name: str
+    file: str
+    team_code: str
+    wettbewerb: str
+    usc_names: list[str]
+    youth: bool = False
+    bundesliga: bool = False
+    playoff: bool = False
+    # "cp1252", "utf8" oder "ersatz" (Umlaute als U+FFFD)
+    encoding: str = "cp1252"
+    teams: list[Team] = field(default_factory=list)
+
+
+def usc_team_name(code: str) -> str:
+    """``USC3`` → ``USC Münster III``; Jugendteams über den Code vor der Umschreibung."""
+
+    code = USC_TEAM_REMAP.get(code, (code, code))[0]
+    return next(name for name, short in USC_NAME_TABLE if short == code)
+
+
+def double_encoded(text: str) -> str:
+    """UTF-8-Bytes als Windows-1252 gelesen (``Münster`` → ``MÃ¼nster``)."""
+
+    return text.encode("utf-8").decode("cp1252", errors="replace")
+
+
+def _club_pool(rng: random.Random, count: int) -> list[Team]:
+    teams = []
+    names = set()
+    while len(teams) < count:
+        prefix = rng.choice(CLUB_PREFIXES)
+        city, plz = rng.choice(CITIES)
+        club = f"{prefix} {city}"
+        if club in names or city == "Münster" and prefix == "USC":
+            continue
+        names.add(club)
+        founded = rng.randint(1880, 1990)
+        ort = f"{rng.choice(HALLS)} ({plz}{rng.randint(10, 99)} {city})"
+        teams.append(Team(club, f"{club} {founded} e.V.", ort))
+        # Zweite Mannschaften desselben Vereins
+        if rng.random() < 0.2 and len(teams) < count:
+            teams.append(Team(f"{club} II", teams[-1].verein, ort))
+    return teams
+
+
+def plan_leagues(config: SyntheticConfig, rng: random.Random) -> list[League]:
+    """Ligen mit Namen, Dateinamen, USC-Teams und Kodierung."""
+
+    adult_codes = [name for _, name in USC_NAME_TABLE if name not in ("USC5", "USC6", "USC7", "USC8")]
+    youth_codes = list(USC_TEAM_REMAP)
+    leagues: list[League] = []
+
+    for name, file, code, short in TWO_TEAM_LEAGUES[: config.leagues]:
+        names = [usc_team_name(part) for part in code.split("/")]
+        leagues.append(League(name, file, code, short, names))
+
+    n = 0
+    while len(leagues) < config.leagues:
+        n += 1
+        if n % 3 == 0:
+            code = youth_codes[n // 3 % len(youth_codes)]
+            pattern, short = YOUTH_TIERS[n // 3 % len(YOUTH_TIERS)]
+            name = pattern.format(n=n, age=YOUTH_AGES[code])
+            league = League(name, "", code, f"{short}{n}", [usc_team_name(code)], youth=True)
+        elif n % 50 == 1:
+            code = "USC1"
+            playoff = n % 100 == 51
+            name = f"1. Bundesliga Frauen {n}" + (" Playoff" if playoff else "")
+            league = League(name, "", code, f"VBL{n}", [usc_team_name(code)], bundesliga=True, playoff=playoff)
+        else:
+            code = adult_codes[n % len(adult_codes)]
+            pattern, short = ADULT_TIERS[n % len(ADULT_TIERS)]
+            league = League(pattern.format(n=n), "", code, f"{short}{n}", [usc_team_name(code)])
+        league.file = f"Spielplan_{league.name.replace(' ', '_').replace('ü', 'ue').replace('ä', 'ae')}.csv"
+        roll = rng.random()
+        if roll < config.ersatz_share:
+            league.encoding = "ersatz"
+        elif roll < config.ersatz_share + config.utf8_share:
+            league.encoding = "utf8"
+        leagues.append(league)
+    return leagues
+
+
+def season_start(season: int) -> date:
+    """Erster Samstag im September."""
+
+    start = date(season, 9, 1)
+    return start + timedelta(days=(5 - start.weekday()) % 7)
+
+
+def round_robin(count: int) -> list[list[tuple[int, int]]]:
+    """Hin- und Rückrunde nach dem Kreisverfahren (Indizes der Teams)."""
+
+    idx = list(range(count)) + ([-1] if count % 2 else [])
+    half = len(idx) // 2
+    rounds = []
+    for r in range(len(idx) - 1):
+        pairs = [(idx[i], idx[-1 - i]) for i in range(half)]
+        rounds.append([(a, b) if r % 2 == 0 else (b, a) for a, b in pairs if -1 not in (a, b)])
+        idx = [idx[0], idx[-1]] + idx[1:-1]
+    return rounds + [[(b, a) for a, b in pairs] for pairs in rounds]
+
+
+def _round_date(start: date, r: int) -> date:
+    day = start + timedelta(weeks=r)
+    # Keine Spieltage über Weihnachten und Neujahr
+    if (day.month == 12 and day.day >= 20) or (day.month == 1 and day.day <= 5):
+        day += timedelta(weeks=3)
+    return day
+
+
+def play_sets(rng: random.Random, best_of: int) -> list[tuple[int, int]]:
+    """Satzergebnisse bis zum Sieg; Entscheidungssatz bis 15, Verlängerung mit zwei Punkten Abstand."""
+
+    need = best_of // 2 + 1
+    won = [0, 0]
+    sets = []
+    favourite = rng.random()
+    while max(won) < need:
+        target = 15 if len(sets) == best_of - 1 else 25
+        winner = 0 if rng.random() < 0.35 + 0.3 * favourite else 1
+        loser_points = rng.randint(target // 3, target - 2)
+        if rng.random() < 0.12:
+            loser_points = target - 1 + rng.randint(0, 4)
+        points = (max(target, loser_points + 2), loser_points)
+        sets.append(points if winner == 0 else points[::-1])
+        won[winner] += 1
+    return sets
+
+
+def header(league: League) -> list[str]:
+    cols = ["Datum und Uhrzeit", "Wochentag"]
+    cols += ["Gruppen-Ebene", "Spielgruppe", "#", "Spielfeld", "Feldrunde"] if league.playoff else ["#", "ST"]
+    cols += [
+        "Mannschaft 1", "Mannschaft 1: Verein", "Mannschaft 2", "Mannschaft 2: Verein",
+        "Schiedsgericht", "Schiedsgericht: Verein", "Gastgeber", "Gastgeber: Verein",
+        "Austragungsort/Ergebnis", "Austragungsort", "Ergebnis", "Saison", "Spielrunde",
+        "Geschlecht", "Ballpunkte", "Spieldauer",
+    ]
+    if league.bundesliga:
+        cols.append("Zuschauerzahl")
+    cols += ["Satzpunkte 1", "Satzpunkte 2"]
+    for n in range(1, (3 if league.youth else 5) + 1):
+        cols += [f"Satz {n} - Ballpunkte 1", f"Satz {n} - Ballpunkte 2", f"Satz {n} - Satzdauer"]
+    return cols
+
+
+def league_rows(league: League, config: SyntheticConfig, rng: random.Random) -> list[dict[str, str]]:
+    """Alle Spiele einer Liga als Zeilen (Spaltenname → Text)."""
+
+    start = season_start(config.season)
+    saison = f"{config.season}/{(config.season + 1) % 100:02d}"
+    best_of = 3 if league.youth else 5
+    teams = league.teams
+    rows = []
+    number = 0
+    for r, pairs in enumerate(round_robin(len(teams))):
+        saturday = _round_date(start, r)
+        for home, away in pairs:
+            number += 1
+            heim, gast = teams[home], teams[away]
+            others = [t for i, t in enumerate(teams) if i not in (home, away)]
+            sr = rng.choice(others) if others and rng.random() < 0.6 else None
+            day = saturday + timedelta(days=1 if rng.random() < (0.6 if league.youth else 0.3) else 0)
+            row = {
+                "Datum und Uhrzeit": f"{day:%d.%m.%Y}, {rng.choice(SLOTS)}:00",
+                "Wochentag": WOCHENTAGE[day.weekday()],
+                "#": str(number),
+                "ST": f"Spieltag {r + 1}",
+                "Gruppen-Ebene": "2",
+                "Spielgruppe": f"Viertelfinale Playoff {r + 1}",
+                "Spielfeld": "",
+                "Feldrunde": "-",
+                "Mannschaft 1": heim.name, "Mannschaft 1: Verein": heim.verein,
+                "Mannschaft 2": gast.name, "Mannschaft 2: Verein": gast.verein,
+                "Schiedsgericht": sr.name if sr else "-", "Schiedsgericht: Verein": sr.verein if sr else "",
+                "Gastgeber": heim.name, "Gastgeber: Verein": heim.verein,
+                "Austragungsort": heim.ort,
+                "Saison": saison,
+                "Spielrunde": league.name,
+                "Geschlecht": "weiblich" if "Männer" not in league.name else "männlich",
+            }
+            if rng.random() < config.undated_share:
+                row["Datum und Uhrzeit"], row["Wochentag"] = "", ""
+            elif day < config.result_cutoff:
+                sets = play_sets(rng, best_of)
+                won = (sum(a > b for a, b in sets), sum(b > a for a, b in sets))
+                balls = (sum(a for a, _ in sets), sum(b for _, b in sets))
+                ergebnis = f"{won[0]}:{won[1]} / {balls[0]}:{balls[1]}"
+                row.update({
+                    "Ergebnis": ergebnis,
+                    "Ballpunkte": f"{balls[0]}:{balls[1]}",
+                    "Spieldauer": str(sum(rng.randint(18, 32) for _ in sets)),
+                    "Satzpunkte 1": str(won[0]), "Satzpunkte 2": str(won[1]),
+                })
+                if league.bundesliga:
+                    row["Zuschauerzahl"] = str(rng.randint(300, 3000))
+                for n, (a, b) in enumerate(sets, start=1):
+                    row[f"Satz {n} - Ballpunkte 1"], row[f"Satz {n} - Ballpunkte 2"] = str(a), str(b)
+                    row[f"Satz {n} - Satzdauer"] = str(rng.randint(18, 32))
+            row["Austragungsort/Ergebnis"] = row.get("Ergebnis") or heim.ort
+            rows.append(row)
+    return rows
+
+
+def render_sams(league: League, rows: list[dict[str, str]]) -> bytes:
+    """SAMS-Layout: alle Felder in Anführungszeichen, ``;`` am Zeilenende, leere Satzfelder abgeschnitten."""
+
+    cols = header(league)
+    keep = cols.index("Geschlecht") + 1
+    lines = [";".join(f'"{c}"' for c in cols) + ";"]
+    for row in rows:
+        values = [row.get(c, "") for c in cols]
+        while len(values) > keep and values[-1] == "":
+            values.pop()
+        lines.append(";".join(f'"{v}"' for v in values) + ";")
+    text = "\r\n".join(lines) + "\r\n"
+
+    if league.encoding == "cp1252":
+        return text.encode("cp1252")
+    if league.encoding == "ersatz":
+        # Windows-1252-Bytes als UTF-8 gelesen: Umlaute werden zum Ersatzzeichen
+        text = text.encode("cp1252").decode("utf-8", errors="replace")
+    return text.encode("utf-8")
+
+
+def fill_teams(league: League, pool: list[Team], config: SyntheticConfig, rng: random.Random) -> None:
+    opponents = rng.sample(pool, max(config.teams - len(league.usc_names), 1))
+    usc = [Team(name, USC_VEREIN, rng.choice(USC_HALLS)) for name in league.usc_names]
+    if league.encoding == "cp1252":
+        opponents = [
+            Team(double_encoded(t.name), t.verein, double_encoded(t.ort)) if rng.random() < config.mojibake_share else t
+            for t in opponents
+        ]
+    league.teams = usc + opponents
+    rng.shuffle(league.teams)
+
+
+def _fold(line: str) -> list[str]:
+    """Faltet nach RFC 5545 bei 75 Bytes, ohne UTF-8-Zeichen zu trennen."""
+
+    parts, current, size = [], "", 0
+    for ch in line:
+        width = len(ch.encode("utf-8"))
+        if size + width > 75:
+            parts.append(current)
+            current, size = " ", 1
+        current += ch
+        size += width
+    return parts + [current]
+
+
+def _ics(lines: list[str]) -> str:
+    return "".join(part + "\n" for line in lines for part in _fold(line))
+
+
+def baskets_ics(config: SyntheticConfig, rng: random.Random) -> str:
+    """Kalender im Stil der ProA-Feeds: lokale Zeiten ohne Zeitzone, abwechselnd Heim und Auswärts."""
+
+    lines = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//SCB//Cal Service//EN", "NAME:ProA - Spielplan",
+        "X-WR-CALNAME:ProA - Spielplan", "TIMEZONE-ID:Europe/Berlin", "X-WR-TIMEZONE:Europe/Berlin",
+    ]
+    start = season_start(config.season) + timedelta(days=20)
+    for n in range(config.ics_events):
+        opponent = rng.choice(BASKETS_OPPONENTS)
+        kickoff = datetime.combine(start + timedelta(weeks=n // 2, days=n % 2 * 3), datetime.min.time()) + timedelta(hours=19, minutes=rng.choice((0, 30)))
+        home = n % 2 == 0
+        summary = f"Uni Baskets Münster vs {opponent}" if home else f"{opponent} vs Uni Baskets Münster"
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{uuid.UUID(int=rng.getrandbits(128), version=4)}",
+            "SEQUENCE:0",
+            f"DTSTAMP:{kickoff - timedelta(days=30):%Y%m%dT%H%M%S}",
+            f"DTSTART:{kickoff:%Y%m%dT%H%M%S}",
+            f"DTEND:{kickoff + timedelta(hours=2):%Y%m%dT%H%M%S}",
+            f"SUMMARY:ProA Spiel {summary}",
+            "LOCATION:Sporthalle Berg Fidel\\, Münster" if home else f"LOCATION:{opponent} Arena",
+            "DESCRIPTION:",
+            f"URL;VALUE=URI:https://sporteurope.tv/uni-baskets-muenster/proa-{summary.lower().replace(' ', '-')}-{n}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return _ics(lines)
+
+
+def preussen_ics(config: SyntheticConfig, rng: random.Random) -> str:
+    """Kalender im Stil von calovo: ``TZID``, Erinnerungen, unsichere (``*``) und ganztägige Termine."""
+
+    lines = [
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//calovo//Calendar Publishing 1.14", "METHOD:PUBLISH",
+        "CALSCALE:GREGORIAN", "X-WR-CALNAME:SC Preußen Münster",
+        "X-WR-CALDESC:Alle 2. Bundesliga-Spieltermine von SC Preußen Münster immer aktuell im Kalender.",
+        "X-WR-TIMEZONE:Europe/Berlin",
+    ]
+    start = date(config.season, 8, 2)
+    for n in range(config.ics_events):
+        opponent = rng.choice(PREUSSEN_OPPONENTS)
+        day = start + timedelta(weeks=n)
+        pairing = f"SC Preußen Münster - {opponent}" if n % 2 == 0 else f"{opponent} - SC Preußen Münster"
+        # Spätere Spieltage sind noch nicht terminiert
+        unsure = n >= config.ics_events * 2 // 3
+        summary = ("* " if unsure else "") + f"{pairing} | 2. Bundesliga | {n + 1}. Spieltag"
+        if unsure and rng.random() < 0.5:
+            timing = [f"DTSTART;VALUE=DATE:{day:%Y%m%d}", f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}"]
+        else:
+            kickoff = datetime.combine(day, datetime.min.time()) + timedelta(hours=rng.choice((13, 18, 20)), minutes=30)
+            timing = [
+                f"DTSTART;TZID=Europe/Berlin:{kickoff:%Y%m%dT%H%M%S}",
+                f"DTEND;TZID=Europe/Berlin:{kickoff + timedelta(hours=2):%Y%m%dT%H%M%S}",
+            ]
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{rng.getrandbits(52):x}@7477.calovo",
+            timing[0], "SEQUENCE:0", "TRANSP:TRANSPARENT", "STATUS:CONFIRMED", timing[1],
+            "LOCATION:LVM-Preußenstadion" if n % 2 == 0 else f"LOCATION:Stadion {opponent}",
+            f"SUMMARY:{summary}",
+            f"DESCRIPTION:Dieser Kalenderservice wird dir präsentiert von bundesliga.de\\n\\n{n + 1}. Spieltag",
+            "BEGIN:VALARM", "TRIGGER:-P0DT1H0M0S", "ACTION:DISPLAY", f"DESCRIPTION:Reminder: {summary}", "END:VALARM",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return _ics(lines)
+
+
+def generate(out_dir: Path, config: SyntheticConfig = SyntheticConfig()) -> dict[str, int]:
+    """Schreibt alle Quellen nach ``out_dir`` und gibt Anzahl Ligen, Spiele und Termine zurück."""
+
+    rng = random.Random(config.seed)
+    csv_dir = out_dir / "csvdata"
+    config_dir = out_dir / "config"
+    ics_dir = out_dir / "csv_Baskets"
+    for path in (csv_dir, config_dir, ics_dir, out_dir / "docs"):
+        path.mkdir(parents=True, exist_ok=True)
+
+    pool = _club_pool(rng, max(config.teams * 4, 60))
+    leagues = plan_leagues(config, rng)
+    games = 0
+    sources = ["team;wettbewerb;link;datei"]
+    for i, league in enumerate(leagues):
+        fill_teams(league, pool, config, rng)
+        rows = league_rows(league, config, rng)
+        games += len(rows)
+        (csv_dir / league.file).write_bytes(render_sams(league, rows))
+        link = f"http://127.0.0.1:8000/servlet/league/PlayingScheduleCsvExport?matchSeriesId={100000 + i}"
+        sources.append(f"{league.team_code};{league.wettbewerb};{link};{league.file}")
+
+    (config_dir / "team_sources.csv").write_text("\n".join(sources) + "\n", encoding="utf-8")
+    (config_dir / "ics_sources.csv").write_text(
+        "team;link;datei;optional\n"
+        "Baskets;http://127.0.0.1:8000/cal/562;Baskets_2526.ics;nein\n"
+        "Preußen;http://127.0.0.1:8000/ical/preussen.ics;Preussen_2526.ics;ja\n",
+        encoding="utf-8",
+    )
+    (ics_dir / "Baskets_2526.ics").write_text(baskets_ics(config, rng), encoding="utf-8")
+    (ics_dir / "Preussen_2526.ics").write_text(preussen_ics(config, rng), encoding="utf-8")
+    return {"ligen": len(leagues), "spiele": games, "termine": 2 * config.ics_events}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Synthetische SAMS-Exporte und ICS-Feeds erzeugen")
+    parser.add_argument("out_dir", type=Path, help="Zielverzeichnis (wird angelegt)")
+    parser.add_argument("--leagues", type=int, default=LEAGUES, help=f"Anzahl Ligen (Standard {LEAGUES})")
+    parser.add_argument("--teams", type=int, default=TEAMS, help=f"Teams je Liga (Standard {TEAMS})")
+    parser.add_argument("--seed", type=int, default=SEED, help=f"Startwert (Standard {SEED})")
+    parser.add_argument("--season", type=int, default=SEASON, help=f"Saisonbeginn (Standard {SEASON})")
+    parser.add_argument("--played-until", type=date.fromisoformat, help="Ergebnisse bis zu diesem Tag (JJJJ-MM-TT)")
+    parser.add_argument("--ics-events", type=int, default=ICS_EVENTS, help=f"Termine je ICS-Feed (Standard {ICS_EVENTS})")
+    args = parser.parse_args(argv)
+    if args.leagues < 1 or args.teams < 2 or args.ics_events < 0:
+        parser.error("Mindestens eine Liga mit zwei Teams nötig")
+
+    config = SyntheticConfig(
+        leagues=args.leagues,
+        teams=args.teams,
+        seed=args.seed,
+        season=args.season,
+        played_until=args.played_until,
+        ics_events=args.ics_events,
+    )
+    counts = generate(args.out_dir, config)
+    print(f"✅ {counts['ligen']} Ligen, {counts['spiele']} Spiele und {counts['termine']} Termine in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 TEAM_SOURCES_PATH = Path("config/team_sources.csv")
+ICS_SOURCES_PATH = Path("config/ics_sources.csv")
 
 
 def load_team_sources(config_path: Path = TEAM_SOURCES_PATH) -> list[dict[str, str]]:
@@ -55,3 +56,35 @@ def get_download_sources(config_path: Path = TEAM_SOURCES_PATH) -> list[dict[str
         }
         for row in load_team_sources(config_path)
     ]
+
+
+def get_ics_sources(config_path: Path = ICS_SOURCES_PATH) -> list[dict[str, Any]]:
+    """Lädt die Kalenderquellen (Baskets, Preußen) aus CSV (Semikolon-getrennt)."""
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Konfigurationsdatei nicht gefunden: {config_path}")
+
+    with config_path.open("r", encoding="utf-8-sig", newline="") as fh:
+        reader = csv.DictReader(fh, delimiter=";")
+        expected = {"team", "link", "datei", "optional"}
+        if reader.fieldnames is None:
+            raise ValueError(f"Keine Kopfzeile in {config_path}")
+        missing = expected - set(reader.fieldnames)
+        if missing:
+            raise ValueError(f"Fehlende Spalten in {config_path}: {sorted(missing)}")
+
+        rows: list[dict[str, Any]] = []
+        for row in reader:
+            clean_row = {k: (v or "").strip() for k, v in row.items()}
+            if not clean_row["datei"]:
+                continue
+            rows.append(
+                {
+                    "team": clean_row["team"],
+                    "link": clean_row["link"],
+                    "datei": clean_row["datei"],
+                    "optional": clean_row["optional"].lower() in {"ja", "yes", "true", "1"},
+                }
+            )
+
+    return rows
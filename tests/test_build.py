@@ -0,0 +1,92 @@
+"""Fehlerbehandlung und Zustand von ``build.run_stages`` mit kleinen Teststufen."""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from build import BuildContext, BuildError, Stage, run_stages
+from generate_csv import write_csv
+
+
+def write(path: str, text: str = "x") -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(text, encoding="utf-8")
+
+
+def broken(ctx: BuildContext) -> None:
+    raise KeyError("Spalte fehlt")
+
+
+# a → b (schlägt fehl) → c; d ist unabhängig
+STAGE_A = Stage("a", "a", lambda ctx: write("out/a.txt"), inputs=("in/a.txt",), outputs=("out/a.txt",))
+STAGE_B = Stage("b", "b", broken, inputs=("out/a.txt",), outputs=("out/b.txt",))
+STAGE_C = Stage("c", "c", lambda ctx: write("out/c.txt"), inputs=("out/b.txt",), outputs=("out/c.txt",))
+STAGE_D = Stage("d", "d", lambda ctx: write("out/d.txt"), inputs=("in/d.txt",), outputs=("out/d.txt",))
+
+
+class RunStagesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.mkdtemp()
+        os.chdir(self.tmp)
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.addCleanup(os.chdir, self.cwd)
+        write("in/a.txt")
+        write("in/d.txt")
+        self.state_path = Path("state.json")
+
+    def run_build(self, stages: list[Stage], jobs: int = 2) -> list:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_stages(stages, BuildContext(stand="2025-10-01 12:00"), jobs=jobs, state_path=self.state_path)
+
+    def test_failure_omits_dependents_only(self) -> None:
+        with self.assertRaises(BuildError) as raised:
+            self.run_build([STAGE_A, STAGE_B, STAGE_C, STAGE_D])
+
+        self.assertIn("Fehlgeschlagen: b", str(raised.exception))
+        self.assertIn("ausgelassen: c", str(raised.exception))
+        self.assertIsInstance(raised.exception.__cause__.__cause__, KeyError)
+        self.assertTrue(Path("out/a.txt").exists())
+        self.assertTrue(Path("out/d.txt").exists())
+        self.assertFalse(Path("out/c.txt").exists())
+
+        # Erfolgreiche Stufen behalten ihren Fingerabdruck
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(state), ["a", "d"])
+
+    def test_completed_stages_skip_after_failure(self) -> None:
+        with self.assertRaises(BuildError):
+            self.run_build([STAGE_A, STAGE_B, STAGE_D])
+
+        runs = self.run_build([STAGE_A, STAGE_D], jobs=1)
+        self.assertEqual([run.skipped for run in runs], [True, True])
+
+    def test_missing_output_fails_stage(self) -> None:
+        silent = Stage("e", "e", lambda ctx: None, inputs=("in/a.txt",), outputs=("out/e.txt",))
+        with self.assertRaises(BuildError) as raised:
+            self.run_build([silent])
+        self.assertIn("Fehlgeschlagen: e", str(raised.exception))
+        self.assertEqual(json.loads(self.state_path.read_text(encoding="utf-8")), {})
+
+    def test_csv_write_error_propagates(self) -> None:
+        # Zielpfad ist ein Verzeichnis: Schreibfehler darf nicht nur gemeldet werden
+        Path("docs/spielplan.csv").mkdir(parents=True)
+        csv_stage = Stage(
+            "csv", "csv", lambda ctx: write_csv(pd.DataFrame({"Heim": ["USC Münster"]}), Path("docs/spielplan.csv")),
+            inputs=("in/a.txt",), outputs=("docs/spielplan.csv",),
+        )
+        with self.assertRaises(BuildError) as raised:
+            self.run_build([csv_stage])
+        self.assertIsInstance(raised.exception.__cause__.__cause__, OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()
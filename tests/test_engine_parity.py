@@ -0,0 +1,62 @@
+"""Beide Engines (pandas und ``spielplan_lite.py``) auf denselben Exporten."""
+from __future__ import annotations
+
+import contextlib
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import spielplan_lite
+from synthetic_sources import SyntheticConfig, generate
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+def quiet(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+class EngineParityTest(unittest.TestCase):
+    def test_repository_sources(self) -> None:
+        differences = quiet(
+            spielplan_lite.compare_engines, REPO_DIR / "csvdata", REPO_DIR / "config" / "team_sources.csv"
+        )
+        self.assertEqual(differences, [])
+
+    def test_synthetic_sources(self) -> None:
+        # Kodierungsfehler, Spiele ohne Datum, Playoff-Layout und Jugend mit drei Sätzen
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            generate(out_dir, SyntheticConfig(leagues=12, seed=7))
+            differences = quiet(
+                spielplan_lite.compare_engines, out_dir / "csvdata", out_dir / "config" / "team_sources.csv"
+            )
+        self.assertEqual(differences, [])
+
+    def test_help_writes_nothing(self) -> None:
+        csv_path = REPO_DIR / spielplan_lite.CSV_PATH
+        before = csv_path.stat().st_mtime_ns if csv_path.exists() else None
+        with self.assertRaises(SystemExit) as exit_info:
+            quiet(spielplan_lite.main, ["--help"])
+        self.assertEqual(exit_info.exception.code, 0)
+        self.assertEqual(csv_path.stat().st_mtime_ns if csv_path.exists() else None, before)
+
+    def test_import_without_third_party_packages(self) -> None:
+        # None in sys.modules lässt jeden Import dieses Pakets scheitern
+        code = (
+            "import sys\n"
+            "for name in ('pytz', 'pandas', 'numpy'): sys.modules[name] = None\n"
+            "import spielplan_lite\n"
+            # Pillow nur für den Icon-Lauf, nicht beim Import der Seitengeneratoren
+            "assert 'PIL' not in sys.modules"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_DIR, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Downloader gegen einen lokalen Ersatzserver (``http.server`` im Thread)."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from source_downloader import ConnectionPool, Source, check_csv, download_source, recover_directory, sync_sources
+
+CSV_V1 = '"Datum und Uhrzeit";"Mannschaft 1";\r\n"20.09.2025, 13:00:00";"USC Münster";\r\n'.encode("cp1252")
+CSV_V2 = CSV_V1.replace(b"13:00", b"15:00")
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Liefert ``files`` mit ETag aus; ``failures`` zählt je Pfad ausstehende 500-Antworten."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.files: dict[str, bytes] = {}
+        self.failures: dict[str, int] = {}
+        self.log: list[tuple[str, int]] = []
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        payload = self.server.files.get(path)
+        etag = f'"{hashlib.sha256(payload).hexdigest()[:12]}"' if payload is not None else ""
+        if self.server.failures.get(path, 0) > 0:
+            self.server.failures[path] -= 1
+            status, body = 500, b"kaputt"
+        elif payload is None:
+            status, body = 404, b""
+        elif self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        else:
+            status, body = 200, payload
+        self.server.log.append((path, status))
+        self.send_response(status)
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class DownloaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StandInServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.cwd = os.getcwd()
+        self.tmp = Path(tempfile.mkdtemp(prefix="spielplan-download-"))
+        # Manifest und Staging liegen relativ zum Arbeitsverzeichnis unter .cache/
+        os.chdir(self.tmp)
+        self.csv_dir = self.tmp / "csvdata"
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def source(self, name: str, optional: bool = False) -> Source:
+        return Source(name, f"{self.server.base_url}/{name}?id=1", self.csv_dir / name, check_csv, optional)
+
+    def statuses(self) -> list[int]:
+        return [status for _, status in self.server.log]
+
+    def test_full_fetch_then_not_modified(self) -> None:
+        self.server.files = {"/a.csv": CSV_V1, "/b.csv": CSV_V2}
+        sources = [self.source("a.csv"), self.source("b.csv")]
+
+        self.assertTrue(sync_sources(sources, staging_dir=Path(".cache/staging")))
+        self.assertEqual((self.csv_dir / "a.csv").read_bytes(), CSV_V1)
+        self.assertEqual((self.csv_dir / "b.csv").read_bytes(), CSV_V2)
+        manifest = json.loads(Path(".cache/manifest.json").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["http:" + (self.csv_dir / "a.csv").as_posix()]["hash"], hashlib.sha256(CSV_V1).hexdigest())
+
+        # Zweiter Lauf: bedingte Anfragen, 304, keine Schreibzugriffe
+        self.server.log.clear()
+        before = (self.csv_dir / "a.csv").stat().st_mtime_ns
+        self.assertTrue(sync_sources(sources, staging_dir=Path(".cache/staging")))
+        self.assertEqual(self.statuses(), [304, 304])
+        self.assertEqual((self.csv_dir / "a.csv").stat().st_mtime_ns, before)
+
+    def test_server_error_is_retried(self) -> None:
+        self.server.files = {"/a.csv": CSV_V1}
+        self.server.failures = {"/a.csv": 2}
+        pool = ConnectionPool(timeout=5)
+        try:
+            result = download_source(pool, self.source("a.csv"), retries=3, backoff=0, staging_dir=self.tmp / "staging")
+        finally:
+            pool.close()
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(self.statuses(), [500, 500, 200])
+        self.assertEqual(result.staged.read_bytes(), CSV_V1)
+
+    def test_failed_required_source_keeps_directory(self) -> None:
+        self.server.files = {"/a.csv": CSV_V1, "/b.csv": CSV_V1}
+        sources = [self.source("a.csv"), self.source("b.csv")]
+        self.assertTrue(sync_sources(sources))
+
+        # a ändert sich, b ist dauerhaft kaputt: nichts wird übernommen
+        self.server.files["/a.csv"] = CSV_V2
+        self.server.failures = {"/b.csv": 99}
+        self.assertFalse(sync_sources(sources))
+        self.assertEqual((self.csv_dir / "a.csv").read_bytes(), CSV_V1)
+
+    def test_stale_files_removed_with_swap(self) -> None:
+        self.csv_dir.mkdir()
+        (self.csv_dir / "alt.csv").write_bytes(CSV_V1)
+        self.server.files = {"/a.csv": CSV_V1}
+        self.assertTrue(sync_sources([self.source("a.csv")], stale=[(self.csv_dir, "*.csv")]))
+        self.assertEqual(sorted(p.name for p in self.csv_dir.iterdir()), ["a.csv"])
+        self.assertFalse(self.csv_dir.with_name("csvdata.neu").exists())
+        self.assertFalse(self.csv_dir.with_name("csvdata.alt").exists())
+
+    def test_recover_interrupted_swap(self) -> None:
+        # Abbruch zwischen den Umbenennungen: csvdata fehlt, neuer Stand ist fertig
+        new_dir = self.csv_dir.with_name("csvdata.neu")
+        old_dir = self.csv_dir.with_name("csvdata.alt")
+        new_dir.mkdir()
+        old_dir.mkdir()
+        (new_dir / "a.csv").write_bytes(CSV_V2)
+        (old_dir / "a.csv").write_bytes(CSV_V1)
+        recover_directory(self.csv_dir)
+        self.assertEqual((self.csv_dir / "a.csv").read_bytes(), CSV_V2)
+        self.assertFalse(new_dir.exists() or old_dir.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
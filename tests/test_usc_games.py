@@ -0,0 +1,233 @@
+"""Spaltenweise Normalisierung in ``usc_games.py`` gegen die frühere zeilenweise Logik.
+
+Die Referenzfunktionen sind unverändert aus ``usc_games.py`` vor der
+Umstellung auf ganze Spalten übernommen (``contains_usc`` usw.); jede
+Tabellenzeile wird mit beiden Wegen und mit dem erwarteten Text geprüft.
+"""
+from __future__ import annotations
+
+import math
+import unicodedata
+import unittest
+
+import pandas as pd
+
+from usc_games import format_results, replace_usc_names_column, usc_mask
+from usc_rules import SATZSPALTEN, USC_SEARCH_FIELDS
+
+
+# --- Frühere zeilenweise Logik ---------------------------------------------
+
+
+def normalize_search_text(value) -> str:
+    text = str(value or "").lower().replace("�", "u")
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def contains_usc(row) -> bool:
+    text = " ".join(normalize_search_text(row.get(f, "")) for f in USC_SEARCH_FIELDS)
+    return any(usc in text for usc in ("usc munster", "usc muenster"))
+
+
+def replace_usc_names(s, team) -> str:
+    s = str(s)
+    global_replacements = [
+        ("USC Münster VIII", "USC8"),
+        ("USC Münster VII", "USC7"),
+        ("USC Münster VI",  "USC6"),
+        ("USC Münster V",   "USC5"),
+        ("USC Münster IV",  "USC4"),
+        ("USC Münster III", "USC3"),
+        ("USC Münster II",  "USC2"),
+        ("USC Münster",     "USC1"),
+    ]
+    team_specific = {
+        "USC-U14-1": [("USC1", "USC-U14-1")],
+        "USC-U14-2": [("USC2", "USC-U14-2")],
+        "USC-U16-1": [("USC1", "USC-U16-1")],
+        "USC-U16-2": [("USC2", "USC-U16-2")],
+        "USC-U18":   [("USC1", "USC-U18")],
+        "USC-U13":   [("USC1", "USC-U13")],
+    }
+    for old, new in global_replacements:
+        s = s.replace(old, new)
+    for old, new in team_specific.get(team, []):
+        s = s.replace(old, new)
+    return s
+
+
+def get_result(row) -> str:
+    try:
+        if "Satzpunkte 1" in row.index and "Satzpunkte 2" in row.index:
+            sp1 = row.get("Satzpunkte 1", "")
+            sp2 = row.get("Satzpunkte 2", "")
+            if pd.isna(sp1) or pd.isna(sp2):
+                return ""
+            sp1 = str(sp1).strip()
+            sp2 = str(sp2).strip()
+            if sp1 == "" or sp2 == "":
+                return ""
+            try:
+                ergebnis = f"{int(float(sp1))}:{int(float(sp2))}"
+            except Exception:
+                ergebnis = f"{sp1}:{sp2}"
+        else:
+            if pd.isna(row.get("Satzpunkte")) or str(row["Satzpunkte"]).strip() == "":
+                return ""
+            ergebnis = str(row["Satzpunkte"]).strip()
+
+        saetze = []
+        for l, r in SATZSPALTEN:
+            left = row.get(l, "")
+            right = row.get(r, "")
+            if (
+                pd.notna(left)
+                and pd.notna(right)
+                and str(left).strip() != ""
+                and str(right).strip() != ""
+            ):
+                try:
+                    saetze.append(f"{int(float(left))}:{int(float(right))}")
+                except Exception:
+                    saetze.append(f"{str(left).strip()}:{str(right).strip()}")
+        return f"{ergebnis} ({', '.join(saetze)})" if saetze else ergebnis
+    except Exception:
+        return ""
+
+
+# --- Tests ------------------------------------------------------------------
+
+NA = math.nan
+
+# (Heim, Gast, SR, Mannschaft 1: Verein, erwartet)
+MASK_CASES = [
+    ("USC Münster", "TV Gladbeck", "", "", True),
+    ("TV Gladbeck", "USC Münster II", "", "", True),
+    ("TV Gladbeck", "SC Hennen", "USC Münster III", "", True),
+    ("TV Gladbeck", "SC Hennen", "", "USC MÜNSTER", True),
+    ("USC Muenster", "SC Hennen", "", "", True),
+    ("USC M�nster", "SC Hennen", "", "", True),
+    ("USC MÃ¼nster", "SC Hennen", "", "", False),
+    ("TV Gladbeck", NA, NA, NA, False),
+    ("USC-Münster", "SC Hennen", "", "", False),
+    ("", "", "", "", False),
+]
+
+
+class UscMaskTest(unittest.TestCase):
+    def test_matches_row_wise_filter(self) -> None:
+        df = pd.DataFrame(
+            [case[:4] for case in MASK_CASES], columns=["Heim", "Gast", "SR", "Mannschaft 1: Verein"]
+        )
+        mask = usc_mask(df).tolist()
+        for i, case in enumerate(MASK_CASES):
+            with self.subTest(case=case):
+                self.assertEqual(mask[i], contains_usc(df.iloc[i]))
+                self.assertEqual(mask[i], case[4])
+
+
+# (Wert, USC_Team, erwartet)
+NAME_CASES = [
+    ("USC Münster", "USC1", "USC1"),
+    ("USC Münster II", "USC2", "USC2"),
+    ("USC Münster III", "USC3", "USC3"),
+    ("USC Münster IV", "USC4", "USC4"),
+    ("USC Münster V", "USC5/USC6", "USC5"),
+    ("USC Münster VI", "USC5/USC6", "USC6"),
+    ("USC Münster VII", "USC7", "USC7"),
+    ("USC Münster VIII", "USC8", "USC8"),
+    ("USC Münster VIIII", "USC8", "USC8I"),
+    ("USC Münster II vs USC Münster", "USC1", "USC2 vs USC1"),
+    ("USC Münster", "USC-U18", "USC-U18"),
+    ("USC Münster II", "USC-U14-2", "USC-U14-2"),
+    ("USC Münster", "USC-U14-2", "USC1"),
+    ("USC Münster1", "USC-U14-1", "USC-U14-11"),
+    ("USC1", "USC-U16-1", "USC-U16-1"),
+    ("Sporthalle Berg Fidel (48153 Münster)", "USC-U13", "Sporthalle Berg Fidel (48153 Münster)"),
+    ("USC Münster", None, "USC1"),
+    ("", "USC1", ""),
+    (NA, "USC1", "nan"),
+]
+
+
+class ReplaceUscNamesTest(unittest.TestCase):
+    def test_matches_row_wise_replacement(self) -> None:
+        values = pd.Series([case[0] for case in NAME_CASES], dtype=object)
+        teams = pd.Series([case[1] for case in NAME_CASES], dtype=object)
+        result = replace_usc_names_column(values, teams).tolist()
+        for i, (value, team, expected) in enumerate(NAME_CASES):
+            with self.subTest(value=value, team=team):
+                self.assertEqual(result[i], replace_usc_names(value, team))
+                self.assertEqual(result[i], expected)
+
+
+SET_COLUMNS = [col for pair in SATZSPALTEN for col in pair]
+
+# (Satzpunkte 1, Satzpunkte 2, Ballpunkte Satz 1 bis 5 als Paare, erwartet)
+NUMERIC_RESULT_CASES = [
+    (3, 2, [25, 20, 23, 25, 25, 18, 22, 25, 15, 13], "3:2 (25:20, 23:25, 25:18, 22:25, 15:13)"),
+    (3, 0, [25, 10, 25, 12, 25, 9, NA, NA, NA, NA], "3:0 (25:10, 25:12, 25:9)"),
+    (1, 3, [25, 23, 20, 25, NA, 25, 18, 25, NA, NA], "1:3 (25:23, 20:25, 18:25)"),
+    (3, 0, [NA] * 10, "3:0"),
+    (NA, NA, [NA] * 10, ""),
+    (NA, 3, [25, 20, NA, NA, NA, NA, NA, NA, NA, NA], ""),
+]
+
+# Textspalten wie in Exporten mit leeren Zellen, Leerzeichen und Sonderwerten
+TEXT_RESULT_CASES = [
+    (" 3 ", "1", ["25", "20", "23", "25", "25", "18", "25", "19", "", ""], "3:1 (25:20, 23:25, 25:18, 25:19)"),
+    ("3", "0", ["25", "", "", "25", "25.0", "10", "", "", "", ""], "3:0 (25:10)"),
+    ("w.o.", "0", [""] * 10, "w.o.:0"),
+    ("3", "2", ["25", "x", "25", "20", "", "", "", "", "15", "13"], "3:2 (25:x, 25:20, 15:13)"),
+    ("", "", ["25", "20"] + [""] * 8, ""),
+    (NA, "3", [""] * 10, ""),
+]
+
+# Ältere Exporte: eine Spalte "Satzpunkte" mit fertigem Ergebnis
+SINGLE_COLUMN_CASES = [
+    ("3:1", [25, 20, 23, 25, 25, 18, 25, 19, NA, NA], "3:1 (25:20, 23:25, 25:18, 25:19)"),
+    (" 0:3 ", [NA] * 10, "0:3"),
+    ("", [25, 20] + [NA] * 8, ""),
+    (NA, [NA] * 10, ""),
+]
+
+
+class FormatResultsTest(unittest.TestCase):
+    def check(self, df: pd.DataFrame, expected: list[str]) -> None:
+        result = format_results(df).tolist()
+        for i, text in enumerate(expected):
+            with self.subTest(row=df.iloc[i].tolist()):
+                self.assertEqual(result[i], get_result(df.iloc[i]))
+                self.assertEqual(result[i], text)
+
+    def test_numeric_columns(self) -> None:
+        # NaN in einer Spalte macht sie zu float64, vollständige Spalten bleiben int64
+        df = pd.DataFrame(
+            [[c[0], c[1], *c[2]] for c in NUMERIC_RESULT_CASES],
+            columns=["Satzpunkte 1", "Satzpunkte 2", *SET_COLUMNS],
+        )
+        self.check(df, [c[3] for c in NUMERIC_RESULT_CASES])
+
+    def test_text_columns(self) -> None:
+        df = pd.DataFrame(
+            [[c[0], c[1], *c[2]] for c in TEXT_RESULT_CASES],
+            columns=["Satzpunkte 1", "Satzpunkte 2", *SET_COLUMNS],
+            dtype=object,
+        )
+        self.check(df, [c[3] for c in TEXT_RESULT_CASES])
+
+    def test_single_result_column(self) -> None:
+        df = pd.DataFrame(
+            [[c[0], *c[1]] for c in SINGLE_COLUMN_CASES],
+            columns=["Satzpunkte", *SET_COLUMNS],
+        )
+        self.check(df, [c[2] for c in SINGLE_COLUMN_CASES])
+
+    def test_missing_set_columns(self) -> None:
+        df = pd.DataFrame({"Satzpunkte 1": [3, 2], "Satzpunkte 2": [1, 3], "Satz 1 - Ballpunkte 1": [25, 20]})
+        self.check(df, ["3:1", "2:3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,694 +1,43 @@
-from pathlib import Path
-from datetime import datetime
-import pandas as pd
-import html
-from pytz import timezone
-import re
-import unicodedata
-
-from team_config import get_csv_files
-from usc_team_links import build_team_table_overview
-
-
-def escape_text(value):
-    """Wandelt Zellen- bzw. Attributwerte in sauber escapte Strings um."""
-
-    if value is None:
-        return ""
-    try:
-        if pd.isna(value):
-            return ""
-    except Exception:
-        pass
-    text = str(value)
-    if text.strip().lower() == "nan":
-        return ""
-    return html.escape(text)
-
-# Aktuelle MESZ-Zeit für Anzeige im HTML
-mesz_time = datetime.now(timezone("Europe/Berlin")).strftime("%d.%m.%Y %H:%M")
-stand_info = f'<p class="text-muted mt-3">Stand: {mesz_time} Uhr</p>'
-reload_button = """
-<div class="text-center mt-5 mb-3">
-  <button class="btn btn-outline-secondary" onclick="location.reload()">🔄 Seite neu laden</button>
-</div>
-"""
-
-# Verzeichnis
-csv_dir = Path("csvdata")
-
-# CSV-Dateien mit zugehörigen USC-Codes aus zentraler Konfiguration
-csv_files = get_csv_files()
-
-USC_SEARCH_FIELDS = [
-    "Heim",
-    "Gast",
-    "SR",
-    "Gastgeber",
-    "Mannschaft 1: Verein",
-    "Mannschaft 2: Verein",
-    "Schiedsgericht: Verein",
-    "Gastgeber: Verein",
-]
-
-
-
-def read_csv_clean(path: Path) -> pd.DataFrame:
-    last_error = None
-    for encoding in ("utf-8-sig", "cp1252", "latin1"):
-        try:
-            df = pd.read_csv(
-                path,
-                sep=";",
-                encoding=encoding,
-                engine="python",
-                on_bad_lines="skip",
-                quotechar='"',
-            )
-            break
-        except UnicodeDecodeError as exc:
-            last_error = exc
-    else:
-        if last_error is not None:
-            print(f"⚠️ Encoding-Fallback für {path.name}: {last_error}")
-        df = pd.read_csv(
-            path,
-            sep=";",
-            encoding="utf-8-sig",
-            encoding_errors="replace",
-            engine="python",
-            on_bad_lines="skip",
-            quotechar='"',
-        )
-
-    df.columns = (
-        df.columns.astype(str)
-        .str.replace("\ufeff", "", regex=False)
-        .str.strip()
-    )
-    df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
-    df = df.dropna(axis=1, how="all")
-    return df
-
-
-def read_csv_with_fallback(path: Path, **kwargs) -> pd.DataFrame:
-    last_error = None
-    for encoding in ("utf-8-sig", "cp1252", "latin1"):
-        try:
-            return pd.read_csv(
-                path,
-                encoding=encoding,
-                **kwargs,
-            )
-        except UnicodeDecodeError as exc:
-            last_error = exc
-    if last_error is not None:
-        print(f"⚠️ Encoding-Fallback für {path.name}: {last_error}")
-    return pd.read_csv(
-        path,
-        encoding="utf-8-sig",
-        encoding_errors="replace",
-        **kwargs,
-    )
-
-
-def normalize_search_text(value) -> str:
-    text = str(value or "").lower().replace("�", "u")
-    text = unicodedata.normalize("NFKD", text)
-    return "".join(ch for ch in text if not unicodedata.combining(ch))
-rename_map = {
-    "Datum": "Datum",
-    "Uhrzeit": "Uhrzeit",
-    "Mannschaft 1": "Heim",
-    "Mannschaft 2": "Gast",
-    "Schiedsgericht": "SR",
-    "Gastgeber": "Gastgeber",
-    "Austragungsort": "Ort",
-    "Spielrunde": "Spielrunde"
-}
-
-dfs = []
-
-for file, team_code in csv_files:
-    file_path = csv_dir / file
-    df = read_csv_clean(file_path)
-    df = df.rename(columns=rename_map)
-
-    # ===== Datum + Uhrzeit aus "Datum und Uhrzeit" =====
-    if "Datum und Uhrzeit" in df.columns:
-        dt = pd.to_datetime(
-            df["Datum und Uhrzeit"]
-            .astype(str)
-            .str.replace(",", "", regex=False)   # "11.10.2025, 17:15:00" → "11.10.2025 17:15:00"
-            .str.strip(),
-            format="%d.%m.%Y %H:%M:%S",
-            errors="coerce",
-        )
-
-        df["Datum"] = dt.dt.strftime("%d.%m.%Y")
-        df["Uhrzeit"] = dt.dt.strftime("%H:%M")
-
-
-    if "Ergebnis" not in df.columns:
-        df["Ergebnis"] = ""
-
-    def contains_usc(row):
-        text = " ".join(normalize_search_text(row.get(f, "")) for f in USC_SEARCH_FIELDS)
-        return any(usc in text for usc in ("usc munster", "usc muenster"))
-
-    df = df[df.apply(contains_usc, axis=1)]
-
-    def get_usc_team(row):
-        text = f"{row.get('Heim', '')} {row.get('Gast', '')} {row.get('SR', '')} {row.get('Gastgeber', '')}".lower()
-        teams = []
-        if file == "Spielplan_Bezirksklasse_26_Frauen.csv":
-            if re.search(r"\busc münster vi\b", text):
-                teams.append("USC6")
-            if re.search(r"\busc münster v\b", text):
-                teams.append("USC5")
-            return "/".join(teams)
-
-        if file == "Spielplan_Kreisliga_Muenster_Frauen.csv":
-            if re.search(r"\busc münster viii\b", text):
-                teams.append("USC8")
-            if re.search(r"\busc münster vii\b", text):
-                teams.append("USC7")
-            return "/".join(teams)
-
-        return team_code
-
-    df["USC_Team"] = df.apply(get_usc_team, axis=1)
-
-    def replace_usc_names(s, team):
-        s = str(s)
-        global_replacements = [
-            ("USC Münster VIII", "USC8"),
-            ("USC Münster VII", "USC7"),
-            ("USC Münster VI",  "USC6"),
-            ("USC Münster V",   "USC5"),
-            ("USC Münster IV",  "USC4"),
-            ("USC Münster III", "USC3"),
-            ("USC Münster II",  "USC2"),
-            ("USC Münster",     "USC1"),
-        ]
-        team_specific = {
-            "USC-U14-1": [("USC1", "USC-U14-1")],
-            "USC-U14-2": [("USC2", "USC-U14-2")],
-            "USC-U16-1": [("USC1", "USC-U16-1")],
-            "USC-U16-2": [("USC2", "USC-U16-2")],
-            "USC-U18":   [("USC1", "USC-U18")],
-            "USC-U13":   [("USC1", "USC-U13")],
-        }
-        for old, new in global_replacements:
-            s = s.replace(old, new)
-        for old, new in team_specific.get(team, []):
-            s = s.replace(old, new)
-        return s
-
-    for col in ["Heim", "Gast", "SR", "Gastgeber", "Ort", "Spielrunde"]:
-        df[col] = df.apply(lambda row: replace_usc_names(row[col], row["USC_Team"]), axis=1)
-
-    # (Änderung 2) Ergebnis aus Satzpunkte 1 / Satzpunkte 2 + Satzdetails erzeugen
-    def get_result(row):
-        try:
-            # Gesamtsätze Heim / Gast
-            sp1 = row.get("Satzpunkte 1", "")
-            sp2 = row.get("Satzpunkte 2", "")
-
-            if pd.isna(sp1) or pd.isna(sp2):
-                return ""
-
-            sp1 = str(sp1).strip()
-            sp2 = str(sp2).strip()
-
-            if sp1 == "" or sp2 == "":
-                return ""
-
-            # Haupt-Ergebnis (z. B. 3:1)
-            try:
-                ergebnis = f"{int(float(sp1))}:{int(float(sp2))}"
-            except Exception:
-                ergebnis = f"{sp1}:{sp2}"
-
-            # Einzelne Satzstände (optional)
-            saetze = []
-            satzspalten = [
-                ("Satz 1 - Ballpunkte 1", "Satz 1 - Ballpunkte 2"),
-                ("Satz 2 - Ballpunkte 1", "Satz 2 - Ballpunkte 2"),
-                ("Satz 3 - Ballpunkte 1", "Satz 3 - Ballpunkte 2"),
-                ("Satz 4 - Ballpunkte 1", "Satz 4 - Ballpunkte 2"),
-                ("Satz 5 - Ballpunkte 1", "Satz 5 - Ballpunkte 2"),
-            ]
+from __future__ import annotations
 
-            for l, r in satzspalten:
-                left = row.get(l, "")
-                right = row.get(r, "")
+import time
 
-                if (
-                    pd.notna(left)
-                    and pd.notna(right)
-                    and str(left).strip() != ""
-                    and str(right).strip() != ""
-                ):
-                    try:
-                        saetze.append(f"{int(float(left))}:{int(float(right))}")
-                    except Exception:
-                        saetze.append(f"{str(left).strip()}:{str(right).strip()}")
-
-            return f"{ergebnis} ({', '.join(saetze)})" if saetze else ergebnis
-
-        except Exception:
-            return ""
-
-
-    # Ergebnis nur berechnen, wenn Satzpunkte vorhanden sind
-    if "Satzpunkte 1" in df.columns and "Satzpunkte 2" in df.columns:
-        df["Ergebnis"] = df.apply(get_result, axis=1)
-
-
-    # Ergebnis-Spalte direkt hinter Gastgeber einsortieren
-    cols = df.columns.tolist()
-    if "Ergebnis" in cols and "Gastgeber" in cols:
-        cols.remove("Ergebnis")
-        pos = cols.index("Gastgeber") + 1
-        cols = cols[:pos] + ["Ergebnis"] + cols[pos:]
-        df = df[cols]
-
-    dfs.append(df)
-
-# 🟧 Baskets-Spiele ergänzen
-baskets_file = Path("csv_Baskets/Baskets_2526_Heimspiele.csv")
-df_baskets = read_csv_with_fallback(baskets_file)
-
-df_baskets["Heim"] = "Uni Baskets Münster"
-df_baskets["Ort"] = "Sporthalle Berg Fidel (48153 Münster)"
-df_baskets["Spielrunde"] = "Basketball Pro A"
-df_baskets["SR"] = ""
-df_baskets["Gastgeber"] = "Baskets"
-df_baskets["Ergebnis"] = ""  # wichtig für Filterlogik
-df_baskets["USC_Team"] = "Baskets"
-
-df_baskets = df_baskets.rename(columns={"Startzeit": "Uhrzeit", "Gegner": "Gast"})
-df_baskets["Datum"] = df_baskets["Datum"].str.strip()
-df_baskets["Uhrzeit"] = df_baskets["Uhrzeit"].str.strip()
-
-# Datumsobjekte erzeugen
-df_baskets["Datum_DT"] = pd.to_datetime(df_baskets["Datum"], format="%d.%m.%Y", errors="coerce")
-
-# Wochentag hinzufügen
-tage_map = {
-    "Monday": "Mo", "Tuesday": "Di", "Wednesday": "Mi", "Thursday": "Do",
-    "Friday": "Fr", "Saturday": "Sa", "Sunday": "So"
-}
-df_baskets["Tag"] = df_baskets["Datum_DT"].dt.day_name().map(tage_map)
-
-# Spalten in gewünschter Reihenfolge
-df_baskets = df_baskets[[
-    "Datum", "Uhrzeit", "Tag", "Heim", "Gast", "SR", "Gastgeber",
-    "Ergebnis", "Ort", "Spielrunde", "Datum_DT", "USC_Team"
-]]
-
-dfs.append(df_baskets)
-
-# 🟩 Preußen Münster – Heimspiele ergänzen
-# Primär im vom Nutzer genannten Ordner "csv_Basktes", Fallback "csv_Baskets"
-preussen_candidates = [
-    Path("csv_Basktes/Preussen_2526_Heimspiele.csv"),
-    Path("csv_Baskets/Preussen_2526_Heimspiele.csv"),
-]
-preussen_file = next((p for p in preussen_candidates if p.exists()), None)
-if preussen_file is None:
-    # Falls Datei (noch) nicht existiert, ohne Fehler fortfahren
-    pass
-else:
-    df_preussen = read_csv_with_fallback(preussen_file)
-    # Flexible Spalten-Übernahme (falls mal "Uhrzeit" statt "Startzeit" o.ä.)
-    col_map = {}
-    if "Startzeit" in df_preussen.columns and "Uhrzeit" not in df_preussen.columns:
-        col_map["Startzeit"] = "Uhrzeit"
-    if "Gegner" in df_preussen.columns and "Gast" not in df_preussen.columns:
-        col_map["Gegner"] = "Gast"
-    if col_map:
-        df_preussen = df_preussen.rename(columns=col_map)
-
-    # Pflichtfelder setzen/ergänzen
-    df_preussen["Heim"] = "Preußen Münster"
-    df_preussen["Ort"] = "Sporthalle Berg Fidel (48153 Münster)"
-    df_preussen["Spielrunde"] = "Fußball 2. BL"
-    df_preussen["SR"] = ""
-    df_preussen["Gastgeber"] = "Preußen Münster"
-    df_preussen["Ergebnis"] = ""  # wichtig für Filterlogik
-    df_preussen["USC_Team"] = "Preußen Münster"
-
-    # Bereinigen
-    df_preussen["Datum"] = df_preussen["Datum"].astype(str).str.strip()
-    if "Uhrzeit" in df_preussen.columns:
-        df_preussen["Uhrzeit"] = df_preussen["Uhrzeit"].astype(str).str.strip()
-    else:
-        df_preussen["Uhrzeit"] = ""
-
-    # Datumsobjekte erzeugen
-    df_preussen["Datum_DT"] = pd.to_datetime(df_preussen["Datum"], format="%d.%m.%Y", errors="coerce")
-    df_preussen["Tag"] = df_preussen["Datum_DT"].dt.day_name().map(tage_map)
-
-    # Spalten in gewünschter Reihenfolge
-    for need_col in ["Gast"]:
-        if need_col not in df_preussen.columns:
-            df_preussen[need_col] = ""
-
-    df_preussen = df_preussen[[
-        "Datum", "Uhrzeit", "Tag", "Heim", "Gast", "SR", "Gastgeber",
-        "Ergebnis", "Ort", "Spielrunde", "Datum_DT", "USC_Team"
-    ]]
-
-    dfs.append(df_preussen)
-
-# ---------- Gesamttabelle zusammenbauen ----------
-df_all = pd.concat(dfs, ignore_index=True)
-
-df_all["Datum_DT"] = pd.to_datetime(
-    df_all["Datum"],
-    format="%d.%m.%Y",
-    errors="coerce"
-)
-
-
-
-
-tage_map = {
-    "Monday": "Mo", "Tuesday": "Di", "Wednesday": "Mi", "Thursday": "Do",
-    "Friday": "Fr", "Saturday": "Sa", "Sunday": "So"
-}
+import pandas as pd
 
-# Tag: leer, wenn kein Datum vorhanden
-def safe_weekday(dt):
-    if pd.isna(dt):
-        return ""
-    try:
-        return tage_map.get(dt.day_name(), "")
-    except Exception:
-        return ""
+from spielplan_frame import FrameTable
+from spielplan_html import TRAINER, stand_now, write_pages
+from usc_games import load_external_games, load_games, sort_games
 
-df_all["Tag"] = df_all["Datum_DT"].apply(safe_weekday)
 
-# Woche nur berechnen, wenn Datum existiert
-df_all["Woche_Start"] = df_all["Datum_DT"].apply(
-    lambda d: d - pd.to_timedelta(d.weekday(), unit="d") if pd.notna(d) else pd.NaT
-)
-df_all["Woche_Ende"] = df_all["Woche_Start"].apply(
-    lambda d: d + pd.to_timedelta(6, unit="d") if pd.notna(d) else pd.NaT
-)
+def trainer_games(df_games: pd.DataFrame, df_external: pd.DataFrame, now_epoch: int | None = None) -> pd.DataFrame:
+    """USC-Spiele plus Baskets- und Preußen-Heimspiele für die Traineransicht.
 
-df_all["Woche_Label"] = df_all.apply(
-    lambda row: (
-        f"Mo {row['Woche_Start'].strftime('%d.%m.%Y')} – So {row['Woche_Ende'].strftime('%d.%m.%Y')}"
-        if pd.notna(row["Woche_Start"]) and pd.notna(row["Woche_Ende"])
-        else ""
-    ),
-    axis=1
-)
+    Vergangene Spiele ohne USC-Beteiligung fallen weg.
+    """
 
-def format_uhrzeit(uhr):
-    if uhr == "00:00:00":
-        return "???"
-    try:
-        return datetime.strptime(uhr, "%H:%M:%S").strftime("%H:%M")
-    except:
-        try:
-            return datetime.strptime(uhr, "%H:%M").strftime("%H:%M")
-        except:
-            return uhr
+    # ---------- Gesamttabelle zusammenbauen ----------
+    df_all = sort_games(pd.concat([df_games, df_external], ignore_index=True))
 
-df_all["Uhrzeit"] = df_all["Uhrzeit"].apply(format_uhrzeit)
+    # 🔴 Spiele filtern
+    if now_epoch is None:
+        now_epoch = int(time.time())
 
-def replace_usc_names(s, team):
-    s = str(s)
-    global_replacements = [
-        ("USC Münster VIII", "USC8"),
-        ("USC Münster VII", "USC7"),
-        ("USC Münster VI",  "USC6"),
-        ("USC Münster V",   "USC5"),
-        ("USC Münster IV",  "USC4"),
-        ("USC Münster III", "USC3"),
-        ("USC Münster II",  "USC2"),
-        ("USC Münster",     "USC1"),
+    return df_all[
+        (df_all["Heim"].str.contains("USC", na=False) | df_all["Gast"].str.contains("USC", na=False))
+        |
+        (df_all["Anstoss_Epoch"] >= now_epoch)
     ]
-    team_specific = {
-        "USC-U14-1": [("USC1", "USC-U14-1")],
-        "USC-U14-2": [("USC2", "USC-U14-2")],
-        "USC-U16-1": [("USC1", "USC-U16-1")],
-        "USC-U16-2": [("USC2", "USC-U16-2")],
-        "USC-U18":   [("USC1", "USC-U18")],
-        "USC-U13":   [("USC1", "USC-U13")],
-    }
-    for old, new in global_replacements:
-        s = s.replace(old, new)
-    for old, new in team_specific.get(team, []):
-        s = s.replace(old, new)
-    return s
-
-def clean_all_names(row):
-    for col in ["Heim", "Gast", "SR", "Gastgeber", "Ort", "Spielrunde"]:
-        row[col] = replace_usc_names(row[col], row["USC_Team"])
-    return row
-
-df_all = df_all.apply(clean_all_names, axis=1)
-
-for col in ["Heim", "Gast", "SR", "Gastgeber"]:
-    df_all[col] = df_all[col].str.replace(r'\b(USC-[U\d]+-\d) II\b', r'\1', regex=True)
-
-df_all["_sort_dt"] = df_all["Datum_DT"].fillna(pd.Timestamp.max)
-df_all = (
-    df_all
-    .sort_values(by=["_sort_dt", "Uhrzeit"], kind="mergesort")
-    .drop(columns="_sort_dt")
-)
-
-# 🔴 Spiele filtern
-now = datetime.now(timezone("Europe/Berlin")).replace(tzinfo=None)
-
-df_all = df_all[
-    (df_all["Heim"].str.contains("USC", na=False) | df_all["Gast"].str.contains("USC", na=False))
-    |
-    (df_all["Datum_DT"].isna())
-    |
-    (df_all["Datum_DT"] >= now)
-]
-spielrunden = sorted(df_all["Spielrunde"].dropna().unique())
-orte = sorted([o for o in df_all["Ort"].dropna().unique() if "münster" in o.lower()])
-teams = sorted(set(t for team in df_all["USC_Team"].dropna() for t in team.split("/")))
-usc_team_codes = [team for team in teams if team.startswith("USC")]
-wochen = sorted(
-    {(row["Woche_Start"], row["Woche_Label"]) for _, row in df_all.iterrows()},
-    key=lambda x: x[0],
-)
-
-columns_display = [
-    "Datum",
-    "Uhrzeit",
-    "Tag",
-    "Heim",
-    "Gast",
-    "SR",
-    "Gastgeber",
-    "Ergebnis",
-    "Ort",
-    "Spielrunde",
-]
-table_header_html = "".join(f"<th>{col}</th>" for col in columns_display)
-
-
-def render_cells(row):
-    return "".join(f"<td>{escape_text(row.get(col, ''))}</td>" for col in columns_display)
 
-# Tabelle mit mehreren data-team Attributen
-table_rows = "\n".join(
-    "<tr "
-    + f'data-teams="{escape_text(row["USC_Team"])}"'
-    + f' data-spielrunde="{escape_text(row["Spielrunde"])}" data-ort="{escape_text(row["Ort"])}"'
-    + f' data-week="{row["Woche_Start"].strftime("%Y-%m-%d") if pd.notna(row["Woche_Start"]) else ""}"'
-    + f' data-datum="{row["Datum_DT"].strftime("%Y-%m-%d") if pd.notna(row["Datum_DT"]) else ""}">'
-    + render_cells(row)
-    + "</tr>"
-    for _, row in df_all.iterrows()
-)
 
+def write_trainer_page(df_games: pd.DataFrame, df_external: pd.DataFrame, stand: str) -> None:
+    write_pages(FrameTable(trainer_games(df_games, df_external)), [TRAINER], stand)
 
-team_tables_html = build_team_table_overview(usc_team_codes)
 
-# HTML-Ausgabe
-html_code = f"""<!doctype html>
-<html lang="de">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>USC Münster Spielplan 2025/26</title>
-  <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">
-  <style>
-    body {{ font-size: 0.6rem; }}
-    th, td {{ white-space: nowrap; }}
-    table tr {{ background-color: white; }}
-    thead th {{ background-color: #f2f2f2 !important; color: #000; }}
-    .accordion-button {{ background-color: #96d696 !important; }}
-    #filters {{ background-color: #96d696 !important; }}
-    #filters select, #filters label {{
-      color: #000000;
-      border-color: #96d696;
-    }}
-    .form-select:focus {{
-      border-color: #28a745;
-      box-shadow: 0 0 0 0.25rem rgba(40,167,69,.25);
-    }}
-    @media print {{
-      body * {{ visibility: hidden; }}
-      #spielplan, #spielplan * {{ visibility: visible; }}
-      #spielplan {{ position: absolute; left: 0; top: 0; width: 100%; }}
-    }}
-  </style>
-  <link rel="icon" type="image/png" href="favicon.png">
-  <link rel="manifest" href="manifest.webmanifest">
-  <meta name="theme-color" content="#008000">
-</head>
-<body class="p-4">
-  <div class="container">
-    <h1 class="mb-2">USC Münster – Spielplan 2025/26</h1>
-    {stand_info}
-    {team_tables_html}
-    <div class="accordion mb-3" id="filterAccordion">
-      <div class="accordion-item">
-        <h2 class="accordion-header" id="headingFilters">
-          <button class="accordion-button" type="button" data-bs-toggle="collapse" data-bs-target="#filters" aria-expanded="true">
-            Filter anzeigen
-          </button>
-        </h2>
-        <div id="filters" class="accordion-collapse collapse show" aria-labelledby="headingFilters">
-          <div class="accordion-body">
-            <div class="row g-2">
-              <div class="col-md-4">
-                <label class="form-label">USC-Team:</label>
-                <select class="form-select" id="filterTeam" onchange="filter()">
-                  <option value="">Alle</option>
-                  {''.join(f"<option value='{html.escape(t)}'>{html.escape(t)}</option>" for t in teams)}
-                </select>
-              </div>
-              <div class="col-md-4">
-                <label class="form-label">Spielrunde:</label>
-                <select class="form-select" id="filterRunde" onchange="filter()">
-                  <option value="">Alle</option>
-                  {''.join(f"<option value='{html.escape(r)}'>{html.escape(r)}</option>" for r in spielrunden)}
-                </select>
-              </div>
-              <div class="col-md-4">
-                <label class="form-label">Ort (nur Münster):</label>
-                <select class="form-select" id="filterOrt" onchange="filter()">
-                  <option value="">Alle</option>
-                  {''.join(f"<option value='{html.escape(o)}'>{html.escape(o)}</option>" for o in orte)}
-                </select>
-              </div>
-            </div>
-            <div class="row g-2 mt-2">
-              <div class="col-md-4">
-                <label class="form-label">Woche (Mo–So):</label>
-                <select class="form-select" id="filterWeek" onchange="filter()">
-                  <option value="">Alle</option>
-                  {''.join(f"<option value='{w[0].strftime('%Y-%m-%d')}'>{html.escape(w[1])}</option>" for w in wochen)}
-                </select>
-              </div>
-              <div class="col-md-4 d-flex align-items-end" id="togglePastContainer">
-                <div class="form-check">
-                  <input class="form-check-input" type="checkbox" value="1" id="togglePast" onchange="filter()">
-                  <label class="form-check-label" for="togglePast">Vergangene Spiele anzeigen</label>
-                </div>
-              </div>
-            </div>
-            <div class="mt-3">
-              <button class="btn btn-secondary" onclick="resetFilter()">Zurücksetzen</button>
-              <button class="btn btn-outline-primary" onclick="window.print()">🖨️ Drucken</button>
-            </div>
-          </div>
-        </div>
-      </div>
-    </div>
-    <div class="table-responsive">
-      <table class="table table-bordered" id="spielplan">
-        <thead>
-          <tr>{table_header_html}</tr>
-        </thead>
-        <tbody>
-          {table_rows}
-        </tbody>
-      </table>
-    </div>
-    <div class="mt-4">
-      <a class="btn btn-success" href="spielplan.csv" download>📥 Gesamten Spielplan als CSV herunterladen</a>
-    </div>
-    {reload_button}
-  </div>
-  <script>
-    function filter() {{
-      const team = document.getElementById("filterTeam").value;
-      const runde = document.getElementById("filterRunde").value;
-      const ort = document.getElementById("filterOrt").value;
-      const week = document.getElementById("filterWeek").value;
-      const showPast = document.getElementById("togglePast").checked;
-        const pastContainer = document.getElementById("togglePastContainer");
-        if (pastContainer) {{
-          pastContainer.style.display = week ? "none" : "flex";
-        }}
-      const now = new Date();
-      const cutoff = new Date(now.getFullYear(), now.getMonth(), now.getDate() - 10);
-      const today = new Date(now.getFullYear(), now.getMonth(), now.getDate());
-      document.querySelectorAll("#spielplan tbody tr").forEach(row => {{
-        const teamList = (row.dataset.teams || "").split("/");
-        const matchTeam = !team || teamList.includes(team);
-        const matchRunde = !runde || row.dataset.spielrunde === runde;
-        const matchOrt = !ort || row.dataset.ort === ort;
-        const matchWeek = !week || row.dataset.week === week;
-        const rowDate = row.dataset.datum ? new Date(row.dataset.datum) : null;
-        const isRecent = !rowDate || rowDate >= cutoff;
-        const isFuture = !rowDate || rowDate >= today;
-        const withinTime = week ? true : (showPast ? true : (isFuture || isRecent));
-        row.style.display = (matchTeam && matchRunde && matchOrt && matchWeek && withinTime) ? "" : "none";
-      }});
-    }}
-    function resetFilter() {{
-      document.getElementById("filterTeam").value = "";
-      document.getElementById("filterRunde").value = "";
-      document.getElementById("filterOrt").value = "";
-      document.getElementById("filterWeek").value = "";
-      document.getElementById("togglePast").checked = false;
-      filter();
-    }}
-    document.addEventListener("DOMContentLoaded", filter);
-  </script>
-  <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>
-  <script>
-    if ('serviceWorker' in navigator) {{
-      navigator.serviceWorker.register('service-worker.js')
-        .then(reg => console.log('✅ Service Worker registriert:', reg.scope))
-        .catch(err => console.warn('❌ Service Worker Fehler:', err));
-    }}
-  </script>
-</body>
-</html>
-"""
+def main() -> None:
+    # 🟦 Normalisierte USC-Spiele aus dem gemeinsamen Cache
+    # 🟧 Baskets- und 🟩 Preußen-Heimspiele ergänzen
+    write_trainer_page(load_games(), load_external_games(), stand_now())
 
-html_code = html_code.replace(
-    ".btn-success {",
-    """.btn-success {
-  background-color: #01a83b !important;
-  border-color: #01a83b !important;"""
-)
-html_code = html_code.replace(
-    "</style>",
-    """h1 { font-size: 1.2rem; margin-bottom: 0.5rem; }
-.form-label { font-size: 0.7rem; }
-.form-select { font-size: 0.7rem; padding: 0.25rem 0.5rem; }
-.btn { font-size: 0.6rem; padding: 0.25rem 0.6rem; }
-""" + "</style>"
-)
 
-# Standard-HTML erzeugen
-Path("docs").mkdir(exist_ok=True)
-Path("docs/index_trainer.html").write_text(html_code, encoding="utf-8")
-print("✅ index_trainer.html erfolgreich erstellt.")
+if __name__ == "__main__":
+    main()
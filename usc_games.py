@@ -0,0 +1,532 @@
+"""Gemeinsame Aufbereitung der SAMS-Spielpläne für alle Generatoren.
+
+Alle Ausgaben (HTML, CSV, ICS) lesen den normalisierten Gesamtdatensatz
+``df_all`` über :func:`load_games`. Der Datensatz wird einmal aus
+``csvdata/`` erzeugt und als Pickle-Datei im Cache-Verzeichnis abgelegt.
+Der Dateiname enthält einen Hash über die Inhalte aller Eingangsdateien,
+sodass jeder weitere Generator im selben Lauf nur noch die fertige Datei lädt.
+
+Zum Schlüssel gehören außerdem ein Hash über den Quelltext der
+Normalisierung (``NORMALIZE_MODULES``) und die pandas-Version: Nach einer
+Codeänderung oder einem pandas-Update wird neu aufbereitet, auch wenn
+``.cache/`` aus einem früheren Lauf wiederhergestellt wurde. Unlesbare
+Cache-Dateien gelten als fehlend.
+
+Zusätzlich hält ``.cache/manifest.json`` den Hash jeder einzelnen Quelle fest.
+Ändert sich nur ein Export, wird nur dieser neu gelesen; die übrigen Frames
+kommen aus ``.cache/sources/``. Geänderte Exporte werden parallel gelesen und
+normalisiert (``PARSE_WORKERS``).
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from csv_reader import read_csv_robust
+from source_manifest import SourceManifest, code_hash, file_hash
+from team_config import TEAM_SOURCES_PATH, get_csv_files
+from usc_names import team_replacements
+from usc_rules import (
+    EPOCH_UNBEKANNT,
+    EXTERNAL_SOURCES,
+    NAME_COLUMNS,
+    RENAME_MAP,
+    SATZSPALTEN,
+    USC_PATTERN,
+    USC_SEARCH_FIELDS,
+    WOCHENTAGE as USC_WOCHENTAGE,
+    get_usc_team,
+    normalize_search_text,
+)
+
+CSV_DIR = Path("csvdata")
+STORE_DIR = Path(".cache")
+
+# Bei Änderungen am Format der Cache-Dateien erhöhen; Codeänderungen erfasst NORMALIZE_CODE.
+STORE_VERSION = 3
+
+# Module, deren Quelltext das Ergebnis der Normalisierung bestimmt
+NORMALIZE_MODULES = ("usc_games.py", "usc_names.py", "usc_rules.py", "csv_reader.py", "csv_encoding.py")
+NORMALIZE_CODE = code_hash(Path(__file__).with_name(name) for name in NORMALIZE_MODULES)
+
+# Threads für das Einlesen der Exporte (der C-Parser von pandas gibt den GIL frei)
+PARSE_WORKERS = 4
+
+EXTERNAL_COLUMNS = [
+    "Datum", "Uhrzeit", "Tag", "Heim", "Gast", "SR", "Gastgeber",
+    "Ergebnis", "Ort", "Spielrunde", "Datum_DT", "USC_Team",
+    "Woche_Start", "Woche_Ende", "Woche_Label", "Anstoss_Epoch",
+]
+
+WOCHENTAGE = np.array(USC_WOCHENTAGE, dtype=object)
+
+
+def read_csv_clean(path: Path) -> pd.DataFrame:
+    df = read_csv_robust(path, sep=";")
+
+    df.columns = (
+        df.columns.astype(str)
+        .str.replace("\ufeff", "", regex=False)
+        .str.strip()
+    )
+    df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
+    df = df.dropna(axis=1, how="all")
+    return df
+
+
+def normalize_search_column(values: pd.Series) -> np.ndarray:
+    """Normalisiert eine Spalte; jeder unterschiedliche Wert wird nur einmal umgewandelt."""
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized = np.array([normalize_search_text(u) for u in uniques], dtype=object)
+    return normalized[codes]
+
+
+def replace_usc_names_column(values: pd.Series, teams: pd.Series) -> pd.Series:
+    """Spaltenweise Variante von ``usc_names.replace_usc_names``: pro ``USC_Team``-Gruppe jeder Wert nur einmal."""
+
+    result = pd.Series([""] * len(values), index=values.index, dtype=object)
+    for team_key, group in values.groupby(teams.fillna(""), sort=False):
+        pattern, mapping = team_replacements(team_key)
+        codes, uniques = pd.factorize(group, use_na_sentinel=False)
+        rewritten = np.array([pattern.sub(lambda m: mapping[m.group(0)], str(u)) for u in uniques], dtype=object)
+        result.loc[group.index] = rewritten[codes]
+    return result
+
+
+def usc_mask(df: pd.DataFrame) -> pd.Series:
+    """Markiert alle Zeilen, in deren Such-Spalten der USC Münster vorkommt."""
+
+    parts = [
+        normalize_search_column(df[field]) if field in df.columns else np.full(len(df), "", dtype=object)
+        for field in USC_SEARCH_FIELDS
+    ]
+    combined = parts[0]
+    for part in parts[1:]:
+        combined = combined + " " + part
+    return pd.Series(combined, index=df.index, dtype=object).str.contains(USC_PATTERN, regex=True)
+
+
+def _text_column(df: pd.DataFrame, col: str) -> tuple[np.ndarray, np.ndarray]:
+    """Getrimmter Text einer Spalte und Maske der nicht leeren Werte."""
+
+    if col not in df.columns:
+        return np.full(len(df), "", dtype=object), np.zeros(len(df), dtype=bool)
+    values = df[col]
+    text = values.astype("string").str.strip().fillna("")
+    present = values.notna().to_numpy() & (text != "").to_numpy()
+    return text.to_numpy(dtype=object), present
+
+
+def _score_values(df: pd.DataFrame, col: str) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Zahlenwerte, Maske der vorhandenen Werte und (nur bei Textspalten) den Text."""
+
+    if col in df.columns and is_numeric_dtype(df[col]) and not is_bool_dtype(df[col]):
+        numbers = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        return numbers, ~np.isnan(numbers), None
+
+    text, present = _text_column(df, col)
+    numbers = pd.to_numeric(pd.Series(text, dtype=object), errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    return numbers, present, text
+
+
+def _score_pair(df: pd.DataFrame, left_col: str, right_col: str) -> tuple[np.ndarray, np.ndarray]:
+    """Formatiert zwei Punktespalten als ``links:rechts``.
+
+    Sind beide Werte Zahlen, erscheinen sie als Ganzzahlen (``25.0`` → ``25``),
+    sonst wird der getrimmte Originaltext übernommen.
+    """
+
+    left, has_left, left_text = _score_values(df, left_col)
+    right, has_right, right_text = _score_values(df, right_col)
+    present = has_left & has_right
+    numeric = np.isfinite(left) & np.isfinite(right)
+
+    pair = np.full(len(df), "", dtype=object)
+    pair[numeric] = (
+        np.trunc(left[numeric]).astype(np.int64).astype(str).astype(object)
+        + ":"
+        + np.trunc(right[numeric]).astype(np.int64).astype(str).astype(object)
+    )
+
+    fallback = present & ~numeric
+    if fallback.any():
+        def raw(col, text):
+            if text is not None:
+                return text[fallback]
+            return np.array([str(v).strip() for v in df[col].to_numpy()[fallback]], dtype=object)
+
+        pair[fallback] = raw(left_col, left_text) + ":" + raw(right_col, right_text)
+    return pair, present
+
+
+def format_results(df: pd.DataFrame) -> pd.Series:
+    """Baut das Ergebnis aller Zeilen auf einmal, z. B. ``3:1 (25:20, 23:25, ...)``."""
+
+    if "Satzpunkte 1" in df.columns and "Satzpunkte 2" in df.columns:
+        ergebnis, has_result = _score_pair(df, "Satzpunkte 1", "Satzpunkte 2")
+    else:
+        ergebnis, has_result = _text_column(df, "Satzpunkte")
+
+    saetze = np.full(len(df), "", dtype=object)
+    for l, r in SATZSPALTEN:
+        satz, has_satz = _score_pair(df, l, r)
+        saetze = np.where(
+            has_satz,
+            np.where(saetze == "", satz, saetze + ", " + satz),
+            saetze,
+        )
+
+    result = np.where(saetze != "", ergebnis + " (" + saetze + ")", ergebnis)
+    return pd.Series(np.where(has_result, result, ""), index=df.index, dtype=object)
+
+
+def format_uhrzeit(values: pd.Series) -> pd.Series:
+    """Bringt Uhrzeiten auf ``HH:MM``; nicht lesbare Werte werden zu ``???``."""
+
+    text = values.astype("string").str.strip()
+    parsed = pd.to_datetime(text, format="%H:%M:%S", errors="coerce")
+    parsed = parsed.fillna(pd.to_datetime(text, format="%H:%M", errors="coerce"))
+    return parsed.dt.strftime("%H:%M").astype(object).where(parsed.notna(), "???")
+
+
+def normalize_source(df: pd.DataFrame, file: str, team_code: str | None) -> pd.DataFrame | None:
+    """Normalisiert den Export einer Liga und behält nur Spiele mit USC-Beteiligung."""
+
+    df = df.rename(columns=RENAME_MAP)
+
+    # --- Datum/Uhrzeit normalisieren ---
+    if "Datum_Uhrzeit" in df.columns and ("Datum" not in df.columns or "Uhrzeit" not in df.columns):
+        # Beispielwert: "20.09.2025, 15:00:00"
+        parts = df["Datum_Uhrzeit"].astype(str).str.split(",", n=1, expand=True)
+
+        df["Datum"] = parts[0].astype(str).str.strip()
+        if parts.shape[1] > 1:
+            df["Uhrzeit"] = parts[1].astype(str).str.strip()
+        else:
+            df["Uhrzeit"] = ""
+
+    required_cols = {"Datum", "Uhrzeit", "Heim", "Gast"}
+    missing = required_cols - set(df.columns)
+    if missing:
+        print(f"⚠️ CSV übersprungen ({file}): fehlende Spalten {missing}")
+        return None
+
+    for col in NAME_COLUMNS:
+        if col not in df.columns:
+            df[col] = ""
+    if "Ergebnis" not in df.columns:
+        df["Ergebnis"] = ""
+
+    df = df[usc_mask(df)].copy()
+
+    df["USC_Team"] = df.apply(lambda row: get_usc_team(row, file, team_code), axis=1)
+
+    for col in NAME_COLUMNS:
+        df[col] = replace_usc_names_column(df[col], df["USC_Team"])
+
+    if {"Satzpunkte 1", "Satzpunkte 2"} <= set(df.columns) or "Satzpunkte" in df.columns:
+        df["Ergebnis"] = format_results(df)
+
+    # Ergebnis-Spalte direkt hinter Gastgeber einsortieren
+    cols = df.columns.tolist()
+    cols.remove("Ergebnis")
+    pos = cols.index("Gastgeber") + 1
+    cols = cols[:pos] + ["Ergebnis"] + cols[pos:]
+    return df[cols]
+
+
+def add_calendar_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Ergänzt Datum_DT, Wochentag, Wochen-Spalten (Mo–So) und Anstoß-Zeitstempel.
+
+    Alle Spalten werden spaltenweise berechnet. ``Uhrzeit`` wird dabei auf
+    ``HH:MM`` gebracht. ``Anstoss_Epoch`` enthält den Anstoß als Unix-Zeit in
+    Sekunden (int64). Spiele ohne Uhrzeit zählen als Tagesende, Spiele ohne
+    Datum erhalten :data:`EPOCH_UNBEKANNT`. Nach dieser Spalte wird sortiert
+    und gefiltert.
+    """
+
+    datum = pd.to_datetime(df["Datum"].astype(str).str.strip(), format="%d.%m.%Y", errors="coerce")
+    has_date = datum.notna().to_numpy()
+    df["Datum_DT"] = datum
+
+    weekday = datum.dt.weekday.fillna(0).astype("int64").to_numpy()
+    df["Tag"] = np.where(has_date, WOCHENTAGE[weekday], "")
+
+    # Woche berechnen – robust auch bei fehlendem Datum
+    df["Woche_Start"] = datum.dt.to_period("W-SUN").dt.start_time
+    df["Woche_Ende"] = df["Woche_Start"] + pd.Timedelta(days=6)
+    df["Woche_Label"] = (
+        "Mo " + df["Woche_Start"].dt.strftime("%d.%m.%Y")
+        + " – So " + df["Woche_Ende"].dt.strftime("%d.%m.%Y")
+    ).fillna("").astype(object)
+
+    df["Uhrzeit"] = format_uhrzeit(df["Uhrzeit"])
+    zeit = pd.to_datetime(df["Uhrzeit"].where(df["Uhrzeit"] != "???"), format="%H:%M", errors="coerce")
+    sekunden = (zeit.dt.hour * 3600 + zeit.dt.minute * 60).fillna(24 * 3600 - 1)
+    anstoss = (datum + pd.to_timedelta(sekunden, unit="s")).dt.tz_localize(
+        "Europe/Berlin",
+        ambiguous=np.zeros(len(df), dtype=bool),
+        nonexistent="shift_forward",
+    )
+    epoch = (anstoss - pd.Timestamp("1970-01-01", tz="UTC")) // pd.Timedelta(seconds=1)
+    # Nicht über fillna: als float64 läuft EPOCH_UNBEKANNT beim Zurückwandeln nach int64 über
+    df["Anstoss_Epoch"] = np.where(epoch.notna(), epoch.fillna(0).astype("int64"), EPOCH_UNBEKANNT)
+    return df
+
+
+def sort_games(df: pd.DataFrame) -> pd.DataFrame:
+    """Sortiert stabil nach Anstoß, Spiele ohne Datum ans Ende."""
+
+    return df.sort_values(by="Anstoss_Epoch", kind="mergesort")
+
+
+def week_options(df: pd.DataFrame) -> list[tuple[pd.Timestamp, str]]:
+    """Alle Wochen (Start, Label) der Spiele in zeitlicher Reihenfolge."""
+
+    weeks = df.loc[df["Woche_Start"].notna(), ["Woche_Start", "Woche_Label"]]
+    weeks = weeks.drop_duplicates("Woche_Start").sort_values("Woche_Start")
+    return list(zip(weeks["Woche_Start"], weeks["Woche_Label"]))
+
+
+def finalize_games(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+    """Fügt die normalisierten Einzelquellen zum sortierten Gesamtdatensatz zusammen."""
+
+    if not dfs:
+        raise RuntimeError("❌ Keine gültigen CSV-Daten gefunden – Abbruch")
+
+    df_all = pd.concat(dfs, ignore_index=True)
+    df_all = add_calendar_columns(df_all)
+
+    for col in ["Heim", "Gast", "SR", "Gastgeber"]:
+        df_all[col] = (
+            df_all[col]
+            .fillna("")
+            .astype(str)
+            .str.replace(r'\b(USC-[U\d]+-\d) II\b', r'\1', regex=True)
+        )
+
+    return sort_games(df_all).reset_index(drop=True)
+
+
+def build_games(
+    csv_files: list[tuple[str, str | None]] | None = None,
+    csv_dir: Path = CSV_DIR,
+) -> pd.DataFrame:
+    """Liest alle konfigurierten Exporte ohne Cache und erzeugt den Gesamtdatensatz."""
+
+    if csv_files is None:
+        csv_files = get_csv_files()
+
+    dfs = []
+    for file, team_code in csv_files:
+        file_path = csv_dir / file
+        if not file_path.exists():
+            print(f"⚠️ CSV fehlt, übersprungen: {file_path}")
+            continue
+
+        df = normalize_source(read_csv_clean(file_path), file, team_code)
+        if df is not None:
+            dfs.append(df)
+
+    return finalize_games(dfs)
+
+
+def games_key(csv_files: list[tuple[str, str | None]], digests: dict[str, str | None]) -> str:
+    """Hash über Normalisierungscode, Konfiguration und Inhalte aller Eingangsdateien."""
+
+    digest = hashlib.sha256(_cache_version().encode())
+    for file, team_code in csv_files:
+        digest.update(f"{file};{team_code};{digests.get(file)}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _cache_version() -> str:
+    return f"v{STORE_VERSION};{NORMALIZE_CODE};pandas {pd.__version__}"
+
+
+def _read_frame(path: Path) -> pd.DataFrame | None:
+    """Liest eine Cache-Datei; abgeschnittene oder inkompatible Dateien werden gelöscht."""
+
+    try:
+        return pd.read_pickle(path)
+    except Exception as e:
+        # Pickle-Fehler sind vielfältig (EOFError, UnpicklingError, AttributeError, ...)
+        print(f"⚠️ Cache-Datei unlesbar, wird neu erzeugt: {path} ({type(e).__name__})")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _source_frame_path(store_dir: Path, key: str) -> Path:
+    safe_key = re.sub(r"[^\w.-]", "_", key)
+    return store_dir / "sources" / f"{safe_key}.pkl"
+
+
+def _load_source_frame(
+    manifest: SourceManifest,
+    key: str,
+    digest: str,
+    store_dir: Path,
+    build: Callable[[], pd.DataFrame | None],
+    **meta: Any,
+) -> tuple[pd.DataFrame | None, bool]:
+    """Liefert den normalisierten Frame einer Quelle; ``build`` läuft nur bei Änderungen."""
+
+    frame_path = _source_frame_path(store_dir, key)
+    if manifest.is_current(key, digest, **meta) and frame_path.exists():
+        df = _read_frame(frame_path)
+        if df is not None:
+            return df, False
+
+    df = build()
+    if df is None:
+        frame_path.unlink(missing_ok=True)
+        manifest.discard(key)
+        return None, True
+
+    frame_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(frame_path)
+    manifest.update(key, digest, **meta)
+    return df, True
+
+
+def load_games(
+    csv_dir: Path = CSV_DIR,
+    store_dir: Path = STORE_DIR,
+    config_path: Path = TEAM_SOURCES_PATH,
+) -> pd.DataFrame:
+    """Lädt ``df_all`` aus dem Cache und bereitet nur geänderte Quellen neu auf.
+
+    Ist der Gesamtdatensatz zum aktuellen Stand aller Eingangsdateien bereits
+    gespeichert, wird er direkt geladen. Andernfalls werden die Frames der
+    unveränderten Quellen aus ``.cache/sources/`` übernommen und nur geänderte
+    Exporte neu gelesen und normalisiert.
+    """
+
+    csv_files = get_csv_files(config_path)
+    digests = {file: file_hash(csv_dir / file) for file, _ in csv_files}
+    store_path = store_dir / f"games_{games_key(csv_files, digests)}.pkl"
+
+    if store_path.exists():
+        df_all = _read_frame(store_path)
+        if df_all is not None:
+            print(f"📦 Spieldaten aus Cache geladen: {store_path}")
+            return df_all
+
+    manifest = SourceManifest(store_dir / "manifest.json")
+    present = []
+    for file, team_code in csv_files:
+        if digests[file] is None:
+            print(f"⚠️ CSV fehlt, übersprungen: {csv_dir / file}")
+        else:
+            present.append((file, team_code))
+
+    def load(source: tuple[str, str | None]) -> tuple[pd.DataFrame | None, bool]:
+        file, team_code = source
+        file_path = csv_dir / file
+        return _load_source_frame(
+            manifest,
+            f"sams:{file}",
+            digests[file],
+            store_dir,
+            lambda: normalize_source(read_csv_clean(file_path), file, team_code),
+            team=team_code,
+            version=_cache_version(),
+        )
+
+    # Reihenfolge der Ergebnisse = Reihenfolge der Konfiguration (stabile Sortierung danach)
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+        results = list(executor.map(load, present))
+
+    dfs = []
+    rebuilt = []
+    for (file, _), (df, changed) in zip(present, results):
+        if changed:
+            rebuilt.append(file)
+        if df is not None:
+            dfs.append(df)
+
+    print(f"🔄 Neu aufbereitet: {len(rebuilt)} von {len(csv_files)} Quellen {rebuilt}")
+    df_all = finalize_games(dfs)
+    manifest.save()
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    for old_store in store_dir.glob("games_*.pkl"):
+        old_store.unlink()
+    tmp_path = store_path.with_suffix(".tmp")
+    df_all.to_pickle(tmp_path)
+    tmp_path.replace(store_path)
+    print(f"💾 Spieldaten normalisiert und gespeichert: {store_path} ({len(df_all)} Spiele)")
+    return df_all
+
+
+def normalize_external(df: pd.DataFrame, source: dict[str, Any]) -> pd.DataFrame:
+    """Bringt eine Heimspiel-CSV (Baskets/Preußen) auf die Spalten von ``df_all``."""
+
+    # Flexible Spalten-Übernahme (falls mal "Uhrzeit" statt "Startzeit" o.ä.)
+    col_map = {}
+    if "Startzeit" in df.columns and "Uhrzeit" not in df.columns:
+        col_map["Startzeit"] = "Uhrzeit"
+    if "Gegner" in df.columns and "Gast" not in df.columns:
+        col_map["Gegner"] = "Gast"
+    if col_map:
+        df = df.rename(columns=col_map)
+
+    # Pflichtfelder setzen/ergänzen
+    df["Heim"] = source["heim"]
+    df["Ort"] = source["ort"]
+    df["Spielrunde"] = source["spielrunde"]
+    df["SR"] = ""
+    df["Gastgeber"] = source["gastgeber"]
+    df["Ergebnis"] = ""  # wichtig für Filterlogik
+    df["USC_Team"] = source["team"]
+    if "Gast" not in df.columns:
+        df["Gast"] = ""
+
+    # Bereinigen
+    df["Datum"] = df["Datum"].astype(str).str.strip()
+    if "Uhrzeit" in df.columns:
+        df["Uhrzeit"] = df["Uhrzeit"].astype(str).str.strip()
+    else:
+        df["Uhrzeit"] = ""
+
+    # Datum, Wochentag, Woche und Anstoß ergänzen
+    df = add_calendar_columns(df)
+
+    return df[EXTERNAL_COLUMNS]
+
+
+def load_external_games(store_dir: Path = STORE_DIR) -> pd.DataFrame:
+    """Lädt die Heimspiele von Uni Baskets und Preußen; fehlende Dateien werden übersprungen."""
+
+    manifest = SourceManifest(store_dir / "manifest.json")
+    dfs = []
+    for source in EXTERNAL_SOURCES:
+        path = next((p for p in source["dateien"] if p.exists()), None)
+        if path is None:
+            # Falls Datei (noch) nicht existiert, ohne Fehler fortfahren
+            print(f"⚠️ Heimspiel-CSV fehlt, übersprungen: {source['team']}")
+            continue
+
+        df, _ = _load_source_frame(
+            manifest,
+            f"extern:{source['team']}",
+            file_hash(path),
+            store_dir,
+            lambda: normalize_external(read_csv_robust(path, sep=","), source),
+            path=path.as_posix(),
+            version=_cache_version(),
+        )
+        dfs.append(df)
+
+    manifest.save()
+    if not dfs:
+        return pd.DataFrame(columns=EXTERNAL_COLUMNS)
+    return pd.concat(dfs, ignore_index=True)
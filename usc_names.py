@@ -0,0 +1,64 @@
+"""Kürzt die USC-Mannschaftsnamen auf die Teamcodes (``USC Münster II`` → ``USC2``).
+
+Die Ersetzungen stehen in einer Tabelle und werden zu einem einzigen regulären
+Ausdruck zusammengefasst (längste Schreibweise zuerst). Für Jugendteams wird
+der Code zusätzlich umgeschrieben (``USC1`` → ``USC-U18``); dafür gibt es pro
+Team einen eigenen, ebenfalls vorkompilierten Ausdruck.
+"""
+from __future__ import annotations
+
+import re
+
+USC_NAME_TABLE = [
+    ("USC Münster VIII", "USC8"),
+    ("USC Münster VII", "USC7"),
+    ("USC Münster VI",  "USC6"),
+    ("USC Münster V",   "USC5"),
+    ("USC Münster IV",  "USC4"),
+    ("USC Münster III", "USC3"),
+    ("USC Münster II",  "USC2"),
+    ("USC Münster",     "USC1"),
+]
+
+# Jugendteams: (alter Code, neuer Code) je USC_Team
+USC_TEAM_REMAP = {
+    "USC-U14-1": ("USC1", "USC-U14-1"),
+    "USC-U14-2": ("USC2", "USC-U14-2"),
+    "USC-U16-1": ("USC1", "USC-U16-1"),
+    "USC-U16-2": ("USC2", "USC-U16-2"),
+    "USC-U18":   ("USC1", "USC-U18"),
+    "USC-U13":   ("USC1", "USC-U13"),
+}
+
+
+def compile_replacements(mapping: dict[str, str]) -> tuple[re.Pattern[str], dict[str, str]]:
+    """Fasst ``mapping`` zu einer Alternation zusammen, längste Schreibweise zuerst."""
+
+    keys = sorted(mapping, key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in keys)), mapping
+
+
+def _team_mapping(team: str) -> dict[str, str]:
+    old, new = USC_TEAM_REMAP[team]
+    mapping = {name: code.replace(old, new) for name, code in USC_NAME_TABLE}
+    # Bereits gekürzte Codes im Text werden ebenfalls umgeschrieben
+    mapping.setdefault(old, new)
+    return mapping
+
+
+_GLOBAL = compile_replacements(dict(USC_NAME_TABLE))
+_PER_TEAM = {team: compile_replacements(_team_mapping(team)) for team in USC_TEAM_REMAP}
+
+
+def team_replacements(team) -> tuple[re.Pattern[str], dict[str, str]]:
+    """Ausdruck und Ersetzungstabelle für ``team`` (ohne Jugend-Umschreibung: global)."""
+
+    return _PER_TEAM.get(team, _GLOBAL) if isinstance(team, str) else _GLOBAL
+
+
+def replace_usc_names(s, team) -> str:
+    """Ersetzt alle USC-Schreibweisen in ``s`` in einem Durchgang."""
+
+    pattern, mapping = team_replacements(team)
+    return pattern.sub(lambda m: mapping[m.group(0)], str(s))
+
@@ -0,0 +1,127 @@
+"""Regeln der Spielplan-Aufbereitung, die ohne pandas auskommen.
+
+Spaltennamen der SAMS-Exporte, die Erkennung von USC-Spielen, die Zuordnung
+zu Teamcodes und die Quellen der externen Heimspiele. ``usc_games.py``
+(pandas) und ``spielplan_lite.py`` (nur Standardbibliothek) bereiten die
+Exporte nach genau diesen Regeln auf.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+USC_SEARCH_FIELDS = [
+    "Heim",
+    "Gast",
+    "SR",
+    "Gastgeber",
+    "Mannschaft 1: Verein",
+    "Mannschaft 2: Verein",
+    "Schiedsgericht: Verein",
+    "Gastgeber: Verein",
+]
+
+USC_PATTERN = r"usc munster|usc muenster"
+
+NAME_COLUMNS = ["Heim", "Gast", "SR", "Gastgeber", "Ort", "Spielrunde"]
+
+RENAME_MAP = {
+    # Kombi-Datum
+    "Datum und Uhrzeit": "Datum_Uhrzeit",
+
+    # Alternative Namen (falls andere Exporte kommen)
+    "Datum": "Datum",
+    "Uhrzeit": "Uhrzeit",
+    "Spieltag": "Datum",
+    "Uhrzeit Beginn": "Uhrzeit",
+    "Beginn": "Uhrzeit",
+
+    # Teams
+    "Mannschaft 1": "Heim",
+    "Mannschaft 2": "Gast",
+
+    # Offizielle/Orga
+    "Schiedsgericht": "SR",
+    "Gastgeber": "Gastgeber",
+
+    # Orte/Liga
+    "Austragungsort": "Ort",
+    "Spielrunde": "Spielrunde",
+
+    "Ergebnis": "Ergebnis",
+}
+
+SATZSPALTEN = [
+    ("Satz 1 - Ballpunkte 1", "Satz 1 - Ballpunkte 2"),
+    ("Satz 2 - Ballpunkte 1", "Satz 2 - Ballpunkte 2"),
+    ("Satz 3 - Ballpunkte 1", "Satz 3 - Ballpunkte 2"),
+    ("Satz 4 - Ballpunkte 1", "Satz 4 - Ballpunkte 2"),
+    ("Satz 5 - Ballpunkte 1", "Satz 5 - Ballpunkte 2"),
+]
+
+# Heimspiele weiterer Münsteraner Vereine (aus den ICS-Feeds extrahiert)
+EXTERNAL_SOURCES = [
+    {
+        "team": "Baskets",
+        "dateien": [Path("csv_Baskets/Baskets_2526_Heimspiele.csv")],
+        "heim": "Uni Baskets Münster",
+        "gastgeber": "Baskets",
+        "spielrunde": "Basketball Pro A",
+        "ort": "Sporthalle Berg Fidel (48153 Münster)",
+    },
+    {
+        "team": "Preußen Münster",
+        # Primär im Ordner "csv_Basktes", Fallback "csv_Baskets"
+        "dateien": [
+            Path("csv_Basktes/Preussen_2526_Heimspiele.csv"),
+            Path("csv_Baskets/Preussen_2526_Heimspiele.csv"),
+        ],
+        "heim": "Preußen Münster",
+        "gastgeber": "Preußen Münster",
+        "spielrunde": "Fußball 2. BL",
+        "ort": "Sporthalle Berg Fidel (48153 Münster)",
+    },
+]
+
+WOCHENTAGE = ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+
+# Interne Hilfsspalten (HTML-Filter, Sortierung); nicht Teil der veröffentlichten CSV
+HELPER_COLUMNS = ("Woche_Start", "Woche_Ende", "Woche_Label", "Anstoss_Epoch")
+
+# Anstoss_Epoch für Spiele ohne Datum (sortiert ans Ende, größter int64-Wert)
+EPOCH_UNBEKANNT = 2**63 - 1
+
+
+@lru_cache(maxsize=None)
+def _normalize_text(text: str) -> str:
+    text = text.lower().replace("�", "u")
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def normalize_search_text(value) -> str:
+    return _normalize_text(str(value or ""))
+
+
+def get_usc_team(row, file: str, team_code: str | None) -> str | None:
+    """Ermittelt den USC-Teamcode einer Zeile (Ligen mit zwei USC-Teams über die Namen)."""
+
+    text = f"{row.get('Heim', '')} {row.get('Gast', '')} {row.get('SR', '')} {row.get('Gastgeber', '')}".lower()
+    teams = []
+    if file == "Spielplan_Bezirksklasse_26_Frauen.csv":
+        if re.search(r"\busc münster vi\b", text):
+            teams.append("USC6")
+        if re.search(r"\busc münster v\b", text):
+            teams.append("USC5")
+        return "/".join(teams)
+
+    if file == "Spielplan_Kreisliga_Muenster_Frauen.csv":
+        if re.search(r"\busc münster viii\b", text):
+            teams.append("USC8")
+        if re.search(r"\busc münster vii\b", text):
+            teams.append("USC7")
+        return "/".join(teams)
+
+    return team_code
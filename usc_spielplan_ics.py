@@ -1,255 +1,304 @@
+"""ICS-Kalender: alle USC-Heimspiele sowie einzelne Feeds je Team, Halle und SR-Dienst.
+
+``docs/usc_spielplan.ics`` enthält alle Spiele, bei denen USC Gastgeber ist.
+Unter ``docs/ics/`` entstehen zusätzlich kleine Feeds je ``USC_Team``
+(``team-USC1.ics``), je Halle in Münster (``ort-<name>.ics``) und – falls
+``WRITE_SR_FEEDS`` gesetzt ist – je Team mit Schiedsgerichtsdienst
+(``sr-USC4.ics``). Alle Feeds entstehen aus einem einzigen Durchlauf über den
+Datensatz; ``docs/ics/index.json`` listet sie auf.
+
+Die Dateien folgen RFC 5545: Zeilenenden CRLF, Zeilen über 75 Oktetten
+werden gefaltet. Jede Datei ist stabil: Die UID eines Termins folgt aus
+Saison, Spielrunde und SAMS-Spielnummer (``#``) und bleibt bei Umbenennungen
+von Teams gleich.
+``DTSTAMP`` und ``SEQUENCE`` werden aus der zuletzt veröffentlichten Datei
+übernommen und nur weitergezählt, wenn sich der Inhalt eines Termins ändert.
+Ändert sich nichts, bleibt die Datei byteweise gleich und wird nicht neu
+geschrieben.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
 from pathlib import Path
-from datetime import datetime, timedelta
-import pandas as pd
-from pytz import timezone
-import re
+from typing import Iterable, Mapping
+from zoneinfo import ZoneInfo
 
-from team_config import get_csv_files
+from ics_parser import IcsEvent, localize, read_events
+from spielplan_shards import slugify
 
-# =========================
-# Konfiguration
-# =========================
+ICS_PATH = Path("docs/usc_spielplan.ics")
+FEED_DIR = Path("docs/ics")
+WRITE_SR_FEEDS = True
+UID_DOMAIN = "usc-muenster-spielplan"
+# Anstoß für Spiele ohne (lesbare) Uhrzeit
+DEFAULT_TIME = "12:00"
+# Höchstlänge einer Zeile in Oktetten (RFC 5545, Abschnitt 3.1), ohne CRLF
+FOLD_OCTETS = 75
+# Eigenschaften, deren Änderung DTSTAMP und SEQUENCE weiterschaltet
+CONTENT_PROPERTIES = ("DTSTART", "DTEND", "SUMMARY", "LOCATION", "DESCRIPTION")
 
-csv_dir = Path("csvdata")
+_ICS_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
 
-csv_files = get_csv_files()
 
-usc_keywords = ["USC Münster", "USC Muenster", "USC MÜNSTER"]
+def escape_ics_text(value: str) -> str:
+    """TEXT-Wert nach RFC 5545 escapen (Gegenstück zu ``ics_parser.unescape_text``)."""
 
-# =========================
-# CSV lesen
-# =========================
+    return value.replace("\r\n", "\n").translate(_ICS_ESCAPES)
 
-def read_csv_clean(path: Path) -> pd.DataFrame:
-    last_error = None
 
-    for encoding in ("utf-8-sig", "cp1252", "latin1"):
-        try:
-            df = pd.read_csv(
-                path,
-                sep=";",
-                encoding=encoding,
-                encoding_errors="replace",
-                engine="python",
-                on_bad_lines="skip"
-            )
-            break
-        except UnicodeDecodeError as exc:
-            last_error = exc
-    else:
-        raise last_error
-
-    df.columns = (
-        df.columns.astype(str)
-        .str.replace("\ufeff", "", regex=False)
-        .str.strip()
-    )
-
-    df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
-    df = df.dropna(axis=1, how="all")
-
-    return df
-
-
-# =========================
-# USC prüfen
-# =========================
-
-def contains_usc(row):
-    return any(
-        usc.lower() in str(row[f]).lower()
-        for f in ["Heim", "Gast", "SR", "Gastgeber"]
-        for usc in usc_keywords
-    )
-
-
-# =========================
-# USC Namen kürzen
-# =========================
-
-def replace_usc_names(s, team):
-    s = str(s)
-
-    replacements = [
-        ("USC Münster VIII", "USC8"),
-        ("USC Münster VII", "USC7"),
-        ("USC Münster VI", "USC6"),
-        ("USC Münster V", "USC5"),
-        ("USC Münster IV", "USC4"),
-        ("USC Münster III", "USC3"),
-        ("USC Münster II", "USC2"),
-        ("USC Münster", "USC1"),
-    ]
-
-    for old, new in replacements:
-        s = s.replace(old, new)
-
-    return s
-
-
-# =========================
-# CSVs einlesen
-# =========================
-
-rename_map = {
-    "Datum": "Datum",
-    "Uhrzeit": "Uhrzeit",
-    "Mannschaft 1": "Heim",
-    "Mannschaft 2": "Gast",
-    "Schiedsgericht": "SR",
-    "Gastgeber": "Gastgeber",
-    "Austragungsort": "Ort",
-    "Spielrunde": "Spielrunde",
-}
-
-dfs = []
-
-for file, team_code in csv_files:
+def _missing(value) -> bool:
+    """None, NaN oder NaT (NaN ist als einziger Wert ungleich sich selbst)."""
 
-    file_path = csv_dir / file
+    return value is None or value != value
 
-    if not file_path.exists():
-        continue
 
-    df = read_csv_clean(file_path)
+def event_uid(row) -> str:
+    """Stabile UID aus Saison, Spielrunde und Spielnummer.
 
-    df = df.rename(columns=rename_map)
+    Die Spielnummer ist nur innerhalb einer Spielrunde eindeutig. Fehlt sie,
+    wird wie früher auf Anstoß und Teamnamen ausgewichen.
+    """
 
-    # Datum + Uhrzeit aus "Datum und Uhrzeit"
-    if "Datum und Uhrzeit" in df.columns:
+    nr = row.get("#")
+    if _missing(nr) or str(nr).strip() == "":
+        print(f"⚠️ Spiel ohne Nummer: {row['Heim']} vs {row['Gast']} – UID aus Teamnamen")
+        return f"{row['Datum']}-{slugify(str(row['Heim']))}-vs-{slugify(str(row['Gast']))}@{UID_DOMAIN}"
+    return f"{slugify(str(row.get('Saison', '')))}-{slugify(str(row['Spielrunde']))}-{nr}@{UID_DOMAIN}"
 
-        dt = pd.to_datetime(
-            df["Datum und Uhrzeit"]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.strip(),
-            format="%d.%m.%Y %H:%M:%S",
-            errors="coerce",
-        )
 
-        df["Datum"] = dt.dt.strftime("%d.%m.%Y")
-        df["Uhrzeit"] = dt.dt.strftime("%H:%M")
+def _team_codes(value) -> list[str]:
+    text = "" if _missing(value) else str(value)
+    return [code for code in text.split("/") if code.startswith("USC")]
 
-    # Datum als datetime
-    df["Datum_DT"] = pd.to_datetime(
-        df["Datum"],
-        format="%d.%m.%Y",
-        errors="coerce"
-    )
 
-    df = df[df.apply(contains_usc, axis=1)]
+def build_events(rows: Iterable[Mapping]) -> list[dict]:
+    """Termine als (unescapte) Eigenschaften in der Reihenfolge von ``rows``.
 
-    df["USC_Team"] = team_code
+    ``rows`` sind Zeilen des Gesamtdatensatzes mit dessen Spaltennamen, z. B.
+    ``df_all.to_dict("records")`` oder die Spielobjekte aus ``spielplan_lite.py``.
 
-    for col in ["Heim", "Gast", "SR", "Gastgeber", "Ort", "Spielrunde"]:
-        if col in df.columns:
-            df[col] = df.apply(
-                lambda r: replace_usc_names(r[col], r["USC_Team"]),
-                axis=1
-            )
+    ``meta`` enthält die Schlüssel für die Aufteilung auf die Feeds
+    (Gastgeber, USC-Teams, Ort, Teams mit SR-Dienst).
+    """
 
-    dfs.append(df)
+    berlin = ZoneInfo("Europe/Berlin")
 
-if not dfs:
-    print("⚠️ Keine USC Spiele gefunden")
-    exit()
+    events = []
+    for row in rows:
 
-df_all = pd.concat(dfs, ignore_index=True)
-
-# =========================
-# Sortieren (stabil)
-# =========================
-
-df_all["_sort_dt"] = df_all["Datum_DT"].fillna(pd.Timestamp.max)
-
-df_all = (
-    df_all
-    .sort_values(by=["_sort_dt", "Uhrzeit"], kind="mergesort")
-    .drop(columns="_sort_dt")
-)
-
-# =========================
-# Heimspiele filtern
-# =========================
-
-def is_hosting(row):
-    return str(row["Gastgeber"]).startswith("USC")
-
-df_all = df_all[df_all.apply(is_hosting, axis=1)]
-
-# =========================
-# ICS erzeugen
-# =========================
-
-def generate_ics(df, output="docs/usc_spielplan.ics"):
-
-    berlin = timezone("Europe/Berlin")
-    utc = timezone("UTC")
-
-    Path("docs").mkdir(exist_ok=True)
-
-    with open(output, "w", encoding="utf-8") as f:
-
-        f.write("BEGIN:VCALENDAR\n")
-        f.write("VERSION:2.0\n")
-        f.write("PRODID:-//USC Münster//Spielplan//DE\n")
-
-        for _, row in df.iterrows():
-
-            if pd.isna(row["Datum_DT"]):
-                continue
+        if _missing(row["Datum_DT"]):
+            continue
 
+        time_part = "" if _missing(row["Uhrzeit"]) else str(row["Uhrzeit"]).strip()
+        try:
+            dt = datetime.strptime(f"{row['Datum']} {time_part or DEFAULT_TIME}", "%d.%m.%Y %H:%M")
+        except ValueError:
+            # Platzhalter wie "???": Termin behalten, Anstoß wie bei fehlender Uhrzeit
             try:
-                time_part = row["Uhrzeit"] if row["Uhrzeit"] else "12:00"
-                dt = datetime.strptime(
-                    f"{row['Datum']} {time_part}",
-                    "%d.%m.%Y %H:%M"
-                )
-            except Exception:
+                dt = datetime.strptime(f"{row['Datum']} {DEFAULT_TIME}", "%d.%m.%Y %H:%M")
+            except ValueError:
+                print(f"⚠️ Ungültiges Datum {row['Datum']!r}: {row['Heim']} vs {row['Gast']} – kein Termin")
                 continue
+            print(f"⚠️ Uhrzeit {time_part!r} unbekannt: {row['Heim']} vs {row['Gast']} – {DEFAULT_TIME} angenommen")
+
+        # In UTC rechnen: zwei echte Stunden, auch über eine Zeitumstellung hinweg
+        start = localize(dt, berlin).astimezone(dt_timezone.utc)
+        end = start + timedelta(hours=2)
+
+        events.append({
+            "UID": event_uid(row),
+            "DTSTART": start.strftime("%Y%m%dT%H%M%SZ"),
+            "DTEND": end.strftime("%Y%m%dT%H%M%SZ"),
+            "SUMMARY": f"{row['Heim']} vs {row['Gast']}",
+            "LOCATION": str(row["Ort"]).replace(chr(10), " "),
+            "DESCRIPTION": f"Spielrunde: {row['Spielrunde']}\nGastgeber: {row['Gastgeber']}",
+            "meta": {
+                "gastgeber": str(row["Gastgeber"]),
+                "teams": _team_codes(row.get("USC_Team")),
+                "ort": str(row["Ort"]).replace(chr(10), " "),
+                "sr": _team_codes(row.get("SR")),
+            },
+        })
+    return events
+
+
+def previous_events(path: Path) -> dict[str, IcsEvent]:
+    """Termine der zuletzt veröffentlichten Datei nach UID."""
+
+    if not path.exists():
+        return {}
+    return {event.uid: event for event in read_events(path) if event.uid}
+
+
+def stamp_events(events: list[dict[str, str]], previous: dict[str, IcsEvent], now: datetime) -> dict[str, int]:
+    """Setzt ``DTSTAMP`` und ``SEQUENCE``; gibt die Anzahl neuer/geänderter/gleicher Termine zurück."""
+
+    stamp = now.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    counts = {"neu": 0, "geändert": 0, "unverändert": 0}
+    for event in events:
+        old = previous.get(event["UID"])
+        if old is None:
+            event["DTSTAMP"], event["SEQUENCE"] = stamp, "0"
+            counts["neu"] += 1
+            continue
+
+        try:
+            sequence = int(old.properties.get("SEQUENCE", "0"))
+        except ValueError:
+            sequence = 0
+        same = all(old.properties.get(key, "") == event[key] for key in CONTENT_PROPERTIES)
+        if same and "DTSTAMP" in old.properties:
+            event["DTSTAMP"], event["SEQUENCE"] = old.properties["DTSTAMP"], str(sequence)
+            counts["unverändert"] += 1
+        else:
+            event["DTSTAMP"], event["SEQUENCE"] = stamp, str(sequence + 1)
+            counts["geändert"] += 1
+    return counts
+
+
+def sr_event(event: dict) -> dict:
+    """Schiedsgerichtsdienst als eigener Termin (eigene UID, erkennbarer Titel)."""
+
+    return {**event, "UID": f"sr-{event['UID']}", "SUMMARY": f"Schiedsgericht: {event['SUMMARY']}"}
+
+
+def group_feeds(events: list[dict], sr_feeds: bool = WRITE_SR_FEEDS) -> dict[str, tuple[str, list[dict]]]:
+    """Verteilt die Termine auf die Feeds: Dateiname → (Kalendername, Termine)."""
+
+    feeds: dict[str, tuple[str, list[dict]]] = {}
+
+    def add(filename: str, name: str, event: dict) -> None:
+        feeds.setdefault(filename, (name, []))[1].append(event)
+
+    for event in events:
+        meta = event["meta"]
+        for team in meta["teams"]:
+            add(f"team-{team}.ics", f"USC Münster – {team}", event)
+        if "münster" in meta["ort"].lower():
+            add(f"ort-{slugify(meta['ort'])}.ics", f"USC Münster – {meta['ort']}", event)
+        if sr_feeds:
+            for team in meta["sr"]:
+                add(f"sr-{team}.ics", f"USC Münster – Schiedsgericht {team}", sr_event(event))
+    return dict(sorted(feeds.items()))
+
+
+def fold_line(line: str, limit: int = FOLD_OCTETS) -> list[str]:
+    """Faltet eine Zeile bei ``limit`` Oktetten, ohne UTF-8-Zeichen zu trennen.
+
+    Folgezeilen beginnen mit einem Leerzeichen (zählt mit); ``ics_parser``
+    fügt sie beim Lesen wieder zusammen.
+    """
+
+    if len(line.encode("utf-8")) <= limit:
+        return [line]
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            parts.append(current)
+            current, size = " ", 1
+        current += char
+        size += width
+    return parts + [current]
+
+
+def render_ics(events: list[dict[str, str]], name: str | None = None) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//USC Münster//Spielplan//DE",
+    ]
+    if name:
+        lines.append(f"X-WR-CALNAME:{escape_ics_text(name)}")
+    for event in events:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{event['UID']}",
+            f"DTSTAMP:{event['DTSTAMP']}",
+            f"SEQUENCE:{event['SEQUENCE']}",
+            f"DTSTART:{event['DTSTART']}",
+            f"DTEND:{event['DTEND']}",
+            f"SUMMARY:{escape_ics_text(event['SUMMARY'])}",
+            f"LOCATION:{escape_ics_text(event['LOCATION'])}",
+            f"DESCRIPTION:{escape_ics_text(event['DESCRIPTION'])}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(part + "\r\n" for line in lines for part in fold_line(line))
+
+
+def write_calendar(events: list[dict], output: Path, name: str | None = None) -> tuple[bool, dict[str, int]]:
+    """Schreibt einen Kalender, sofern er sich geändert hat.
+
+    Gibt ``(geschrieben, Zähler)`` zurück; die Termine in ``events`` bleiben
+    unverändert, da ein Termin in mehreren Feeds verschiedene Stempel haben kann.
+    """
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    events = [dict(event) for event in events]
+    counts = stamp_events(events, previous_events(output), datetime.now(dt_timezone.utc))
+    text = render_ics(events, name)
+
+    # Bytes statt Text: CRLF darf beim Lesen und Schreiben nicht übersetzt werden
+    data = text.encode("utf-8")
+    if output.exists() and output.read_bytes() == data:
+        return False, counts
+    output.write_bytes(data)
+    return True, counts
+
+
+def generate_ics(events: list[dict], output: Path = ICS_PATH) -> None:
+
+    written, counts = write_calendar(events, output)
+    summary = ", ".join(f"{n} {label}" for label, n in counts.items())
+    if written:
+        print(f"✅ ICS-Datei erfolgreich erstellt: {output} ({summary})")
+    else:
+        print(f"✔️ ICS-Datei unverändert: {output} ({summary})")
 
-            start = berlin.localize(dt)
-            end = start + timedelta(hours=2)
 
-            f.write("BEGIN:VEVENT\n")
+def write_feeds(events: list[dict], feed_dir: Path = FEED_DIR, sr_feeds: bool = WRITE_SR_FEEDS) -> None:
+    """Schreibt alle Einzel-Feeds samt ``index.json`` und entfernt veraltete Feeds."""
 
-            f.write(
-                f"UID:{start.strftime('%Y%m%dT%H%M')}-{row['Heim']}-vs-{row['Gast']}@usc\n"
-            )
+    feeds = group_feeds(events, sr_feeds)
+    feed_dir.mkdir(parents=True, exist_ok=True)
 
-            f.write(
-                f"DTSTAMP:{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}\n"
-            )
+    written = 0
+    index = []
+    for filename, (name, feed_events) in feeds.items():
+        changed, _ = write_calendar(feed_events, feed_dir / filename, name)
+        written += changed
+        index.append({"datei": filename, "name": name, "termine": len(feed_events)})
 
-            f.write(
-                f"DTSTART:{start.astimezone(utc).strftime('%Y%m%dT%H%M%SZ')}\n"
-            )
+    for stale in feed_dir.glob("*.ics"):
+        if stale.name not in feeds:
+            stale.unlink()
+            print(f"🗑️ Veralteter Feed entfernt: {stale}")
 
-            f.write(
-                f"DTEND:{end.astimezone(utc).strftime('%Y%m%dT%H%M%SZ')}\n"
-            )
+    index_path = feed_dir / "index.json"
+    index_text = json.dumps({"feeds": index}, ensure_ascii=False, indent=1) + "\n"
+    if not index_path.exists() or index_path.read_text(encoding="utf-8") != index_text:
+        index_path.write_text(index_text, encoding="utf-8")
 
-            f.write(f"SUMMARY:{row['Heim']} vs {row['Gast']}\n")
+    print(f"✅ {len(feeds)} Einzel-Feeds in {feed_dir} ({written} geändert)")
 
-            f.write(
-                f"LOCATION:{str(row['Ort']).replace(chr(10),' ')}\n"
-            )
 
-            f.write(
-                "DESCRIPTION:"
-                f"Spielrunde: {row['Spielrunde']}\\n"
-                f"Gastgeber: {row['Gastgeber']}\n"
-            )
+def write_calendars(rows: Iterable[Mapping]) -> None:
+    """Gesamtkalender (Heimspiele) und alle Einzel-Feeds aus einem Durchlauf."""
 
-            f.write("END:VEVENT\n")
+    events = build_events(rows)
+    generate_ics([e for e in events if e["meta"]["gastgeber"].startswith("USC")])
+    write_feeds(events)
 
-        f.write("END:VCALENDAR\n")
 
-    print(f"✅ ICS-Datei erfolgreich erstellt: {output}")
+def main() -> None:
+    # pandas nur für diesen Aufruf; die Kalenderfunktionen selbst kommen ohne aus
+    from usc_games import load_games
 
+    write_calendars(load_games().to_dict("records"))
 
-# =========================
-# Start
-# =========================
 
-generate_ics(df_all)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
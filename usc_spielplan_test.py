@@ -2,13 +2,13 @@ from pathlib import Path
 from datetime import datetime
 import pandas as pd
 import html
-from pytz import timezone
+from zoneinfo import ZoneInfo
 import re
 
 from team_config import get_csv_files
 
 # Aktuelle MESZ-Zeit für Anzeige im HTML
-mesz_time = datetime.now(timezone("Europe/Berlin")).strftime("%d.%m.%Y %H:%M")
+mesz_time = datetime.now(ZoneInfo("Europe/Berlin")).strftime("%d.%m.%Y %H:%M")
 stand_info = f'<p class="text-muted mt-3">Stand: {mesz_time} MESZ</p>'
 reload_button = """
 <div class="text-center mt-5 mb-3">
@@ -4,7 +4,10 @@ from __future__ import annotations
 from html import escape
 from typing import Iterable
 
+from html_table import escaped_cells, raw_cells, render_rows
+
 BASE_URL = "https://ergebnisdienst.volleyball.nrw/"
+NO_LINK_HTML = '<span class="text-muted">Kein Link hinterlegt</span>'
 
 
 def _nrw(path: str) -> str:
@@ -111,33 +114,33 @@ def build_team_table_overview(team_codes: Iterable[str]) -> str:
     if not unique_codes:
         unique_codes = sorted(USC_TEAM_TABLE_INFO.keys(), key=lambda code: USC_TEAM_TABLE_INFO.get(code, {}).get("order", 999))
 
-    rows = []
+    names, leagues, links = [], [], []
     for code in unique_codes:
         info = USC_TEAM_TABLE_INFO.get(code)
         if info is None:
-            link_html = '<span class="text-muted">Kein Link hinterlegt</span>'
-            rows.append(f"<tr><td>{escape(code)}</td><td>-</td><td>{link_html}</td></tr>")
+            names.append(code)
+            leagues.append("-")
+            links.append(NO_LINK_HTML)
             continue
 
-        team_name = info.get("name", code)
-        league = info.get("league", "")
         url = info.get("url")
         if not url:
             path = info.get("path")
             if path:
                 url = _nrw(path)
 
+        names.append(info.get("name", code))
+        leagues.append(info.get("league", ""))
         if url:
-            link_html = (
+            links.append(
                 f'<a href="{escape(url)}" class="link-dark" target="_blank" rel="noopener">'
                 "Tabelle öffnen"
                 "</a>"
             )
         else:
-            link_html = '<span class="text-muted">Kein Link hinterlegt</span>'
-        rows.append(f"<tr><td>{escape(team_name)}</td><td>{escape(league)}</td><td>{link_html}</td></tr>")
+            links.append(NO_LINK_HTML)
 
-    rows_html = "".join(rows)
+    rows_html = "".join(render_rows([escaped_cells(names), escaped_cells(leagues), raw_cells(links)]))
 
     return (
         "<div class=\"accordion mb-3\" id=\"teamTables\">\n"